@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+📚 BATCH QUEUE - Mehrere Excel-Arbeitsmappen in einer Browser-Session
+Alle Zeilen aller Arbeitsmappen laufen durch eine gemeinsame Warteschlange.
+Browser und angemeldete Session werden über Zeilen- und Dateigrenzen hinweg
+weiterverwendet - Start, ChromeDriver-Auflösung und Login fallen nur einmal
+an. Am Ende gibt es eine Zusammenfassung pro Arbeitsmappe.
+
+Aufruf: python interzero_automation.py --batch <ordner|datei.xlsx[=dokument.pdf]> [...]
+
+PDF-Zuordnung: explizit per datei.xlsx=dokument.pdf, sonst eine gleichnamige
+PDF neben der Arbeitsmappe (kunden.xlsx → kunden.pdf). Diese PDF ist die
+Vorgabe für Zeilen ohne eigenes Dokument (siehe pdf_index.py).
+"""
+import os
+import sys
+from collections import deque
+
+from browser_metrics import reset_cdp_metrics
+
+EXCEL_EXTENSIONS = ('.xlsx', '.xls')
+
+
+def batch_arguments(argv=None):
+    """Pfade nach --batch (bis zum nächsten --Flag); None wenn kein Batch-Modus"""
+    argv = sys.argv[1:] if argv is None else argv
+    if '--batch' not in argv:
+        return None
+    paths = []
+    for argument in argv[argv.index('--batch') + 1:]:
+        if argument.startswith('--'):
+            break
+        paths.append(argument)
+    return paths
+
+
+class Workbook:
+    def __init__(self, excel_file, pdf_file=None):
+        self.excel_file = excel_file
+        self.pdf_file = pdf_file
+        self.rows = 0
+        self.successful = 0
+        self.failed = 0
+        self.reexecuted_pages = 0
+        self.seconds = 0.0
+        self.error = None  # Grund, falls die Arbeitsmappe nicht eingeplant wurde
+        self.missing_documents = []  # (Zeile, Firma, Problem) vor dem Lauf erkannt
+
+    @property
+    def name(self):
+        return os.path.basename(self.excel_file)
+
+    def record(self, success, seconds, reexecuted_pages=0):
+        if success:
+            self.successful += 1
+            self.reexecuted_pages += reexecuted_pages
+        else:
+            self.failed += 1
+        self.seconds += seconds
+
+
+def matching_pdf(excel_file):
+    """Gleichnamige PDF neben der Arbeitsmappe (None wenn keine vorhanden)"""
+    stem = os.path.splitext(excel_file)[0]
+    for extension in ('.pdf', '.PDF'):
+        if os.path.isfile(stem + extension):
+            return stem + extension
+    return None
+
+
+def discover_workbooks(paths):
+    """Arbeitsmappen aus Ordnern/Dateien; Excel-Sperrdateien (~$...) werden übersprungen"""
+    workbooks = []
+    for path in paths:
+        excel_path, _, pdf_file = path.partition('=')
+        if os.path.isdir(excel_path):
+            for name in sorted(os.listdir(excel_path)):
+                if name.lower().endswith(EXCEL_EXTENSIONS) and not name.startswith('~$'):
+                    excel_file = os.path.join(excel_path, name)
+                    workbooks.append(Workbook(excel_file, matching_pdf(excel_file)))
+        elif os.path.isfile(excel_path):
+            workbooks.append(Workbook(excel_path, pdf_file or matching_pdf(excel_path)))
+        else:
+            print(f"⚠️ Nicht gefunden: {excel_path}")
+    return workbooks
+
+
+def build_queue(workbooks, load_rows, resolve_pdf=None):
+    """
+    Eine Warteschlange (Arbeitsmappe, Zeilenindex, Zeile, PDF) über alle Arbeitsmappen.
+
+    load_rows(excel_file) liefert die bereinigten Zeilen als DataFrame und wirft
+    bei ungültigen Dateien - die Arbeitsmappe wird dann mit Fehler markiert.
+    resolve_pdf(workbook, record) liefert (Pfad, Problem) für das Dokument der
+    Zeile; ohne Resolver gilt die PDF der Arbeitsmappe.
+    """
+    queue = deque()
+    for workbook in workbooks:
+        try:
+            rows = load_rows(workbook.excel_file)
+        except Exception as e:
+            workbook.error = str(e)
+            print(f"❌ {workbook.name} übersprungen: {e}")
+            continue
+        workbook.rows = len(rows)
+        for row_index, row_data in rows.iterrows():
+            pdf_file = workbook.pdf_file
+            if resolve_pdf is not None:
+                pdf_file, problem = resolve_pdf(workbook, row_data)
+                if problem:
+                    workbook.missing_documents.append((row_index + 1, row_data.get('Company Name', 'Unbekannt'), problem))
+                    pdf_file = None
+            queue.append((workbook, row_index, row_data, pdf_file))
+    return queue
+
+
+class BrowserSession:
+    """Ein Browser für den ganzen Lauf - wird nur bei Absturz neu gestartet"""
+
+    def __init__(self, factory):
+        self.factory = factory
+        self.driver = None
+        self.started = 0
+        self.reused = 0
+
+    def acquire(self):
+        if self.driver is None:
+            print("🤖 Starte Browser...")
+            self.driver = self.factory()
+            self.started += 1
+        else:
+            print("♻️ Verwende bestehende Browser-Session weiter")
+            self.reused += 1
+        return self.driver
+
+    def is_alive(self):
+        try:
+            self.driver.current_url
+            return True
+        except Exception:
+            return False
+
+    def release(self):
+        """Nach einer Zeile: abgestürzte/geschlossene Browser verwerfen"""
+        if self.driver is not None and not self.is_alive():
+            print("⚠️ Browser-Session nicht mehr erreichbar - wird neu gestartet")
+            self.close()
+
+    def close(self):
+        if self.driver is not None:
+            reset_cdp_metrics(self.driver)
+            try:
+                self.driver.quit()
+            except Exception as e:
+                print(f"⚠️ Browser konnte nicht beendet werden: {e}")
+            self.driver = None
+
+
+def print_workbook_summary(workbooks, session=None):
+    print("\n📚 ZUSAMMENFASSUNG PRO ARBEITSMAPPE")
+    print(f"   {'Arbeitsmappe':<32}{'Zeilen':>8}{'✅':>6}{'❌':>6}{'Ø s/Zeile':>11}{'🔁':>6}{'ohne PDF':>10}  PDF")
+    for workbook in workbooks:
+        if workbook.error:
+            print(f"   {workbook.name[:31]:<32}  übersprungen: {workbook.error}")
+            continue
+        processed = workbook.successful + workbook.failed
+        average = workbook.seconds / processed if processed else 0.0
+        pdf = os.path.basename(workbook.pdf_file) if workbook.pdf_file else '-'
+        print(f"   {workbook.name[:31]:<32}{workbook.rows:>8}{workbook.successful:>6}{workbook.failed:>6}"
+              f"{average:>11.1f}{workbook.reexecuted_pages:>6}{len(workbook.missing_documents):>10}  {pdf}")
+    if session is not None:
+        print(f"   🤖 Browser-Starts: {session.started} | Weiterverwendet: {session.reused}")
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+🌐 BROWSER METRICS - Browserseitige Performance-Daten pro Seite
+Nach jedem Seitenwechsel werden Navigation Timing, Resource Timing und
+CDP Performance.getMetrics gelesen und als Attribute am Seiten-Span
+gespeichert. Der Bericht trennt pro Seitentyp Server-/Netzwerkzeit von
+Rendering und dem Overhead der Automation.
+
+Aufruf: python browser_metrics.py [run_id]
+"""
+import json
+import sys
+
+from tracing import percentile
+
+# Ein Script-Aufruf: Navigation-Eintrag + Resource-Zusammenfassung seit der letzten Messung
+PAGE_TIMING_JS = """
+var result = {navigation: null, resources: null};
+var navigation = performance.getEntriesByType('navigation')[0];
+if (navigation) {
+    result.navigation = {
+        url: navigation.name,
+        same_document: navigation.name !== location.href,
+        type: navigation.type,
+        redirect: navigation.redirectEnd - navigation.redirectStart,
+        dns: navigation.domainLookupEnd - navigation.domainLookupStart,
+        connect: navigation.connectEnd - navigation.connectStart,
+        ttfb: navigation.responseStart - navigation.requestStart,
+        download: navigation.responseEnd - navigation.responseStart,
+        dom_interactive: navigation.domInteractive - navigation.responseEnd,
+        load: navigation.loadEventEnd > 0 ? navigation.loadEventEnd - navigation.responseEnd : null,
+        transfer_size: navigation.transferSize || 0
+    };
+}
+var resources = performance.getEntriesByType('resource');
+var summary = {count: resources.length, transfer_size: 0, duration: 0, slowest: []};
+for (var i = 0; i < resources.length; i++) {
+    summary.transfer_size += resources[i].transferSize || 0;
+    summary.duration += resources[i].duration;
+}
+summary.slowest = resources.slice().sort(function (a, b) { return b.duration - a.duration; })
+    .slice(0, 3).map(function (r) { return [r.name.split('?')[0].slice(-80), Math.round(r.duration)]; });
+result.resources = summary;
+performance.clearResourceTimings();
+return result;
+"""
+
+# CDP-Metriken die für die Auswertung relevant sind (Sekunden bzw. Anzahl)
+CDP_METRICS = ('ScriptDuration', 'TaskDuration', 'LayoutDuration', 'RecalcStyleDuration', 'JSHeapUsedSize', 'Nodes')
+
+# Diese Werte zählt Chrome seit Sessionstart auf - gespeichert wird die Differenz pro Seite
+CDP_CUMULATIVE = ('ScriptDuration', 'TaskDuration', 'LayoutDuration', 'RecalcStyleDuration')
+
+# Letzte kumulierte Messung pro Browser-Session (session_id, bleibt über Zeilen hinweg gleich)
+_cdp_previous = {}
+
+
+def _session_key(driver):
+    # Die Workflow-Engine umhüllt den Driver pro Zeile neu - die session_id ändert sich
+    # erst, wenn der Browser neu gestartet wird (BrowserSession)
+    return getattr(driver, 'session_id', None) or id(driver)
+
+
+def _cdp_metrics(driver):
+    """CDP Performance.getMetrics (nur Chromium) als Zuwachs seit der letzten Messung dieser Session"""
+    execute_cdp = getattr(driver, 'execute_cdp_cmd', None)
+    if execute_cdp is None:
+        return {}
+    try:
+        key = _session_key(driver)
+        previous = _cdp_previous.get(key)
+        if previous is None:
+            execute_cdp('Performance.enable', {})  # neue Session - Basis beginnt bei 0
+        metrics = execute_cdp('Performance.getMetrics', {}).get('metrics', [])
+        current = {metric['name']: metric['value'] for metric in metrics if metric['name'] in CDP_METRICS}
+    except Exception as e:
+        print(f"   ⚠️ CDP-Metriken nicht verfügbar: {e}")
+        return {}
+    _cdp_previous[key] = current
+    result = dict(current)
+    for name in CDP_CUMULATIVE:
+        if name in current and previous and name in previous:
+            delta = current[name] - previous[name]
+            # Neuer Renderer-Prozess (z.B. Cross-Site-Navigation) zählt wieder ab 0
+            result[name] = delta if delta >= 0 else current[name]
+    return result
+
+
+def reset_cdp_metrics(driver=None):
+    """Vergisst die Basis einer Session (ohne Driver: alle) - nach Browser-Neustart/-Ende"""
+    if driver is None:
+        _cdp_previous.clear()
+    else:
+        _cdp_previous.pop(_session_key(driver), None)
+
+
+def capture_page_metrics(driver):
+    """Timing-Daten der aktuell geladenen Seite als Span-Attribute"""
+    try:
+        timing = driver.execute_script(PAGE_TIMING_JS) or {}
+    except Exception as e:
+        print(f"   ⚠️ Navigation Timing nicht lesbar: {e}")
+        timing = {}
+    return {
+        'navigation': timing.get('navigation'),
+        'resources': timing.get('resources'),
+        'cdp': _cdp_metrics(driver),
+    }
+
+
+def split_page_time(attributes, duration_ms):
+    """Zerlegt eine Seite in Server/Netzwerk, Rendering, Browser-Script und Automation (ms)"""
+    browser = attributes.get('browser') or {}
+    navigation = browser.get('navigation') or {}
+    # Bei clientseitigem Routing gehört der Navigation-Eintrag zu einer früheren Seite
+    if navigation.get('same_document'):
+        navigation = {}
+    cdp = browser.get('cdp') or {}
+    return {
+        'server': (navigation.get('ttfb') or 0) + (navigation.get('download') or 0),
+        'network': (navigation.get('redirect') or 0) + (navigation.get('dns') or 0) + (navigation.get('connect') or 0),
+        'render': navigation.get('load') or navigation.get('dom_interactive') or 0,
+        'script': (cdp.get('ScriptDuration') or 0) * 1000,
+        'automation': duration_ms,
+    }
+
+
+def summarize_page_metrics(db, run_id=None):
+    """Pro Seitentyp: Median der Zeitanteile und Anzahl gemessener Seiten"""
+    samples = {}
+    for name, duration_ms, attributes in db.get_spans(run_id, name_prefix='page:'):
+        attributes = json.loads(attributes or '{}')
+        if 'browser' not in attributes:
+            continue
+        page = name.split(':', 1)[1]
+        for key, value in split_page_time(attributes, duration_ms).items():
+            samples.setdefault(page, {}).setdefault(key, []).append(value)
+
+    summary = {}
+    for page, parts in samples.items():
+        summary[page] = {key: percentile(sorted(values), 0.50) for key, values in parts.items()}
+        summary[page]['count'] = len(parts['automation'])
+    return summary
+
+
+def print_page_metrics_report(db, run_id=None):
+    summary = summarize_page_metrics(db, run_id)
+    print("\n🌐 BROWSER-METRIKEN pro Seitentyp (Median, ms)")
+    if not summary:
+        print("   Keine Browser-Metriken vorhanden")
+        return summary
+    print(f"   {'Seite':<22}{'n':>4}{'Server':>9}{'Netzwerk':>10}{'Rendering':>11}{'JS (CDP)':>10}{'Automation':>12}")
+    for page, parts in sorted(summary.items()):
+        print(f"   {page:<22}{parts['count']:>4}{parts['server']:>9.0f}{parts['network']:>10.0f}"
+              f"{parts['render']:>11.0f}{parts['script']:>10.0f}{parts['automation']:>12.0f}")
+    return summary
+
+
+if __name__ == "__main__":
+    from database import InterzeroDatabase
+
+    database = InterzeroDatabase()
+    print_page_metrics_report(database, sys.argv[1] if len(sys.argv) > 1 else database.get_latest_run_id())
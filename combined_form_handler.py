@@ -1,3 +1,5 @@
+from event_log import log
+
 def handle_combined_packaging_form(driver, submission_id):
     """Behandelt kombinierte Packaging-Form mit Company und Country Feldern"""
     try:
@@ -27,7 +29,8 @@ def handle_combined_packaging_form(driver, submission_id):
                 inp_type = (inp.get_attribute('type') or 'text').lower()
                 
                 combined = f"{name} {id_attr} {placeholder}"
-                print(f"🔍 Input: type={inp_type}, name={name}, id={id_attr}, placeholder={placeholder}")
+                log.debug("combined_form.input", "🔍 Input: type={type}, name={name}, id={id}, placeholder={placeholder}",
+                          type=inp_type, name=name, id=id_attr, placeholder=placeholder)
                 
                 if inp_type == 'radio' and inp.is_displayed():
                     radio_buttons.append(inp)
@@ -39,7 +42,7 @@ def handle_combined_packaging_form(driver, submission_id):
                     print(f"✅ Email-Feld gefunden: {name}")
                     
             except Exception as e:
-                print(f"⚠️ Input-Analyse Fehler: {e}")
+                log.warning("combined_form.input_error", "⚠️ Input-Analyse Fehler: {error}", error=e)
                 continue
         
         # Analysiere Select-Felder
@@ -49,14 +52,14 @@ def handle_combined_packaging_form(driver, submission_id):
                 id_attr = (select.get_attribute('id') or '').lower()
                 
                 combined = f"{name} {id_attr}"
-                print(f"🔍 Select: name={name}, id={id_attr}")
+                log.debug("combined_form.select", "🔍 Select: name={name}, id={id}", name=name, id=id_attr)
                 
                 if 'country' in combined and select.is_displayed():
                     country_field = select
                     print(f"✅ Country-Feld gefunden: {name}")
                     
             except Exception as e:
-                print(f"⚠️ Select-Analyse Fehler: {e}")
+                log.warning("combined_form.select_error", "⚠️ Select-Analyse Fehler: {error}", error=e)
                 continue
         
         success_count = 0
@@ -135,7 +138,8 @@ def handle_combined_packaging_form(driver, submission_id):
                             pass
                     
                     combined_text = f"{value} {name} {label_text}"
-                    print(f"   Radio {i+1}: value={value}, name={name}, label={label_text}")
+                    log.debug("combined_form.radio", "   Radio {index}: value={value}, name={name}, label={label}",
+                              index=i + 1, value=value, name=name, label=label_text)
                     
                     # Suche nach Packaging-Keywords
                     if any(keyword in combined_text for keyword in ['packaging', 'paper', 'waste', 'material']):
@@ -144,7 +148,7 @@ def handle_combined_packaging_form(driver, submission_id):
                         break
                         
                 except Exception as e:
-                    print(f"⚠️ Radio {i+1} Analyse Fehler: {e}")
+                    log.warning("combined_form.radio_error", "⚠️ Radio {index} Analyse Fehler: {error}", index=i + 1, error=e)
                     continue
             
             # Klicke Packaging Radio-Button
@@ -6,6 +6,30 @@ import sqlite3
 import json
 import os
 
+from tracing import traced
+
+# SQL-Gegenstück zu _field_value: Zahlen als Text, ganzzahlige REAL-Werte ohne ".0"
+CANONICAL_VALUE_SQL = """
+    CASE WHEN typeof({0}) = 'real' AND {0} = CAST({0} AS INTEGER) THEN CAST(CAST({0} AS INTEGER) AS TEXT)
+         ELSE CAST({0} AS TEXT) END
+"""
+
+def _field_value(value):
+    """
+    Feldwert für form_field_values in kanonischer Textform - gespeicherte Werte und
+    Suchwerte laufen hier durch (PLZ 12345 aus Excel als 12345.0 → '12345').
+    Listen/Dicts als JSON (wie json_each).
+    """
+    if value is None or (isinstance(value, float) and value != value):  # NaN
+        return None
+    if isinstance(value, bool):
+        return str(int(value))
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    if isinstance(value, (str, int, float)):
+        return str(value)
+    return json.dumps(value, default=str)
+
 class InterzeroDatabase:
     def __init__(self, db_path="interzero_automation.db"):
         self.db_path = db_path
@@ -64,6 +88,126 @@ class InterzeroDatabase:
                 )
             ''')
             
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS page_plans (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    page_type TEXT,
+                    fingerprint TEXT,
+                    plan_data TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    UNIQUE (page_type, fingerprint)
+                )
+            ''')
+            
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS selector_stats (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    call_site TEXT,
+                    fingerprint TEXT,
+                    selector TEXT,
+                    hits INTEGER DEFAULT 0,
+                    misses INTEGER DEFAULT 0,
+                    miss_streak INTEGER DEFAULT 0,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    UNIQUE (call_site, fingerprint, selector)
+                )
+            ''')
+            
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS spans (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    run_id TEXT,
+                    span_id INTEGER,
+                    parent_id INTEGER,
+                    name TEXT,
+                    start_ms REAL,
+                    duration_ms REAL,
+                    attributes TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_spans_run_name ON spans (run_id, name)')
+            
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS dom_dictionaries (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    codec TEXT,
+                    dictionary BLOB,
+                    sample_count INTEGER,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_evidence_submission ON evidence (submission_id, evidence_type)')
+            
+            # Normalisierte Feldwerte (eine Zeile pro Feld) für Abfragen über Läufe hinweg
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS form_field_values (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    submission_id INTEGER,
+                    page_number INTEGER,
+                    field TEXT,
+                    value TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_field_values_field_value ON form_field_values (field, value)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_field_values_submission ON form_field_values (submission_id, page_number)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_submissions_company ON submissions (company_name)')
+            self._backfill_form_field_values(cursor)
+            # Ältere Datenbanken (Spalte ohne Typ) speicherten Zahlen als INTEGER/REAL
+            cursor.execute(f'''
+                UPDATE form_field_values SET value = {CANONICAL_VALUE_SQL.format('value')}
+                WHERE typeof(value) IN ('integer', 'real')
+            ''')
+            
+            # Ergebnis pro Zeile + inkrementell fortgeschriebene Aggregate (siehe run_report.py)
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS row_results (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    run_id TEXT,
+                    submission_id INTEGER,
+                    workbook TEXT,
+                    row_number INTEGER,
+                    company_name TEXT,
+                    success INTEGER,
+                    failure_reason TEXT,
+                    duration_s REAL,
+                    page_durations TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_row_results_run ON row_results (run_id)')
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS run_stats (
+                    run_id TEXT PRIMARY KEY,
+                    started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    rows_total INTEGER DEFAULT 0,
+                    rows_done INTEGER DEFAULT 0,
+                    rows_success INTEGER DEFAULT 0,
+                    rows_failed INTEGER DEFAULT 0,
+                    total_seconds REAL DEFAULT 0
+                )
+            ''')
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS run_page_stats (
+                    run_id TEXT,
+                    page TEXT,
+                    count INTEGER DEFAULT 0,
+                    total_seconds REAL DEFAULT 0,
+                    max_seconds REAL DEFAULT 0,
+                    PRIMARY KEY (run_id, page)
+                )
+            ''')
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS run_failure_stats (
+                    run_id TEXT,
+                    reason TEXT,
+                    count INTEGER DEFAULT 0,
+                    PRIMARY KEY (run_id, reason)
+                )
+            ''')
+            
             conn.commit()
             conn.close()
             print("✅ Database initialisiert")
@@ -71,6 +215,21 @@ class InterzeroDatabase:
         except Exception as e:
             print(f"⚠️ Database-Fehler: {e}")
     
+    def _backfill_form_field_values(self, cursor):
+        """Einmalig: bestehende JSON-Blobs aus form_fields in form_field_values übernehmen"""
+        cursor.execute('SELECT EXISTS (SELECT 1 FROM form_field_values)')
+        if cursor.fetchone()[0]:
+            return
+        cursor.execute(f'''
+            INSERT INTO form_field_values (submission_id, page_number, field, value, created_at)
+            SELECT f.submission_id, f.page_number, j.key, {CANONICAL_VALUE_SQL.format('j.value')}, f.created_at
+            FROM form_fields f, json_each(f.form_data) j
+            WHERE json_valid(f.form_data) AND json_type(f.form_data) = 'object'
+        ''')
+        if cursor.rowcount > 0:
+            print(f"📝 {cursor.rowcount} Feldwerte aus form_fields übernommen")
+    
+    @traced('db_write:submissions')
     def create_submission(self, record, excel_file, row_index, pdf_file=None):
         """Erstelle neue Submission"""
         try:
@@ -106,6 +265,7 @@ class InterzeroDatabase:
             print(f"❌ Database-Fehler: {e}")
             return 1
     
+    @traced('db_write:http_requests')
     def log_http_request(self, submission_id, url, method, page_title="", form_data=None):
         """Logge HTTP-Request"""
         try:
@@ -126,6 +286,7 @@ class InterzeroDatabase:
         except Exception as e:
             print(f"⚠️ HTTP-Request Logging-Fehler: {e}")
     
+    @traced('db_write:form_fields')
     def log_form_fields(self, submission_id, page_number, form_data):
         """Logge Formularfelder"""
         try:
@@ -139,6 +300,12 @@ class InterzeroDatabase:
                 VALUES (?, ?, ?)
             ''', (submission_id, page_number, form_data_json))
             
+            # Dieselben Felder normalisiert - eine Transaktion für die ganze Seite
+            cursor.executemany('''
+                INSERT INTO form_field_values (submission_id, page_number, field, value)
+                VALUES (?, ?, ?, ?)
+            ''', [(submission_id, page_number, field, _field_value(value)) for field, value in form_data.items()])
+            
             conn.commit()
             conn.close()
             print(f"📝 ✅ {len(form_data)} Formularfelder für Seite {page_number} geloggt")
@@ -146,8 +313,9 @@ class InterzeroDatabase:
         except Exception as e:
             print(f"⚠️ Form-Fields Logging-Fehler: {e}")
     
+    @traced('db_write:evidence')
     def log_evidence(self, submission_id, evidence_type, evidence_data, data_type="text"):
-        """Logge Evidence"""
+        """Logge Evidence - True wenn gespeichert"""
         try:
             conn = sqlite3.connect(self.db_path)
             cursor = conn.cursor()
@@ -160,6 +328,408 @@ class InterzeroDatabase:
             conn.commit()
             conn.close()
             print(f"📸 Evidence geloggt: {evidence_type}")
+            return True
             
         except Exception as e:
             print(f"⚠️ Evidence Logging-Fehler: {e}")
+            return False
+    
+    def get_evidence(self, submission_id, type_prefix=''):
+        """Hole (ID, Typ, Daten, Datentyp, Zeitpunkt) der Evidence einer Submission, optional nach Typ-Präfix"""
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            
+            cursor.execute('''
+                SELECT id, evidence_type, evidence_data, data_type, created_at FROM evidence
+                WHERE submission_id = ? AND evidence_type LIKE ?
+                ORDER BY id
+            ''', (submission_id, type_prefix + '%'))
+            
+            rows = cursor.fetchall()
+            conn.close()
+            return rows
+            
+        except Exception as e:
+            print(f"⚠️ Evidence Lese-Fehler: {e}")
+            return []
+    
+    @traced('db_write:dom_dictionaries')
+    def save_dom_dictionary(self, codec, dictionary, sample_count):
+        """Speichere ein trainiertes DOM-Kompressionswörterbuch; liefert dessen ID"""
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            
+            cursor.execute('''
+                INSERT INTO dom_dictionaries (codec, dictionary, sample_count)
+                VALUES (?, ?, ?)
+            ''', (codec, dictionary, sample_count))
+            
+            dictionary_id = cursor.lastrowid
+            conn.commit()
+            conn.close()
+            return dictionary_id
+            
+        except Exception as e:
+            print(f"⚠️ DOM-Wörterbuch Speicher-Fehler: {e}")
+            return None
+    
+    def get_dom_dictionary(self, dictionary_id=None, codec=None):
+        """Hole (ID, Wörterbuch) per ID bzw. das neueste Wörterbuch eines Codecs"""
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            
+            if dictionary_id is not None:
+                cursor.execute('SELECT id, dictionary FROM dom_dictionaries WHERE id = ?', (dictionary_id,))
+            else:
+                cursor.execute('SELECT id, dictionary FROM dom_dictionaries WHERE codec = ? ORDER BY id DESC LIMIT 1', (codec,))
+            
+            row = cursor.fetchone()
+            conn.close()
+            return row
+            
+        except Exception as e:
+            print(f"⚠️ DOM-Wörterbuch Lese-Fehler: {e}")
+            return None
+    
+    @traced('db_write:run_stats')
+    def start_run_stats(self, run_id, rows_total):
+        """Legt die Statistik-Zeile eines Laufs an"""
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            
+            cursor.execute('''
+                INSERT INTO run_stats (run_id, rows_total) VALUES (?, ?)
+                ON CONFLICT (run_id) DO UPDATE SET rows_total = excluded.rows_total
+            ''', (run_id, rows_total))
+            
+            conn.commit()
+            conn.close()
+            
+        except Exception as e:
+            print(f"⚠️ Lauf-Statistik Speicher-Fehler: {e}")
+    
+    @traced('db_write:row_results')
+    def record_row_result(self, run_id, result):
+        """
+        Speichere das Ergebnis einer Zeile und schreibe die Aggregate fort
+        (run_stats, run_page_stats, run_failure_stats) - eine Transaktion.
+        
+        result: submission_id, workbook, row_number, company_name, success,
+                failure_reason, duration_s, page_durations [(Seite, Sekunden)]
+        """
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            
+            success = 1 if result['success'] else 0
+            cursor.execute('''
+                INSERT INTO row_results (run_id, submission_id, workbook, row_number, company_name,
+                                         success, failure_reason, duration_s, page_durations)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (run_id, result.get('submission_id'), result.get('workbook'), result.get('row_number'),
+                  result.get('company_name'), success, result.get('failure_reason'), result['duration_s'],
+                  json.dumps(result.get('page_durations', []))))
+            
+            cursor.execute('''
+                INSERT INTO run_stats (run_id, rows_done, rows_success, rows_failed, total_seconds)
+                VALUES (?, 1, ?, ?, ?)
+                ON CONFLICT (run_id) DO UPDATE SET
+                    rows_done = rows_done + 1,
+                    rows_success = rows_success + excluded.rows_success,
+                    rows_failed = rows_failed + excluded.rows_failed,
+                    total_seconds = total_seconds + excluded.total_seconds,
+                    updated_at = CURRENT_TIMESTAMP
+            ''', (run_id, success, 1 - success, result['duration_s']))
+            
+            cursor.executemany('''
+                INSERT INTO run_page_stats (run_id, page, count, total_seconds, max_seconds)
+                VALUES (?, ?, 1, ?, ?)
+                ON CONFLICT (run_id, page) DO UPDATE SET
+                    count = count + 1,
+                    total_seconds = total_seconds + excluded.total_seconds,
+                    max_seconds = MAX(max_seconds, excluded.max_seconds)
+            ''', [(run_id, page, seconds, seconds) for page, seconds in result.get('page_durations', [])])
+            
+            if not success:
+                cursor.execute('''
+                    INSERT INTO run_failure_stats (run_id, reason, count) VALUES (?, ?, 1)
+                    ON CONFLICT (run_id, reason) DO UPDATE SET count = count + 1
+                ''', (run_id, result.get('failure_reason') or 'unknown'))
+            
+            conn.commit()
+            conn.close()
+            
+        except Exception as e:
+            print(f"⚠️ Zeilen-Ergebnis Speicher-Fehler: {e}")
+    
+    def get_run_stats(self, since=None):
+        """Hole die Statistik aller Läufe (optional ab Zeitpunkt 'YYYY-MM-DD'), neueste zuerst"""
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            
+            query = '''
+                SELECT run_id, started_at, updated_at, rows_total, rows_done, rows_success, rows_failed, total_seconds
+                FROM run_stats
+            '''
+            params = []
+            if since:
+                query += ' WHERE started_at >= ?'
+                params.append(since)
+            cursor.execute(query + ' ORDER BY started_at DESC', params)
+            
+            rows = cursor.fetchall()
+            conn.close()
+            return rows
+            
+        except Exception as e:
+            print(f"⚠️ Lauf-Statistik Lese-Fehler: {e}")
+            return []
+    
+    def get_page_stats(self, run_ids=None):
+        """Hole (Seite, Anzahl, Summe s, max s) - summiert über die angegebenen bzw. alle Läufe"""
+        return self._get_run_aggregate('''
+            SELECT page, SUM(count), SUM(total_seconds), MAX(max_seconds) FROM run_page_stats {where}
+            GROUP BY page ORDER BY SUM(total_seconds) DESC
+        ''', run_ids)
+    
+    def get_failure_stats(self, run_ids=None):
+        """Hole (Fehlergrund, Anzahl) - summiert über die angegebenen bzw. alle Läufe"""
+        return self._get_run_aggregate('''
+            SELECT reason, SUM(count) FROM run_failure_stats {where}
+            GROUP BY reason ORDER BY SUM(count) DESC
+        ''', run_ids)
+    
+    def _get_run_aggregate(self, query, run_ids):
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            
+            if run_ids is None:
+                cursor.execute(query.format(where=''))
+            else:
+                placeholders = ', '.join('?' * len(run_ids)) or "''"
+                cursor.execute(query.format(where=f'WHERE run_id IN ({placeholders})'), list(run_ids))
+            
+            rows = cursor.fetchall()
+            conn.close()
+            return rows
+            
+        except Exception as e:
+            print(f"⚠️ Lauf-Statistik Lese-Fehler: {e}")
+            return []
+    
+    def find_submissions_by_field(self, field, value, page_number=None):
+        """Submissions, die mit einem bestimmten Feldwert abgesendet wurden (z.B. country = 'Germany')"""
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            
+            query = '''
+                SELECT v.submission_id, s.company_name, s.excel_file, s.row_index, v.page_number, v.created_at
+                FROM form_field_values v LEFT JOIN submissions s ON s.id = v.submission_id
+                WHERE v.field = ? AND v.value = ?
+            '''
+            params = [field, _field_value(value)]
+            if page_number is not None:
+                query += ' AND v.page_number = ?'
+                params.append(page_number)
+            cursor.execute(query + ' ORDER BY v.submission_id', params)
+            
+            rows = cursor.fetchall()
+            conn.close()
+            return rows
+            
+        except Exception as e:
+            print(f"⚠️ Feldwert Lese-Fehler: {e}")
+            return []
+    
+    def get_field_values(self, field, company_name=None, submission_id=None):
+        """Eingetragene Werte eines Felds - für eine Firma, eine Submission oder alle"""
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            
+            query = '''
+                SELECT v.submission_id, s.company_name, v.page_number, v.value, v.created_at
+                FROM form_field_values v LEFT JOIN submissions s ON s.id = v.submission_id
+                WHERE v.field = ?
+            '''
+            params = [field]
+            if submission_id is not None:
+                query += ' AND v.submission_id = ?'
+                params.append(submission_id)
+            if company_name is not None:
+                query += ' AND v.submission_id IN (SELECT id FROM submissions WHERE company_name = ?)'
+                params.append(company_name)
+            cursor.execute(query + ' ORDER BY v.submission_id, v.page_number', params)
+            
+            rows = cursor.fetchall()
+            conn.close()
+            return rows
+            
+        except Exception as e:
+            print(f"⚠️ Feldwert Lese-Fehler: {e}")
+            return []
+    
+    def get_page_plan(self, page_type, fingerprint):
+        """Hole gespeicherten Seiten-Plan für einen Struktur-Fingerprint"""
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            
+            cursor.execute('''
+                SELECT plan_data FROM page_plans
+                WHERE page_type = ? AND fingerprint = ?
+            ''', (page_type, fingerprint))
+            
+            row = cursor.fetchone()
+            conn.close()
+            return json.loads(row[0]) if row else None
+            
+        except Exception as e:
+            print(f"⚠️ Page-Plan Lese-Fehler: {e}")
+            return None
+    
+    @traced('db_write:page_plans')
+    def save_page_plan(self, page_type, fingerprint, plan):
+        """Speichere Seiten-Plan für einen Struktur-Fingerprint"""
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            
+            cursor.execute('''
+                INSERT OR REPLACE INTO page_plans (page_type, fingerprint, plan_data)
+                VALUES (?, ?, ?)
+            ''', (page_type, fingerprint, json.dumps(plan)))
+            
+            conn.commit()
+            conn.close()
+            print(f"🗺️ Page-Plan gespeichert: {page_type} ({fingerprint[:12]})")
+            
+        except Exception as e:
+            print(f"⚠️ Page-Plan Speicher-Fehler: {e}")
+    
+    def get_selector_stats(self, call_site, fingerprint):
+        """Hole Treffer-Statistik aller Selektoren einer Aufrufstelle"""
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            
+            cursor.execute('''
+                SELECT selector, hits, misses, miss_streak FROM selector_stats
+                WHERE call_site = ? AND fingerprint = ?
+            ''', (call_site, fingerprint))
+            
+            stats = {
+                selector: {'hits': hits, 'misses': misses, 'streak': streak}
+                for selector, hits, misses, streak in cursor.fetchall()
+            }
+            conn.close()
+            return stats
+            
+        except Exception as e:
+            print(f"⚠️ Selektor-Statistik Lese-Fehler: {e}")
+            return {}
+    
+    @traced('db_write:selector_stats')
+    def save_selector_stats(self, rows):
+        """Speichere geänderte Selektor-Statistiken gebündelt - rows: (call_site, fingerprint, selector, hits, misses, miss_streak)"""
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            
+            cursor.executemany('''
+                INSERT INTO selector_stats (call_site, fingerprint, selector, hits, misses, miss_streak)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (call_site, fingerprint, selector) DO UPDATE SET
+                    hits = excluded.hits,
+                    misses = excluded.misses,
+                    miss_streak = excluded.miss_streak,
+                    updated_at = CURRENT_TIMESTAMP
+            ''', rows)
+            
+            conn.commit()
+            conn.close()
+            return True
+            
+        except Exception as e:
+            print(f"⚠️ Selektor-Statistik Speicher-Fehler: {e}")
+            return False
+    
+    def save_spans(self, rows):
+        """Speichere gepufferte Spans gebündelt (eine Transaktion)"""
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            
+            cursor.executemany('''
+                INSERT INTO spans (run_id, span_id, parent_id, name, start_ms, duration_ms, attributes)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', rows)
+            
+            conn.commit()
+            conn.close()
+            
+        except Exception as e:
+            print(f"⚠️ Span Speicher-Fehler: {e}")
+    
+    def get_span_durations(self, run_id=None):
+        """Hole (Name, Dauer ms) aller Spans eines Laufs bzw. aller Läufe"""
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            
+            if run_id:
+                cursor.execute('SELECT name, duration_ms FROM spans WHERE run_id = ?', (run_id,))
+            else:
+                cursor.execute('SELECT name, duration_ms FROM spans')
+            
+            rows = cursor.fetchall()
+            conn.close()
+            return rows
+            
+        except Exception as e:
+            print(f"⚠️ Span Lese-Fehler: {e}")
+            return []
+    
+    def get_spans(self, run_id=None, name_prefix=''):
+        """Hole (Name, Dauer ms, Attribute-JSON) der Spans eines Laufs, optional nach Namenspräfix"""
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            
+            query = 'SELECT name, duration_ms, attributes FROM spans WHERE name LIKE ?'
+            params = [name_prefix + '%']
+            if run_id:
+                query += ' AND run_id = ?'
+                params.append(run_id)
+            cursor.execute(query, params)
+            
+            rows = cursor.fetchall()
+            conn.close()
+            return rows
+            
+        except Exception as e:
+            print(f"⚠️ Span Lese-Fehler: {e}")
+            return []
+    
+    def get_latest_run_id(self):
+        """ID des zuletzt aufgezeichneten Laufs"""
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            
+            cursor.execute('SELECT run_id FROM spans ORDER BY id DESC LIMIT 1')
+            
+            row = cursor.fetchone()
+            conn.close()
+            return row[0] if row else None
+            
+        except Exception as e:
+            print(f"⚠️ Span Lese-Fehler: {e}")
+            return None
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+⏱️ DEADLINE - Zeitbudget pro Zeile und pro Seite
+Ein Deadline-Objekt wird beim Zeilenstart angelegt; jede Seite bekommt ein
+Teilbudget daraus. Waits und Lookups holen sich ihr Timeout über
+wait_timeout() und überschreiten damit nie das verbleibende Budget.
+Läuft das Budget ab, bricht der Durchlauf mit klassifiziertem Grund ab.
+"""
+import os
+import time
+from contextlib import contextmanager
+
+# Budgets in Sekunden (per Umgebungsvariable überschreibbar)
+ROW_BUDGET_SECONDS = float(os.environ.get('IZ_ROW_BUDGET', '240'))
+PAGE_BUDGET_SECONDS = float(os.environ.get('IZ_PAGE_BUDGET', '60'))
+
+# Kleinstes Timeout das an Selenium übergeben wird (0 würde "sofort" bedeuten)
+MIN_WAIT_SECONDS = 0.5
+
+# Klassifizierte Abbruchgründe
+REASON_ROW_TIMEOUT = 'row_timeout'
+REASON_PAGE_TIMEOUT = 'page_timeout'
+REASON_NO_PROGRESS = 'no_progress'
+
+
+class DeadlineExceeded(Exception):
+    def __init__(self, reason, detail=''):
+        super().__init__(f"{reason}: {detail}" if detail else reason)
+        self.reason = reason
+        self.detail = detail
+
+
+class Deadline:
+    def __init__(self, seconds, reason=REASON_ROW_TIMEOUT, parent=None):
+        self.reason = reason
+        self.parent = parent
+        self.expires_at = time.monotonic() + seconds
+        if parent is not None:
+            self.expires_at = min(self.expires_at, parent.expires_at)
+
+    def remaining(self):
+        """Verbleibende Sekunden (nie negativ)"""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self):
+        return self.remaining() <= 0
+
+    def child(self, seconds, reason=REASON_PAGE_TIMEOUT):
+        """Teilbudget, das nie länger als das eigene Budget läuft"""
+        return Deadline(seconds, reason, parent=self)
+
+    def check(self, stage=''):
+        """Wirft DeadlineExceeded mit dem Grund des zuerst abgelaufenen Budgets"""
+        if self.parent is not None:
+            self.parent.check(stage)
+        if self.expired():
+            raise DeadlineExceeded(self.reason, stage)
+
+
+# Aktives Budget (innerstes zuerst) - gesetzt von Zeilen-/Seiten-Scope
+_active = []
+
+
+@contextmanager
+def scope(deadline):
+    """Macht ein Budget für alle wait_timeout()-Aufrufe im Block aktiv (None = kein Budget)"""
+    if deadline is None:
+        yield None
+        return
+    _active.append(deadline)
+    try:
+        yield deadline
+    finally:
+        _active.pop()
+
+
+def current():
+    return _active[-1] if _active else None
+
+
+def wait_timeout(default):
+    """Timeout für Waits/Lookups: Standardwert, gekappt auf das aktive Budget"""
+    deadline = current()
+    if deadline is None:
+        return default
+    return max(MIN_WAIT_SECONDS, min(default, deadline.remaining()))
+
+
+def check(stage=''):
+    """Prüft das aktive Budget (ohne aktives Budget: keine Wirkung)"""
+    deadline = current()
+    if deadline is not None:
+        deadline.check(stage)
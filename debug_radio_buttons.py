@@ -3,6 +3,7 @@
 🔍 DEBUG: Radio-Button-Problem Analyse
 Testet warum Radio-Buttons nicht korrekt ausgewählt werden
 """
+from radio_rules import classify_radios
 
 def debug_radio_button_logic():
     """Debug der Radio-Button-Auswahllogik"""
@@ -35,18 +36,11 @@ def debug_radio_button_logic():
     
     print(f"\n🎯 PHASE 1 TEST - ONLINE STORE JA/NEIN:")
     
-    # Phase 1: Online Store
-    for radio in mock_radios[:2]:  # Nur erste 2 (Phase 1)
-        radio_text = f"{radio['value']} {radio['name']} {radio['id']} {radio['label']}"
-        should_select = False
-        reason = ""
-        
-        if online_store in ['yes', 'ja', 'true', '1', 'x', 'y']:
-            if any(yes_keyword in radio_text for yes_keyword in ['yes', 'ja', 'true']):
-                if not any(no_keyword in radio_text for no_keyword in ['no', 'nein', 'false', 'not', 'kein']):
-                    should_select = True
-                    reason = f"JA-Option für Online Store (Excel: '{online_store}')"
-        
+    # Phase 1: Online Store - gleiche Regeltabelle wie handle_membership_page_2
+    phase_1_radios = mock_radios[:2]  # Nur erste 2 (Phase 1)
+    selected_radio, reason = classify_radios(phase_1_radios, online_store=online_store)['online_store']
+    for radio in phase_1_radios:
+        should_select = radio is selected_radio
         print(f"   📻 {radio['label']}: {'✅ AUSWÄHLEN' if should_select else '❌ NICHT'}")
         if should_select:
             print(f"      📋 Grund: {reason}")
@@ -54,20 +48,10 @@ def debug_radio_button_logic():
     print(f"\n🎯 PHASE 2 TEST - ONLINE STORE SELLS:")
     
     # Phase 2: Online Store Sells
-    for radio in mock_radios[2:]:  # Phase 2 Radio-Buttons
-        radio_text = f"{radio['value']} {radio['name']} {radio['id']} {radio['label']}"
-        should_select = False
-        reason = ""
-        
-        if online_store_sells:
-            sells_keywords = online_store_sells.lower().split()
-            for keyword in sells_keywords:
-                if len(keyword) > 2:  # Ignoriere "they"
-                    if keyword in radio_text:
-                        should_select = True
-                        reason = f"Online Store Sells Match: '{keyword}' (Excel: '{online_store_sells}')"
-                        break
-        
+    phase_2_radios = mock_radios[2:]  # Phase 2 Radio-Buttons
+    selected_radio, reason = classify_radios(phase_2_radios, online_store_sells=online_store_sells)['sells']
+    for radio in phase_2_radios:
+        should_select = radio is selected_radio
         print(f"   📻 {radio['label']}: {'✅ AUSWÄHLEN' if should_select else '❌ NICHT'}")
         if should_select:
             print(f"      📋 Grund: {reason}")
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+🧬 DOM EVIDENCE - Komprimierte Seiten-Snapshots mit gemeinsamem Wörterbuch
+Pro ausgefüllter Seite wird das DOM inkl. aktueller Feldwerte (value,
+checked, selected - Passwörter ausgenommen) als HTML gesichert. Die
+Membership-Seiten sind nahezu identisch; ein aus den ersten Snapshots
+trainiertes Wörterbuch macht aus ~100 KB HTML wenige KB.
+
+Codec: zstandard (falls installiert, trainiertes Wörterbuch), sonst zlib
+mit Preset-Dictionary. Das Wörterbuch liegt in `dom_dictionaries`, jeder
+Snapshot verweist über den Datentyp "dom:<codec>:<wörterbuch-id>" darauf.
+
+Im Seitenablauf wird nur das HTML gelesen; Komprimierung und SQLite laufen
+im Hintergrund-Thread (BackgroundWriter aus evidence_pipeline.py).
+
+Steuerung: IZ_DOM_EVIDENCE=0 schaltet die Snapshots ab.
+Audit:     python dom_evidence.py <submission_id> [zielordner]
+"""
+import os
+import sys
+import zlib
+
+from evidence_pipeline import BackgroundWriter
+
+DOM_EVIDENCE = os.environ.get('IZ_DOM_EVIDENCE', '1') == '1'
+
+# Snapshots ohne Wörterbuch, bevor eins trainiert wird
+TRAIN_SAMPLES = 20
+
+# zlib nutzt höchstens 32 KB Preset-Dictionary
+DICTIONARY_SIZE = 32 * 1024
+
+ZSTD_LEVEL = 10
+ZLIB_LEVEL = 9
+
+# DOM mit Live-Feldwerten als Attribute; Skripte werden entfernt
+DOM_SNAPSHOT_JS = """
+var root = document.documentElement.cloneNode(true);
+var live = document.querySelectorAll('input, select, textarea');
+var copies = root.querySelectorAll('input, select, textarea');
+for (var i = 0; i < live.length && i < copies.length; i++) {
+    var element = live[i], copy = copies[i];
+    var type = (element.type || '').toLowerCase();
+    if (type === 'checkbox' || type === 'radio') {
+        if (element.checked) { copy.setAttribute('checked', 'checked'); } else { copy.removeAttribute('checked'); }
+    } else if (element.tagName === 'SELECT') {
+        for (var j = 0; j < element.options.length; j++) {
+            if (element.options[j].selected) { copy.options[j].setAttribute('selected', 'selected'); }
+            else { copy.options[j].removeAttribute('selected'); }
+        }
+    } else if (element.tagName === 'TEXTAREA') {
+        copy.textContent = element.value;
+    } else if (type !== 'password' && type !== 'file') {
+        copy.setAttribute('value', element.value);
+    }
+}
+var scripts = root.querySelectorAll('script, noscript');
+for (var k = 0; k < scripts.length; k++) { scripts[k].parentNode.removeChild(scripts[k]); }
+return '<!DOCTYPE html>\\n' + root.outerHTML;
+"""
+
+_zstd_module = None
+
+
+def _zstd():
+    """zstandard-Modul oder None (optionale Abhängigkeit)"""
+    global _zstd_module
+    if _zstd_module is None:
+        try:
+            import zstandard
+            _zstd_module = zstandard
+        except ImportError:
+            _zstd_module = False
+    return _zstd_module or None
+
+
+def default_codec():
+    return 'zstd' if _zstd() else 'zlib'
+
+
+def compress(codec, data, dictionary=None):
+    if codec == 'zstd':
+        zstd = _zstd()
+        dict_data = zstd.ZstdCompressionDict(dictionary) if dictionary else None
+        return zstd.ZstdCompressor(level=ZSTD_LEVEL, dict_data=dict_data).compress(data)
+    compressor = zlib.compressobj(ZLIB_LEVEL, zdict=dictionary) if dictionary else zlib.compressobj(ZLIB_LEVEL)
+    return compressor.compress(data) + compressor.flush()
+
+
+def decompress(codec, blob, dictionary=None):
+    if codec == 'zstd':
+        zstd = _zstd()
+        if zstd is None:
+            raise RuntimeError("zstandard nicht installiert - Snapshot kann nicht gelesen werden")
+        dict_data = zstd.ZstdCompressionDict(dictionary) if dictionary else None
+        return zstd.ZstdDecompressor(dict_data=dict_data).decompress(blob)
+    decompressor = zlib.decompressobj(zdict=dictionary) if dictionary else zlib.decompressobj()
+    return decompressor.decompress(blob) + decompressor.flush()
+
+
+def train_dictionary(codec, samples):
+    """Wörterbuch aus Beispiel-Snapshots (bytes)"""
+    share = max(1, DICTIONARY_SIZE // len(samples))
+    # Seitenanfänge (Head, Navigation, Formularrahmen) sind über alle Seiten gleich
+    raw_content = b''.join(sample[:share] for sample in samples)[-DICTIONARY_SIZE:]
+    if codec == 'zstd':
+        zstd = _zstd()
+        try:
+            return zstd.train_dictionary(DICTIONARY_SIZE, samples).as_bytes()
+        except Exception:
+            return raw_content  # zu wenige/zu ähnliche Samples - Rohinhalt als Wörterbuch
+    return raw_content
+
+
+class DomEvidence(BackgroundWriter):
+    thread_name = 'dom-evidence-writer'
+
+    def __init__(self, get_db, codec=None, enabled=DOM_EVIDENCE):
+        super().__init__()
+        self.get_db = get_db
+        self.codec = codec or default_codec()
+        self.enabled = enabled
+        # Wörterbuch und Samples werden nur im Hintergrund-Thread angefasst
+        self.dictionary_id = None
+        self.dictionary = None
+        self._dictionary_loaded = False
+        self._samples = []
+        self.stats = {'snapshots': 0, 'dropped': 0, 'failed': 0, 'raw_bytes': 0, 'stored_bytes': 0}
+
+    def _load_dictionary(self):
+        if self._dictionary_loaded:
+            return
+        self._dictionary_loaded = True
+        row = self.get_db().get_dom_dictionary(codec=self.codec)
+        if row:
+            self.dictionary_id, self.dictionary = row[0], bytes(row[1])
+
+    def _collect_sample(self, data):
+        self._samples.append(data)
+        if len(self._samples) < TRAIN_SAMPLES:
+            return
+        dictionary = train_dictionary(self.codec, self._samples)
+        dictionary_id = self.get_db().save_dom_dictionary(self.codec, dictionary, len(self._samples))
+        if dictionary_id is not None:
+            self.dictionary_id, self.dictionary = dictionary_id, dictionary
+            print(f"🧬 DOM-Wörterbuch trainiert ({self.codec}, {len(dictionary) / 1024:.0f} KB, ID {dictionary_id})")
+        self._samples = []
+
+    def capture(self, driver, submission_id, page):
+        """Liest das DOM der aktuellen Seite und übergibt es zum Speichern an den Hintergrund-Thread"""
+        if not self.enabled:
+            return False
+        try:
+            html = driver.execute_script(DOM_SNAPSHOT_JS) or driver.page_source
+        except Exception as e:
+            print(f"⚠️ DOM-Snapshot fehlgeschlagen ({page}): {e}")
+            return False
+        if not self.submit(submission_id, page, html):
+            self.stats['dropped'] += 1
+            print(f"⚠️ DOM-Snapshot verworfen ({page}) - Warteschlange voll")
+            return False
+        return True
+
+    def _store(self, submission_id, page, html):
+        """Komprimiert und speichert einen Snapshot als Evidence 'dom_snapshot:<Seite>'"""
+        try:
+            data = html.encode('utf-8')
+            self._load_dictionary()
+            blob = compress(self.codec, data, self.dictionary)
+            stored = self.get_db().log_evidence(submission_id, f"dom_snapshot:{page}", blob,
+                                                f"dom:{self.codec}:{self.dictionary_id or 0}")
+        except Exception as e:
+            stored = False
+            print(f"⚠️ DOM-Snapshot konnte nicht gespeichert werden ({page}): {e}")
+        if not stored:
+            self.stats['failed'] += 1
+            return
+        self.stats['snapshots'] += 1
+        self.stats['raw_bytes'] += len(data)
+        self.stats['stored_bytes'] += len(blob)
+        if self.dictionary is None:
+            self._collect_sample(data)
+
+    def print_summary(self):
+        stats = self.stats
+        if not (stats['snapshots'] or stats['dropped'] or stats['failed']):
+            return
+        print(f"\n🧬 DOM-SNAPSHOTS ({self.codec}, Wörterbuch {self.dictionary_id or 'keins'})")
+        if stats['dropped'] or stats['failed']:
+            print(f"   Verworfen: {stats['dropped']} | Fehler: {stats['failed']}")
+        if not stats['snapshots']:
+            return
+        print(f"   {stats['snapshots']} Snapshots: {stats['raw_bytes'] / 1024:.0f} KB HTML → "
+              f"{stats['stored_bytes'] / 1024:.0f} KB gespeichert "
+              f"(Ø {stats['stored_bytes'] / stats['snapshots'] / 1024:.1f} KB pro Seite)")
+
+
+def decode_snapshot(db, evidence_data, data_type, _dictionaries={}):
+    """HTML eines gespeicherten Snapshots (Wörterbücher werden zwischengespeichert)"""
+    _, codec, dictionary_id = data_type.split(':')
+    dictionary_id = int(dictionary_id)
+    dictionary = None
+    if dictionary_id:
+        if dictionary_id not in _dictionaries:
+            row = db.get_dom_dictionary(dictionary_id)
+            if not row:
+                raise ValueError(f"DOM-Wörterbuch {dictionary_id} fehlt")
+            _dictionaries[dictionary_id] = bytes(row[1])
+        dictionary = _dictionaries[dictionary_id]
+    return decompress(codec, bytes(evidence_data), dictionary).decode('utf-8')
+
+
+def export_snapshots(db, submission_id, target_dir='.'):
+    """Schreibt alle DOM-Snapshots einer Submission als HTML-Dateien"""
+    paths = []
+    for evidence_id, evidence_type, evidence_data, data_type, created_at in db.get_evidence(submission_id, 'dom_snapshot:'):
+        page = evidence_type.split(':', 1)[1]
+        path = os.path.join(target_dir, f"submission_{submission_id}_{evidence_id}_{page}.html")
+        with open(path, 'w', encoding='utf-8') as handle:
+            handle.write(decode_snapshot(db, evidence_data, data_type))
+        print(f"🧬 {page} ({created_at}) → {path}")
+        paths.append(path)
+    if not paths:
+        print(f"   Keine DOM-Snapshots für Submission {submission_id}")
+    return paths
+
+
+if __name__ == "__main__":
+    from database import InterzeroDatabase
+
+    if len(sys.argv) < 2:
+        print("Aufruf: python dom_evidence.py <submission_id> [zielordner]")
+        sys.exit(1)
+    export_snapshots(InterzeroDatabase(), int(sys.argv[1]), sys.argv[2] if len(sys.argv) > 2 else '.')
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+📡 DRIVER INSTRUMENTATION - Zählt jeden WebDriver-Befehl und seine Latenz
+Transparenter Proxy um Driver und Elemente (nur mit IZ_INSTRUMENT=1 oder
+--instrument aktiv). Jeder Befehl (find_element, get_attribute,
+is_displayed, execute_script, ...) wird mit seiner Round-Trip-Zeit dem
+gerade laufenden Seiten-Handler zugeordnet. Der Bericht zeigt pro Zeile
+und Seite die Anzahl der Befehle und die Zeit "auf der Leitung".
+"""
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+INSTRUMENT = os.environ.get('IZ_INSTRUMENT', '0') == '1' or '--instrument' in sys.argv
+
+# Properties, deren Zugriff einen Remote-Befehl auslöst (alle anderen sind lokal)
+REMOTE_PROPERTIES = {
+    'current_url', 'title', 'page_source', 'window_handles', 'current_window_handle',
+    'text', 'tag_name', 'size', 'location', 'rect', 'accessible_name', 'aria_role',
+}
+
+
+class CommandStats:
+    def __init__(self):
+        self.section = 'setup'
+        self.row = None
+        self.rows = {}  # Zeile → Abschnitt → Befehl → [Anzahl, Sekunden]
+
+    def record(self, command, seconds):
+        sections = self.rows.setdefault(self.row, {})
+        entry = sections.setdefault(self.section, {}).setdefault(command, [0, 0.0])
+        entry[0] += 1
+        entry[1] += seconds
+
+    @contextmanager
+    def attribute_to(self, section):
+        """Ordnet alle Befehle im Block dem Abschnitt (Seiten-Handler) zu"""
+        previous = self.section
+        self.section = section
+        try:
+            yield
+        finally:
+            self.section = previous
+
+    def start_row(self, row):
+        self.row = row
+        self.section = 'setup'
+
+    def print_row_report(self, row=None):
+        row = self.row if row is None else row
+        sections = self.rows.get(row, {})
+        if not sections:
+            return
+        print(f"\n📡 WEBDRIVER-BEFEHLE - Zeile {row}")
+        print(f"   {'Abschnitt':<24}{'Befehle':>9}{'Leitung s':>11}   Häufigste Befehle")
+        total_count = 0
+        total_seconds = 0.0
+        for section, commands in sections.items():
+            count = sum(entry[0] for entry in commands.values())
+            seconds = sum(entry[1] for entry in commands.values())
+            total_count += count
+            total_seconds += seconds
+            top = sorted(commands.items(), key=lambda item: -item[1][0])[:3]
+            top_text = ', '.join(f"{command}×{entry[0]}" for command, entry in top)
+            print(f"   {section:<24}{count:>9}{seconds:>11.2f}   {top_text}")
+        print(f"   {'GESAMT':<24}{total_count:>9}{total_seconds:>11.2f}")
+
+    def print_summary(self):
+        """Summe über alle Zeilen pro Abschnitt"""
+        totals = {}
+        for sections in self.rows.values():
+            for section, commands in sections.items():
+                entry = totals.setdefault(section, [0, 0.0])
+                entry[0] += sum(item[0] for item in commands.values())
+                entry[1] += sum(item[1] for item in commands.values())
+        if not totals:
+            return
+        rows = max(1, len(self.rows))
+        print(f"\n📡 WEBDRIVER-BEFEHLE - Alle Zeilen ({len(self.rows)})")
+        print(f"   {'Abschnitt':<24}{'Befehle':>9}{'Ø/Zeile':>9}{'Leitung s':>11}")
+        for section, (count, seconds) in sorted(totals.items(), key=lambda item: -item[1][1]):
+            print(f"   {section:<24}{count:>9}{count / rows:>9.1f}{seconds:>11.2f}")
+
+
+command_stats = CommandStats()
+
+
+def _unwrap(value):
+    """Proxies vor der Übergabe an Selenium wieder durch echte Objekte ersetzen"""
+    if isinstance(value, _Instrumented):
+        return value._target
+    if isinstance(value, list):
+        return [_unwrap(item) for item in value]
+    if isinstance(value, tuple):
+        return tuple(_unwrap(item) for item in value)
+    if isinstance(value, dict):
+        return {key: _unwrap(item) for key, item in value.items()}
+    return value
+
+
+def _wrap(value):
+    """WebElements in Ergebnissen in Proxies verpacken - auch in Listen, Tupeln und Dicts
+    (Snapshot-Scripts liefern Dicts mit 'element', deren spätere Klicks mitzählen sollen)"""
+    from selenium.webdriver.remote.webelement import WebElement
+
+    if isinstance(value, _Instrumented):
+        return value
+    if isinstance(value, WebElement):
+        return InstrumentedElement(value)
+    if isinstance(value, list):
+        return [_wrap(item) for item in value]
+    if isinstance(value, tuple):
+        return tuple(_wrap(item) for item in value)
+    if isinstance(value, dict):
+        return {key: _wrap(item) for key, item in value.items()}
+    return value
+
+
+class _Instrumented:
+    def __init__(self, target):
+        object.__setattr__(self, '_target', target)
+
+    def __getattr__(self, name):
+        target = object.__getattribute__(self, '_target')
+        if name in REMOTE_PROPERTIES:
+            start = time.perf_counter()
+            try:
+                return getattr(target, name)
+            finally:
+                command_stats.record(name, time.perf_counter() - start)
+
+        attribute = getattr(target, name)
+        if not callable(attribute) or name.startswith('_'):
+            return attribute
+
+        def instrumented(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return _wrap(attribute(*_unwrap(args), **_unwrap(kwargs)))
+            finally:
+                command_stats.record(name, time.perf_counter() - start)
+        return instrumented
+
+    def __setattr__(self, name, value):
+        setattr(self._target, name, value)
+
+    def __eq__(self, other):
+        return self._target == _unwrap(other)
+
+    def __hash__(self):
+        return hash(self._target)
+
+
+class InstrumentedDriver(_Instrumented):
+    pass
+
+
+class InstrumentedElement(_Instrumented):
+    @property
+    def __class__(self):
+        # isinstance(element, WebElement) in Selenium (ActionChains, Select, ...) bleibt wahr
+        return type(self._target)
+
+
+def instrument_driver(driver):
+    """Driver bei aktivem Flag in den Proxy verpacken, sonst unverändert zurückgeben"""
+    if not INSTRUMENT or driver is None:
+        return driver
+    print("📡 WebDriver-Instrumentierung aktiv")
+    return InstrumentedDriver(driver)
+
+
+@contextmanager
+def attribute_to(section):
+    """Befehle im Block einem Abschnitt zuordnen (ohne aktives Flag wirkungslos)"""
+    if not INSTRUMENT:
+        yield
+        return
+    with command_stats.attribute_to(section):
+        yield
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+📝 EVENT LOG - Strukturierter Logger mit Levels und lazy Formatierung
+Ereignisse haben einen Namen, ein Level und Felder. Die Nachricht wird
+erst formatiert, wenn ein Ausgabekanal das Level tatsächlich ausgibt -
+Debug-Ereignisse pro Element kosten im Quiet-Modus nur einen Vergleich.
+Optionaler JSON-Lines-Sink für die maschinelle Auswertung; weitere Sinks
+(z.B. der Live-Monitor) abonnieren den Ereignisstrom per subscribe().
+Ereignisse ohne Nachricht erscheinen nicht auf der Konsole.
+
+Steuerung:
+    IZ_LOG_LEVEL=debug|info|warning|error   Konsole (Standard: info)
+    IZ_QUIET=1 oder --quiet                  Konsole nur Warnungen/Fehler
+    IZ_LOG_JSON=pfad.jsonl                   JSON-Lines-Sink (alle Levels ab IZ_LOG_JSON_LEVEL)
+"""
+import atexit
+import json
+import os
+import sys
+import time
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+
+LEVEL_NAMES = {'debug': DEBUG, 'info': INFO, 'warning': WARNING, 'error': ERROR}
+DISABLED = 100
+
+
+def _level_from_env(name, default):
+    return LEVEL_NAMES.get(os.environ.get(name, default).lower(), LEVEL_NAMES[default])
+
+
+class EventLogger:
+    def __init__(self, console_level=INFO, json_path=None, json_level=DEBUG):
+        self.console_level = console_level
+        self.json_level = json_level if json_path else DISABLED
+        self.json_path = json_path
+        self._json_file = None  # wird beim ersten Ereignis geöffnet
+        self._subscribers = []  # (Level, Callback)
+        self._update_threshold()
+
+    def _update_threshold(self):
+        # Unterhalb dieses Levels verlässt log() die Funktion sofort
+        self.min_level = min([self.console_level, self.json_level] + [level for level, _ in self._subscribers])
+
+    def subscribe(self, callback, level=INFO):
+        """callback(record) erhält jedes Ereignis ab level als Dict (ts, level, event, Felder)"""
+        self._subscribers.append((level, callback))
+        self._update_threshold()
+
+    def unsubscribe(self, callback):
+        self._subscribers = [(level, subscriber) for level, subscriber in self._subscribers if subscriber is not callback]
+        self._update_threshold()
+
+    def set_console_level(self, level):
+        self.console_level = level
+        self._update_threshold()
+
+    def is_enabled(self, level):
+        """Vorab-Prüfung für Felder, deren Ermittlung selbst teuer ist (z.B. WebDriver-Aufrufe)"""
+        return level >= self.min_level
+
+    def log(self, level, event, message='', **fields):
+        if level < self.min_level:
+            return
+        if message and level >= self.console_level:
+            print(message.format(**fields) if fields else message)
+        record = None
+        for subscriber_level, callback in self._subscribers:
+            if level >= subscriber_level:
+                record = record or {'ts': round(time.time(), 3), 'level': level, 'event': event, **fields}
+                try:
+                    callback(record)
+                except Exception as e:
+                    print(f"⚠️ Event-Sink fehlgeschlagen ({event}): {e}")
+        if level >= self.json_level:
+            record = record or {'ts': round(time.time(), 3), 'level': level, 'event': event, **fields}
+            if self._json_file is None:
+                self._json_file = open(self.json_path, 'a', encoding='utf-8')
+            self._json_file.write(json.dumps(record, default=str, ensure_ascii=False) + '\n')
+
+    def debug(self, event, message='', **fields):
+        if DEBUG >= self.min_level:
+            self.log(DEBUG, event, message, **fields)
+
+    def info(self, event, message='', **fields):
+        self.log(INFO, event, message, **fields)
+
+    def warning(self, event, message='', **fields):
+        self.log(WARNING, event, message, **fields)
+
+    def error(self, event, message='', **fields):
+        self.log(ERROR, event, message, **fields)
+
+    def close(self):
+        if self._json_file is not None:
+            self._json_file.close()
+            self._json_file = None
+
+
+def _configure():
+    quiet = os.environ.get('IZ_QUIET', '0') == '1' or '--quiet' in sys.argv
+    console_level = WARNING if quiet else _level_from_env('IZ_LOG_LEVEL', 'info')
+    logger = EventLogger(
+        console_level=console_level,
+        json_path=os.environ.get('IZ_LOG_JSON') or None,
+        json_level=_level_from_env('IZ_LOG_JSON_LEVEL', 'debug'),
+    )
+    atexit.register(logger.close)
+    return logger
+
+
+log = _configure()
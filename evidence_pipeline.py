@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+📸 EVIDENCE PIPELINE - Screenshots im Hintergrund verkleinern und speichern
+Die Aufnahme liefert nur die rohen PNG-Bytes und kehrt sofort zurück.
+Ein Hintergrund-Thread verkleinert das Bild, kodiert es optional kompakter
+(WebP/JPEG, falls Pillow installiert ist) und schreibt es in die Tabelle
+`evidence`. Die Automation wartet weder auf Kodierung noch auf SQLite.
+
+Steuerung:
+    IZ_SCREENSHOT_POLICY=always|failure|every:N|off   (Standard: always)
+        failure  - nur bei fehlgeschlagenen Zeilen
+        every:N  - jede N-te Zeile, Fehlschläge immer
+    IZ_SCREENSHOT_WIDTH=1280       maximale Breite nach dem Verkleinern
+    IZ_SCREENSHOT_FORMAT=webp|jpeg|png
+"""
+import base64
+import io
+import os
+import queue
+import threading
+
+POLICY = os.environ.get('IZ_SCREENSHOT_POLICY', 'always').lower()
+MAX_WIDTH = int(os.environ.get('IZ_SCREENSHOT_WIDTH', '1280'))
+IMAGE_FORMAT = os.environ.get('IZ_SCREENSHOT_FORMAT', 'webp').lower()
+IMAGE_QUALITY = 60
+
+# Volle Warteschlange → Aufnahme wird verworfen statt die Automation zu bremsen
+QUEUE_SIZE = 32
+
+_STOP = object()
+
+
+def should_capture(policy, row_number, failure=False):
+    """Entscheidet anhand der Capture-Policy, ob ein Screenshot aufgenommen wird"""
+    if policy == 'off':
+        return False
+    if policy == 'always' or failure:
+        return True
+    if policy.startswith('every:'):
+        try:
+            every = max(1, int(policy.split(':', 1)[1]))
+        except ValueError:
+            return True
+        return row_number is None or (row_number - 1) % every == 0
+    return False
+
+
+def shrink_image(png_bytes, max_width=MAX_WIDTH, image_format=IMAGE_FORMAT):
+    """Verkleinert/kodiert das Bild; liefert (Bytes, MIME-Typ). Ohne Pillow unverändert PNG."""
+    try:
+        from PIL import Image
+    except ImportError:
+        return png_bytes, 'image/png'
+
+    image = Image.open(io.BytesIO(png_bytes))
+    if image.width > max_width:
+        image.thumbnail((max_width, max_width * image.height // image.width))
+    output = io.BytesIO()
+    if image_format == 'webp':
+        image.save(output, format='WEBP', quality=IMAGE_QUALITY, method=4)
+        return output.getvalue(), 'image/webp'
+    if image_format in ('jpeg', 'jpg'):
+        image.convert('RGB').save(output, format='JPEG', quality=IMAGE_QUALITY, optimize=True)
+        return output.getvalue(), 'image/jpeg'
+    image.save(output, format='PNG', optimize=True)
+    return output.getvalue(), 'image/png'
+
+
+class BackgroundWriter:
+    """Warteschlange + Hintergrund-Thread; Unterklassen verarbeiten jedes Element in _store(*item)"""
+    thread_name = 'evidence-writer'
+
+    def __init__(self, queue_size=QUEUE_SIZE):
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._thread = None  # wird beim ersten Element gestartet
+        self._lock = threading.Lock()
+
+    def submit(self, *item):
+        """Übergibt ein Element ohne zu warten; False wenn die Warteschlange voll ist"""
+        self._ensure_worker()
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            return False
+        return True
+
+    def _ensure_worker(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=self.thread_name, daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is _STOP:
+                    return
+                self._store(*item)
+            finally:
+                self._queue.task_done()
+
+    def _store(self, *item):
+        raise NotImplementedError
+
+    def pending(self):
+        return self._queue.qsize()
+
+    def close(self, timeout=30):
+        """Wartet bis alle Elemente geschrieben sind und beendet den Thread"""
+        if self._thread is None:
+            return
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+        self._thread = None
+
+
+class ScreenshotPipeline(BackgroundWriter):
+    def __init__(self, get_db, policy=POLICY, queue_size=QUEUE_SIZE):
+        super().__init__(queue_size)
+        self.get_db = get_db
+        self.policy = policy
+        self.row_number = None
+        self.stats = {'captured': 0, 'skipped': 0, 'dropped': 0, 'stored': 0, 'failed': 0,
+                      'raw_bytes': 0, 'stored_bytes': 0}
+
+    def begin_row(self, row_number):
+        self.row_number = row_number
+
+    def capture(self, driver, submission_id, evidence_type, failure=False):
+        """Nimmt einen Screenshot auf und übergibt ihn an den Hintergrund-Thread"""
+        if not should_capture(self.policy, self.row_number, failure):
+            self.stats['skipped'] += 1
+            return False
+        try:
+            png_bytes = driver.get_screenshot_as_png()
+        except Exception as e:
+            print(f"⚠️ Screenshot fehlgeschlagen ({evidence_type}): {e}")
+            return False
+        if not self.submit(submission_id, evidence_type, png_bytes):
+            self.stats['dropped'] += 1
+            print(f"⚠️ Screenshot verworfen ({evidence_type}) - Warteschlange voll")
+            return False
+        self.stats['captured'] += 1
+        return True
+
+    def _store(self, submission_id, evidence_type, png_bytes):
+        try:
+            image_bytes, mime_type = shrink_image(png_bytes)
+            stored = self.get_db().log_evidence(submission_id, evidence_type,
+                                                base64.b64encode(image_bytes).decode('ascii'), f"base64:{mime_type}")
+        except Exception as e:
+            stored = False
+            print(f"⚠️ Screenshot konnte nicht gespeichert werden ({evidence_type}): {e}")
+        if stored:
+            self.stats['stored'] += 1
+            self.stats['raw_bytes'] += len(png_bytes)
+            self.stats['stored_bytes'] += len(image_bytes)
+        else:
+            self.stats['failed'] += 1  # Kodierung oder SQLite-Schreiben fehlgeschlagen
+
+    def print_summary(self):
+        stats = self.stats
+        if not (stats['captured'] or stats['skipped']):
+            return
+        ratio = stats['stored_bytes'] / stats['raw_bytes'] * 100 if stats['raw_bytes'] else 0
+        print(f"\n📸 SCREENSHOTS (Policy: {self.policy})")
+        print(f"   Aufgenommen: {stats['captured']} | Übersprungen: {stats['skipped']} | "
+              f"Verworfen: {stats['dropped']} | Gespeichert: {stats['stored']} | Fehler: {stats['failed']}")
+        if stats['raw_bytes']:
+            print(f"   Größe: {stats['raw_bytes'] / 1024:.0f} KB roh → {stats['stored_bytes'] / 1024:.0f} KB gespeichert ({ratio:.0f}%)")
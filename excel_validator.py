@@ -2,16 +2,59 @@
 """
 📊 EXCEL VALIDATOR - Validierung von Excel-Dateien
 """
-import pandas as pd
 import os
 
+from lazy_imports import LazyModule
+from option_index import is_known_alias, COUNTRY_ALIASES, SALUTATION_ALIASES
+from page_plan import FIELD_COLUMNS
+from pdf_index import PDF_COLUMNS
+
+pd = LazyModule('pandas')
+
+# Zuletzt eingelesene Excel-Datei: (Pfad, mtime, Größe) → DataFrame
+# GUI-Validierung und Automation-Lauf teilen sich so einen einzigen Parse
+_parse_cache = {}
+
+REQUIRED_COLUMNS = ['Company Name', 'Country']
+
+# Optionale Felder: Anzeigename → akzeptierte Spaltennamen (Schreibweisen wie in der Automation)
+OPTIONAL_COLUMNS = {
+    **{columns[0]: columns for field, columns in FIELD_COLUMNS.items() if field not in ('company_name', 'country')},
+    'Salutation': ['Salutation'],
+    'Business Activity': ['Business Activity'],
+    'Sub Activity': ['Sub Activity', 'Sub-Activity', 'Sub activity', 'Sub-activity', 'Subactivity'],
+}
+
+# Grobe Formatprüfung - das Formular lehnt Adressen ohne @/Domain ab
+EMAIL_PATTERN = r'^[^@\s]+@[^@\s]+\.[^@\s]+$'
+
+# Spalten deren Werte vor dem Lauf gegen den Options-Alias-Index geprüft werden
+ALIAS_COLUMNS = {
+    'Country': COUNTRY_ALIASES,
+    'Salutation': SALUTATION_ALIASES,
+}
+
+def _file_signature(excel_file):
+    stat = os.stat(excel_file)
+    return (os.path.abspath(excel_file), stat.st_mtime_ns, stat.st_size)
+
+def load_excel(excel_file):
+    """Excel einlesen - wiederholte Aufrufe für dieselbe (unveränderte) Datei nutzen den Cache"""
+    key = _file_signature(excel_file)
+    df = _parse_cache.get(key)
+    if df is None:
+        df = pd.read_excel(excel_file)
+        _parse_cache.clear()  # nur die zuletzt gewählte Datei behalten
+        _parse_cache[key] = df
+    return df
+
 def validate_excel_file(excel_file):
     """Einfache Excel-Validierung"""
     try:
         if not os.path.exists(excel_file):
             return False
         
-        df = pd.read_excel(excel_file)
+        df = load_excel(excel_file)
         return not df.empty
         
     except Exception as e:
@@ -24,7 +67,7 @@ def get_excel_row_count(excel_file):
         if not os.path.exists(excel_file):
             return 0
         
-        df = pd.read_excel(excel_file)
+        df = load_excel(excel_file)
         clean_df = df.dropna(how='all')
         return len(clean_df)
         
@@ -32,8 +75,88 @@ def get_excel_row_count(excel_file):
         print(f"❌ Excel Row Count Fehler: {e}")
         return 0
 
-def get_detailed_excel_validation(excel_file):
-    """Detaillierte Excel-Validierung"""
+def _add_issue(entries, df, index, key, message):
+    entry = entries.setdefault(index, {
+        'row': int(index) + 1,
+        'company': str(df.at[index, 'Company Name']) if 'Company Name' in df.columns else 'Unbekannt',
+        key: []
+    })
+    entry[key].append(message)
+
+def validate_row_values(df, cancelled=None):
+    """
+    Prüft die Zeilen spaltenweise - jeder eindeutige Wert wird nur einmal nachgeschlagen.
+    
+    Fehler (row_errors): leere Pflichtfelder, ungültige E-Mail-Adressen und
+    PDF-Spalten, die keine PDF-Datei nennen - diese Zeilen scheitern im Lauf.
+    Hinweise (row_warnings): unbekannte Country/Salutation-Werte; das Formular kann
+    Optionen anbieten, die nicht in der Alias-Tabelle stehen (Suche per Teilstring).
+    Rückgabe (row_errors, row_warnings), bei Abbruch None.
+    """
+    row_errors = {}
+    row_warnings = {}
+    
+    for column in REQUIRED_COLUMNS:
+        if column not in df.columns:
+            continue  # fehlende Spalte meldet missing_required
+        values = df[column].fillna('').astype(str).str.strip()
+        for index in values[values == ''].index:
+            _add_issue(row_errors, df, index, 'errors', f"{column}: leer (Pflichtfeld)")
+    
+    for column in FIELD_COLUMNS['email']:
+        if column not in df.columns:
+            continue
+        if cancelled and cancelled():
+            return None
+        values = df[column].dropna().astype(str).str.strip()
+        values = values[values != '']
+        for index, value in values[~values.str.match(EMAIL_PATTERN)].items():
+            _add_issue(row_errors, df, index, 'errors', f"{column}: ungültige E-Mail-Adresse '{value}'")
+    
+    for column in PDF_COLUMNS:
+        if column not in df.columns:
+            continue
+        values = df[column].dropna().astype(str).str.strip()
+        # Ohne Endung sucht pdf_index nach <name>.pdf - andere Endungen sind kein Dokument
+        extensions = values.map(lambda value: os.path.splitext(value)[1].lower())
+        for index, value in values[(extensions != '') & (extensions != '.pdf')].items():
+            _add_issue(row_errors, df, index, 'errors', f"{column}: '{value}' ist keine PDF-Datei")
+    
+    for column, aliases in ALIAS_COLUMNS.items():
+        if column not in df.columns:
+            continue
+        if cancelled and cancelled():
+            return None
+        values = df[column].dropna().astype(str).str.strip()
+        unknown = {value for value in values.unique() if value and not is_known_alias(value, aliases)}
+        for index, value in values[values.isin(unknown)].items():
+            _add_issue(row_warnings, df, index, 'warnings',
+                       f"{column}: unbekannter Wert '{value}' - wird im Formular per Teilstring gesucht")
+    return list(row_errors.values()), list(row_warnings.values())
+
+def find_missing_optional(columns):
+    """Optionale Felder, für die keine der akzeptierten Spalten vorhanden ist"""
+    present = {str(column).strip().lower() for column in columns}
+    return [name for name, alternatives in OPTIONAL_COLUMNS.items()
+            if not any(alternative.lower() in present for alternative in alternatives)]
+
+def preview_row(df):
+    """Erste Datenzeile als {Spalte: Wert} (leere Zellen ausgelassen)"""
+    if df.empty:
+        return {}
+    return {str(column): value for column, value in df.iloc[0].items() if not (value is None or value != value or value == '')}
+
+def get_detailed_excel_validation(excel_file, progress=None, cancelled=None):
+    """
+    Detaillierte Excel-Validierung.
+    
+    progress(text, anteil) meldet den Fortschritt (anteil None = unbestimmt),
+    cancelled() bricht zwischen den Schritten ab - Rückgabe dann None.
+    """
+    def report(text, fraction):
+        if progress:
+            progress(text, fraction)
+    
     try:
         if not os.path.exists(excel_file):
             return {
@@ -41,10 +164,17 @@ def get_detailed_excel_validation(excel_file):
                 'error': 'Datei nicht gefunden',
                 'row_count': 0,
                 'found_columns': [],
-                'missing_required': []
+                'missing_required': [],
+                'missing_optional': [],
+                'row_errors': [],
+                'row_warnings': [],
+                'preview_data': {}
             }
         
-        df = pd.read_excel(excel_file)
+        report("📖 Excel wird gelesen...", None)
+        df = load_excel(excel_file)
+        if cancelled and cancelled():
+            return None
         
         if df.empty:
             return {
@@ -52,22 +182,35 @@ def get_detailed_excel_validation(excel_file):
                 'error': 'Excel-Datei ist leer',
                 'row_count': 0,
                 'found_columns': [],
-                'missing_required': []
+                'missing_required': [],
+                'missing_optional': [],
+                'row_errors': [],
+                'row_warnings': [],
+                'preview_data': {}
             }
         
-        required_columns = ['Company Name', 'Country']
         found_columns = df.columns.tolist()
-        missing_required = [col for col in required_columns if col not in found_columns]
+        missing_required = [col for col in REQUIRED_COLUMNS if col not in found_columns]
         
+        report("🔍 Zeilen werden geprüft...", 0.5)
         clean_df = df.dropna(how='all')
         row_count = len(clean_df)
+        row_issues = validate_row_values(clean_df, cancelled)
+        if row_issues is None:
+            return None
+        row_errors, row_warnings = row_issues
+        report("✅ Validierung abgeschlossen", 1.0)
         
         return {
             'is_valid': True,
             'error': None,
             'row_count': row_count,
             'found_columns': found_columns,
-            'missing_required': missing_required
+            'missing_required': missing_required,
+            'missing_optional': find_missing_optional(found_columns),
+            'row_errors': row_errors,
+            'row_warnings': row_warnings,
+            'preview_data': preview_row(clean_df)
         }
         
     except Exception as e:
@@ -76,5 +219,9 @@ def get_detailed_excel_validation(excel_file):
             'error': str(e),
             'row_count': 0,
             'found_columns': [],
-            'missing_required': []
+            'missing_required': [],
+            'missing_optional': [],
+            'row_errors': [],
+            'row_warnings': [],
+            'preview_data': {}
         }
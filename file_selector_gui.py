@@ -7,8 +7,136 @@ Erweiterte tkinter GUI mit Excel-Validierung und Mehrfach-Durchlauf-Unterstützu
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 import os
-import sys
-from excel_validator import validate_excel_file, get_excel_row_count, get_detailed_excel_validation
+import queue
+import threading
+from excel_validator import get_detailed_excel_validation, load_excel
+
+# Zeilenfehler-Liste im Detailfenster begrenzen (Rest über die Vorschau-Markierung)
+MAX_LISTED_ROW_ERRORS = 1000
+
+class VirtualTable:
+    """
+    Virtualisierte Tabellenvorschau: Der Treeview hält nur einen festen Pool
+    von Zeilen/Spalten, beim Scrollen wird der sichtbare Ausschnitt aus dem
+    DataFrame neu befüllt - unabhängig von der Dateigröße.
+    """
+    VISIBLE_ROWS = 20
+    VISIBLE_COLUMNS = 8
+    
+    def __init__(self, parent, df, error_rows=(), warning_rows=()):
+        self.df = df
+        self.columns = [str(column) for column in df.columns]
+        self.error_rows = set(error_rows)  # Zeilennummern wie in row_errors (Index + 1)
+        self.warning_rows = set(warning_rows) - self.error_rows
+        self.row_offset = 0
+        self.column_offset = 0
+        
+        self.frame = ttk.Frame(parent)
+        slots = ['#'] + [f"c{i}" for i in range(min(self.VISIBLE_COLUMNS, len(self.columns)))]
+        self.column_slots = slots[1:]
+        self.tree = ttk.Treeview(self.frame, columns=slots, show="headings",
+                                 height=self.VISIBLE_ROWS, selectmode="browse")
+        self.tree.heading('#', text="Zeile")
+        self.tree.column('#', width=60, anchor="e", stretch=False)
+        for slot in self.column_slots:
+            self.tree.column(slot, width=130, stretch=True)
+        self.tree.tag_configure('error', background="#ffd6d6")
+        self.tree.tag_configure('warning', background="#fff4c2")
+        
+        # Fester Item-Pool - Inhalte werden beim Scrollen nur ersetzt
+        self.items = [self.tree.insert('', 'end', iid=f"r{i}") for i in range(min(self.VISIBLE_ROWS, len(df)))]
+        
+        self.vscroll = ttk.Scrollbar(self.frame, orient="vertical", command=self._on_vscroll)
+        self.hscroll = ttk.Scrollbar(self.frame, orient="horizontal", command=self._on_hscroll)
+        self.tree.grid(row=0, column=0, sticky="nsew")
+        self.vscroll.grid(row=0, column=1, sticky="ns")
+        self.hscroll.grid(row=1, column=0, sticky="ew")
+        self.frame.rowconfigure(0, weight=1)
+        self.frame.columnconfigure(0, weight=1)
+        
+        self.tree.bind("<MouseWheel>", lambda e: self.scroll_rows(-1 if e.delta > 0 else 1, 3))
+        self.tree.bind("<Button-4>", lambda e: self.scroll_rows(-1, 3))
+        self.tree.bind("<Button-5>", lambda e: self.scroll_rows(1, 3))
+        self.tree.bind("<Shift-MouseWheel>", lambda e: self.scroll_columns(-1 if e.delta > 0 else 1))
+        self.tree.bind("<Prior>", lambda e: self.scroll_rows(-1, self.VISIBLE_ROWS))
+        self.tree.bind("<Next>", lambda e: self.scroll_rows(1, self.VISIBLE_ROWS))
+        self.tree.bind("<Left>", lambda e: self.scroll_columns(-1))
+        self.tree.bind("<Right>", lambda e: self.scroll_columns(1))
+        
+        self.render()
+    
+    @property
+    def max_row_offset(self):
+        return max(0, len(self.df) - len(self.items))
+    
+    @property
+    def max_column_offset(self):
+        return max(0, len(self.columns) - len(self.column_slots))
+    
+    def _on_vscroll(self, action, amount, unit=None):
+        if action == 'moveto':
+            self.row_offset = int(float(amount) * len(self.df))
+        else:
+            self.row_offset += int(amount) * (len(self.items) if unit == 'pages' else 1)
+        self.render()
+    
+    def _on_hscroll(self, action, amount, unit=None):
+        if action == 'moveto':
+            self.column_offset = int(float(amount) * len(self.columns))
+        else:
+            self.column_offset += int(amount) * (len(self.column_slots) if unit == 'pages' else 1)
+        self.render()
+    
+    def scroll_rows(self, direction, count):
+        self.row_offset += direction * count
+        self.render()
+        return "break"
+    
+    def scroll_columns(self, direction):
+        self.column_offset += direction
+        self.render()
+        return "break"
+    
+    def scroll_to(self, row_number):
+        """Springt zur Zeile mit der Nummer aus row_errors und markiert sie"""
+        try:
+            position = self.df.index.get_loc(row_number - 1)
+        except KeyError:
+            return
+        self.row_offset = position - len(self.items) // 2
+        self.render()
+        slot = position - self.row_offset
+        if 0 <= slot < len(self.items):
+            self.tree.selection_set(self.items[slot])
+    
+    def render(self):
+        """Befüllt den Item-Pool mit dem aktuell sichtbaren Ausschnitt"""
+        self.row_offset = min(max(self.row_offset, 0), self.max_row_offset)
+        self.column_offset = min(max(self.column_offset, 0), self.max_column_offset)
+        
+        visible_columns = self.columns[self.column_offset:self.column_offset + len(self.column_slots)]
+        for slot, column in zip(self.column_slots, visible_columns):
+            self.tree.heading(slot, text=column)
+        
+        page = self.df.iloc[self.row_offset:self.row_offset + len(self.items),
+                            self.column_offset:self.column_offset + len(self.column_slots)]
+        for item, (index, values) in zip(self.items, zip(page.index, page.itertuples(index=False, name=None))):
+            row_number = int(index) + 1
+            cells = ['' if value is None or value != value else str(value) for value in values]
+            if row_number in self.error_rows:
+                tags = ('error',)
+            elif row_number in self.warning_rows:
+                tags = ('warning',)
+            else:
+                tags = ()
+            self.tree.item(item, values=[row_number] + cells, tags=tags)
+        self.tree.selection_remove(self.tree.selection())
+        
+        total_rows = max(len(self.df), 1)
+        total_columns = max(len(self.columns), 1)
+        self.vscroll.set(self.row_offset / total_rows, (self.row_offset + len(self.items)) / total_rows)
+        self.hscroll.set(self.column_offset / total_columns,
+                         (self.column_offset + len(self.column_slots)) / total_columns)
 
 class FileSelectionGUI:
     def __init__(self):
@@ -26,6 +154,11 @@ class FileSelectionGUI:
         self.excel_validation_details = []
         self.validation_details = None  # Für detaillierte Validierung
         
+        # Hintergrund-Validierung: Worker-Thread → Queue → root.after-Polling
+        self._validation_queue = queue.Queue()
+        self._validation_cancel = None
+        self._validation_job = 0
+        
         self.setup_ui()
         
     def setup_ui(self):
@@ -71,6 +204,15 @@ class FileSelectionGUI:
                                      command=self.show_validation_details, state="disabled")
         self.details_btn.grid(row=2, column=0, pady=(5, 0), sticky=(tk.W))
         
+        # Fortschritt + Abbrechen (nur während der Validierung sichtbar)
+        self.validation_progress = ttk.Progressbar(self.excel_validation_frame, mode="indeterminate", length=250)
+        self.validation_progress.grid(row=3, column=0, pady=(5, 0), sticky=(tk.W))
+        self.validation_cancel_btn = ttk.Button(self.excel_validation_frame, text="⏹️ Validierung abbrechen",
+                                               command=self.cancel_validation)
+        self.validation_cancel_btn.grid(row=3, column=1, padx=(10, 0), pady=(5, 0))
+        self.validation_progress.grid_remove()
+        self.validation_cancel_btn.grid_remove()
+        
         # Variablen für Validierungsdetails
         self.validation_details = None
         
@@ -135,60 +277,143 @@ class FileSelectionGUI:
             self.validate_excel()
             
     def validate_excel(self):
-        """Validiert die ausgewählte Excel-Datei mit detaillierten Informationen"""
+        """Startet die detaillierte Validierung der gewählten Excel-Datei im Hintergrund"""
         if not self.excel_file:
             return
-            
+        
+        # Laufende Validierung einer vorher gewählten Datei verwerfen
+        if self._validation_cancel:
+            self._validation_cancel.set()
+        self._validation_job += 1
+        job = self._validation_job
+        cancel_event = threading.Event()
+        self._validation_cancel = cancel_event
+        
+        self.excel_valid = False
+        self.validation_details = None
+        self.start_btn.config(state="disabled")
+        self.details_btn.config(state="disabled")
+        self.validation_label.config(text="⏳ Excel wird validiert...", foreground="blue")
+        self.row_count_label.config(text="", foreground="black")
+        self.status_label.config(text="Excel-Validierung läuft...", foreground="blue")
+        self.validation_progress.config(mode="indeterminate", value=0)
+        self.validation_progress.grid()
+        self.validation_progress.start(15)
+        self.validation_cancel_btn.grid()
+        
+        excel_file = self.excel_file
+        
+        def worker():
+            # Kein Tk-Zugriff im Worker - alles läuft über die Queue
+            def progress(text, fraction):
+                self._validation_queue.put((job, 'progress', (text, fraction)))
+            try:
+                result = get_detailed_excel_validation(excel_file, progress=progress, cancelled=cancel_event.is_set)
+                self._validation_queue.put((job, 'done', result))
+            except Exception as e:
+                self._validation_queue.put((job, 'error', e))
+        
+        threading.Thread(target=worker, name="excel-validation", daemon=True).start()
+        self.root.after(100, self._poll_validation, job)
+        
+    def _poll_validation(self, polled_job):
+        """Holt Fortschritt/Ergebnis des Worker-Threads ab (läuft im Tk-Hauptthread)"""
+        if polled_job != self._validation_job:
+            return  # neuere Validierung hat eigenes Polling
+        finished = False
         try:
-            # Detaillierte Validierung durchführen
-            self.validation_details = get_detailed_excel_validation(self.excel_file)
-            
-            is_valid = self.validation_details['is_valid']
-            row_count = self.validation_details['row_count']
+            while True:
+                job, kind, payload = self._validation_queue.get_nowait()
+                if job != self._validation_job or self._validation_cancel.is_set():
+                    continue  # veraltete oder abgebrochene Validierung
+                if kind == 'progress':
+                    text, fraction = payload
+                    self.validation_label.config(text=text, foreground="blue")
+                    if fraction is not None:
+                        self.validation_progress.stop()
+                        self.validation_progress.config(mode="determinate", value=fraction * 100)
+                elif kind == 'done':
+                    finished = True
+                    self._finish_validation()
+                    if payload is not None:
+                        self._apply_validation_result(payload)
+                else:
+                    finished = True
+                    self._finish_validation()
+                    self._show_validation_error(payload)
+        except queue.Empty:
+            pass
+        
+        if not finished and not self._validation_cancel.is_set():
+            self.root.after(100, self._poll_validation, polled_job)
             
-            self.excel_valid = is_valid
-            self.excel_row_count = row_count
+    def _finish_validation(self):
+        self.validation_progress.stop()
+        self.validation_progress.grid_remove()
+        self.validation_cancel_btn.grid_remove()
+        
+    def cancel_validation(self):
+        """Bricht die laufende Validierung ab (Ergebnis wird verworfen)"""
+        if self._validation_cancel:
+            self._validation_cancel.set()
+        self._finish_validation()
+        self.excel_valid = False
+        self.validation_label.config(text="⏹️ Validierung abgebrochen", foreground="orange")
+        self.start_btn.config(state="disabled")
+        self.details_btn.config(state="disabled")
+        self.status_label.config(text="Validierung abgebrochen - Excel-Datei erneut wählen", foreground="orange")
+        
+    def _apply_validation_result(self, validation_details):
+        """Ergebnis der Validierung in der Oberfläche anzeigen"""
+        self.validation_details = validation_details
+        
+        is_valid = self.validation_details['is_valid']
+        row_count = self.validation_details['row_count']
+        
+        self.excel_valid = is_valid
+        self.excel_row_count = row_count
+        
+        if is_valid:
+            self.validation_label.config(text="✅ Excel-Validierung erfolgreich", foreground="green")
+            self.excel_label.config(foreground="green")
+            self.start_btn.config(state="normal")
+            self.details_btn.config(state="normal")
             
-            if is_valid:
-                self.validation_label.config(text="✅ Excel-Validierung erfolgreich", foreground="green")
-                self.excel_label.config(foreground="green")
-                self.start_btn.config(state="normal")
-                self.details_btn.config(state="normal")
-                
-                if row_count > 1:
-                    self.row_count_label.config(
-                        text=f"🔄 {row_count} Zeilen gefunden → {row_count} Automation-Durchläufe", 
-                        foreground="orange"
-                    )
-                    self.status_label.config(
-                        text=f"Bereit für {row_count} Automation-Durchläufe!", 
-                        foreground="green"
-                    )
-                else:
-                    self.row_count_label.config(text="📋 1 Zeile → 1 Automation-Durchlauf", foreground="green")
-                    self.status_label.config(text="Excel validiert. Optional: PDF-Datei wählen", foreground="green")
-                    
+            if row_count > 1:
+                self.row_count_label.config(
+                    text=f"🔄 {row_count} Zeilen gefunden → {row_count} Automation-Durchläufe", 
+                    foreground="orange"
+                )
+                self.status_label.config(
+                    text=f"Bereit für {row_count} Automation-Durchläufe!", 
+                    foreground="green"
+                )
             else:
-                self.validation_label.config(text="❌ Excel-Validierung fehlgeschlagen", foreground="red")
-                self.excel_label.config(foreground="red")
-                self.row_count_label.config(text="", foreground="black")
-                self.start_btn.config(state="disabled")
-                self.details_btn.config(state="normal")  # Details auch bei Fehlern anzeigen
-                self.status_label.config(text="Excel-Validierung fehlgeschlagen - Details anzeigen", foreground="red")
-                
-        except Exception as e:
-            self.validation_label.config(text=f"❌ Validierungsfehler: {str(e)}", foreground="red")
+                self.row_count_label.config(text="📋 1 Zeile → 1 Automation-Durchlauf", foreground="green")
+                self.status_label.config(text="Excel validiert. Optional: PDF-Datei wählen", foreground="green")
+        
+        else:
+            self.validation_label.config(text="❌ Excel-Validierung fehlgeschlagen", foreground="red")
             self.excel_label.config(foreground="red")
             self.row_count_label.config(text="", foreground="black")
             self.start_btn.config(state="disabled")
-            self.details_btn.config(state="disabled")
-            self.status_label.config(text="Fehler bei Excel-Validierung", foreground="red")
-            
-            messagebox.showerror(
-                "Validierungsfehler",
-                f"Fehler bei der Excel-Validierung:\n\n{str(e)}"
-            )
-            
+            self.details_btn.config(state="normal")  # Details auch bei Fehlern anzeigen
+            self.status_label.config(text="Excel-Validierung fehlgeschlagen - Details anzeigen", foreground="red")
+    
+    def _show_validation_error(self, e):
+        """Fehler der Validierung anzeigen"""
+        self.validation_label.config(text=f"❌ Validierungsfehler: {str(e)}", foreground="red")
+        self.excel_label.config(foreground="red")
+        self.row_count_label.config(text="", foreground="black")
+        self.start_btn.config(state="disabled")
+        self.details_btn.config(state="disabled")
+        self.status_label.config(text="Fehler bei Excel-Validierung", foreground="red")
+        
+        messagebox.showerror(
+            "Validierungsfehler",
+            f"Fehler bei der Excel-Validierung:\n\n{str(e)}"
+        )
+
     def select_pdf_file(self):
         """PDF-Datei auswählen"""
         file_path = filedialog.askopenfilename(
@@ -213,135 +438,98 @@ class FileSelectionGUI:
             messagebox.showwarning("Keine Details", "Keine Validierungsdetails verfügbar")
             return
         
+        details = self.validation_details
+        
         # Neues Fenster erstellen
         details_window = tk.Toplevel(self.root)
         details_window.title("📋 Excel-Validierung Details")
-        details_window.geometry("800x600")
+        details_window.geometry("1000x750")
         details_window.resizable(True, True)
         
-        # Hauptframe mit Scrollbar
         main_frame = ttk.Frame(details_window)
         main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        # Canvas und Scrollbar für scrollbaren Inhalt
-        canvas = tk.Canvas(main_frame)
-        scrollbar = ttk.Scrollbar(main_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
-        
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
         # Titel
-        title_label = ttk.Label(scrollable_frame, 
+        title_label = ttk.Label(main_frame, 
                                text=f"📊 Excel-Validierung: {os.path.basename(self.excel_file)}", 
                                font=("Arial", 14, "bold"))
-        title_label.pack(pady=(0, 20))
+        title_label.pack(pady=(0, 10))
         
         # Übersicht
-        overview_frame = ttk.LabelFrame(scrollable_frame, text="📈 Übersicht", padding="10")
+        overview_frame = ttk.LabelFrame(main_frame, text="📈 Übersicht", padding="10")
         overview_frame.pack(fill=tk.X, pady=(0, 10))
         
-        overview_text = f"""✅ Gültig: {'Ja' if self.validation_details['is_valid'] else 'Nein'}
-📋 Anzahl Zeilen: {self.validation_details['row_count']}
-📊 Gefundene Spalten: {len(self.validation_details['found_columns'])}
-❌ Fehlende Pflichtfelder: {len(self.validation_details['missing_required'])}
-⚠️ Fehlende optionale Felder: {len(self.validation_details['missing_optional'])}
-🚨 Zeilen mit Fehlern: {len(self.validation_details['row_errors'])}"""
+        overview_text = f"""✅ Gültig: {'Ja' if details['is_valid'] else 'Nein'}    📋 Anzahl Zeilen: {details['row_count']}    📊 Gefundene Spalten: {len(details['found_columns'])}
+❌ Fehlende Pflichtfelder: {', '.join(details['missing_required']) or 'keine'}
+⚠️ Fehlende optionale Felder: {', '.join(details['missing_optional']) or 'keine'}
+🚨 Zeilen mit Fehlern: {len(details['row_errors'])}    ⚠️ Zeilen mit Hinweisen: {len(details.get('row_warnings', []))}"""
+        if details.get('error'):
+            overview_text += f"\n🚨 {details['error']}"
         
-        overview_label = ttk.Label(overview_frame, text=overview_text, font=("Courier New", 10))
+        overview_label = ttk.Label(overview_frame, text=overview_text, font=("Courier New", 10),
+                                   justify="left", wraplength=940)
         overview_label.pack(anchor="w")
         
-        # Gefundene Spalten
-        if self.validation_details['found_columns']:
-            columns_frame = ttk.LabelFrame(scrollable_frame, text="✅ Gefundene Spalten", padding="10")
-            columns_frame.pack(fill=tk.X, pady=(0, 10))
-            
-            columns_text = ""
-            for i, col in enumerate(self.validation_details['found_columns'], 1):
-                columns_text += f"{i:2d}. '{col}'\n"
-            
-            columns_label = ttk.Label(columns_frame, text=columns_text.strip(), 
-                                    font=("Courier New", 9), justify="left")
-            columns_label.pack(anchor="w")
-        
-        # Fehlende Pflichtfelder
-        if self.validation_details['missing_required']:
-            missing_frame = ttk.LabelFrame(scrollable_frame, text="❌ Fehlende Pflichtfelder", padding="10")
-            missing_frame.pack(fill=tk.X, pady=(0, 10))
-            
-            missing_text = ""
-            for missing in self.validation_details['missing_required']:
-                missing_text += f"• {missing}\n"
-            
-            missing_label = ttk.Label(missing_frame, text=missing_text.strip(), 
-                                    font=("Courier New", 9), foreground="red", justify="left")
-            missing_label.pack(anchor="w")
-        
-        # Fehlende optionale Felder
-        if self.validation_details['missing_optional']:
-            optional_frame = ttk.LabelFrame(scrollable_frame, text="⚠️ Fehlende optionale Felder", padding="10")
-            optional_frame.pack(fill=tk.X, pady=(0, 10))
-            
-            optional_text = ""
-            for optional in self.validation_details['missing_optional']:
-                optional_text += f"• {optional}\n"
-            
-            optional_label = ttk.Label(optional_frame, text=optional_text.strip(), 
-                                     font=("Courier New", 9), foreground="orange", justify="left")
-            optional_label.pack(anchor="w")
-        
-        # Zeilen-Fehler
-        if self.validation_details['row_errors']:
-            errors_frame = ttk.LabelFrame(scrollable_frame, text="🚨 Fehler in Datensätzen", padding="10")
-            errors_frame.pack(fill=tk.X, pady=(0, 10))
-            
-            for error_info in self.validation_details['row_errors']:
-                if error_info.get('row', -1) >= 0:  # Zeilen-spezifische Fehler
-                    row_text = f"🔸 Zeile {error_info['row']} ({error_info.get('company', 'Unbekannt')}):\n"
-                    for error in error_info['errors']:
-                        row_text += f"   • {error}\n"
-                    row_text += "\n"
-                    
-                    row_label = ttk.Label(errors_frame, text=row_text.strip(), 
-                                        font=("Courier New", 9), foreground="red", justify="left")
-                    row_label.pack(anchor="w", pady=(0, 5))
-                else:  # Allgemeine Fehler
-                    general_text = f"🚨 {error_info['error']}\n"
-                    general_label = ttk.Label(errors_frame, text=general_text.strip(), 
-                                            font=("Courier New", 9), foreground="red", justify="left")
-                    general_label.pack(anchor="w", pady=(0, 5))
-        
-        # Preview Daten
-        if self.validation_details['preview_data']:
-            preview_frame = ttk.LabelFrame(scrollable_frame, text="👁️ Vorschau (erste Zeile)", padding="10")
-            preview_frame.pack(fill=tk.X, pady=(0, 10))
-            
-            preview_text = ""
-            for key, value in self.validation_details['preview_data'].items():
-                preview_text += f"{key}: {value}\n"
-            
-            preview_label = ttk.Label(preview_frame, text=preview_text.strip(), 
-                                    font=("Courier New", 9), justify="left")
-            preview_label.pack(anchor="w")
+        # Datenvorschau (virtualisiert) aus dem bereits eingelesenen DataFrame
+        preview = None
+        if details['found_columns'] and self.excel_file:
+            try:
+                df = load_excel(self.excel_file).dropna(how='all')
+                if not df.empty:
+                    preview_frame = ttk.LabelFrame(main_frame, text="👁️ Datenvorschau (Fehler rot, Hinweise gelb markiert)", padding="10")
+                    preview_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
+                    preview = VirtualTable(preview_frame, df,
+                                           error_rows=[e['row'] for e in details['row_errors'] if e.get('row', -1) >= 0],
+                                           warning_rows=[w['row'] for w in details.get('row_warnings', [])])
+                    preview.frame.pack(fill=tk.BOTH, expand=True)
+            except Exception as e:
+                ttk.Label(main_frame, text=f"⚠️ Vorschau nicht verfügbar: {e}", foreground="orange").pack(anchor="w")
+        
+        # Zeilen-Fehler und -Hinweise (Doppelklick springt in der Vorschau zur Zeile)
+        if details['row_errors']:
+            self._row_issue_list(main_frame, "🚨 Fehler in Datensätzen", "Fehler",
+                                 details['row_errors'], 'errors', preview)
+        if details.get('row_warnings'):
+            self._row_issue_list(main_frame, "⚠️ Hinweise zu Datensätzen", "Hinweis",
+                                 details['row_warnings'], 'warnings', preview)
         
         # Schließen Button
-        close_btn = ttk.Button(scrollable_frame, text="Schließen", 
+        close_btn = ttk.Button(main_frame, text="Schließen", 
                               command=details_window.destroy)
-        close_btn.pack(pady=20)
-        
-        # Canvas und Scrollbar packen
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-        
-        # Mausrad-Unterstützung
-        def _on_mousewheel(event):
-            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        canvas.bind("<MouseWheel>", _on_mousewheel)
+        close_btn.pack(pady=(10, 0))
+
+    def _row_issue_list(self, parent, title, heading, entries, key, preview):
+        """Liste der Zeilen-Fehler bzw. -Hinweise (entries aus row_errors/row_warnings)"""
+        issues_frame = ttk.LabelFrame(parent, text=title, padding="10")
+        issues_frame.pack(fill=tk.BOTH, pady=(0, 10))
+        
+        issues_tree = ttk.Treeview(issues_frame, columns=("row", "company", "issues"), show="headings", height=6)
+        issues_tree.heading("row", text="Zeile")
+        issues_tree.heading("company", text="Firma")
+        issues_tree.heading("issues", text=heading)
+        issues_tree.column("row", width=60, anchor="e", stretch=False)
+        issues_tree.column("company", width=220, stretch=False)
+        issues_tree.column("issues", width=600)
+        issues_scroll = ttk.Scrollbar(issues_frame, orient="vertical", command=issues_tree.yview)
+        issues_tree.configure(yscrollcommand=issues_scroll.set)
+        issues_tree.pack(side="left", fill=tk.BOTH, expand=True)
+        issues_scroll.pack(side="right", fill="y")
+        
+        for info in entries[:MAX_LISTED_ROW_ERRORS]:
+            if info.get('row', -1) >= 0:  # Zeilen-spezifisch
+                issues_tree.insert('', 'end', iid=str(info['row']),
+                                   values=(info['row'], info.get('company', 'Unbekannt'), '; '.join(info[key])))
+            else:  # Allgemeine Fehler
+                issues_tree.insert('', 'end', values=('', '', info['error']))
+        hidden = len(entries) - MAX_LISTED_ROW_ERRORS
+        if hidden > 0:
+            issues_tree.insert('', 'end', values=('', '', f"… {hidden} weitere Zeilen"))
+        
+        def _jump_to_row(event):
+            selected = issues_tree.focus()
+            if preview and selected.isdigit():
+                preview.scroll_to(int(selected))
+        issues_tree.bind("<Double-1>", _jump_to_row)
 
     def clear_pdf_file(self):
         """PDF-Datei entfernen"""
@@ -379,6 +567,8 @@ class FileSelectionGUI:
             
     def cancel(self):
         """Abbrechen"""
+        if self._validation_cancel:
+            self._validation_cancel.set()
         self.cancelled = True
         self.root.destroy()
         
@@ -401,7 +591,7 @@ def select_files_gui():
             print("❌ Dateiauswahl abgebrochen")
             return None, None
             
-        print(f"✅ Dateien gewählt:")
+        print("✅ Dateien gewählt:")
         print(f"   📊 Excel: {os.path.basename(excel_file)}")
         print(f"   📄 PDF: {os.path.basename(pdf_file) if pdf_file else 'Keine'}")
         
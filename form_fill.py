@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+⚡ FORM FILL - Gebündeltes Ausfüllen per JavaScript mit Read-Back
+Alle geplanten Werte einer Seite werden in einem execute_script gesetzt
+(inkl. input/change Events), danach in einem Aufruf zurückgelesen und
+verifiziert. Felder die programmatische Eingabe ablehnen, werden per
+Tastatur (clear/send_keys) nachgefüllt.
+"""
+import os
+
+from tracing import traced
+
+# 'batch' = JavaScript-Batch mit Fallback, 'keys' = nur Tastatur-Eingabe
+FILL_MODE = os.environ.get('IZ_FILL_MODE', 'batch').lower()
+
+# Setzt Werte über den nativen Setter, damit Frameworks (React/Vue) die Änderung sehen
+BATCH_FILL_JS = """
+var entries = arguments[0];
+for (var i = 0; i < entries.length; i++) {
+    var element = entries[i].element;
+    var value = entries[i].value;
+    try {
+        var prototype = element instanceof HTMLSelectElement ? HTMLSelectElement.prototype :
+            element instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+        var setter = Object.getOwnPropertyDescriptor(prototype, 'value').set;
+        if (element.focus) { element.focus(); }
+        setter.call(element, value);
+        element.dispatchEvent(new Event('input', {bubbles: true}));
+        element.dispatchEvent(new Event('change', {bubbles: true}));
+        if (element.blur) { element.blur(); }
+    } catch (e) {}
+}
+"""
+
+READ_BACK_JS = """
+return arguments[0].map(function (element) {
+    try { return element.value; } catch (e) { return null; }
+});
+"""
+
+
+def _fill_by_keys(entry):
+    """Klassische Tastatur-Eingabe für ein einzelnes Feld"""
+    element = entry['element']
+    element.clear()
+    element.send_keys(entry['value'])
+    return (element.get_attribute('value') or '') == entry['value']
+
+
+@traced('field_fill')
+def batch_fill(driver, entries):
+    """
+    Füllt alle Einträge [{'element', 'value', 'label'}] einer Seite.
+
+    Gibt (ausgefüllte Labels, Labels mit Tastatur-Fallback, fehlgeschlagene Labels) zurück.
+    """
+    if not entries:
+        return [], [], []
+
+    mismatched = entries
+    if FILL_MODE == 'batch':
+        elements = [entry['element'] for entry in entries]
+        driver.execute_script(BATCH_FILL_JS, [{'element': entry['element'], 'value': entry['value']} for entry in entries])
+        values = driver.execute_script(READ_BACK_JS, elements) or []
+        mismatched = [entry for entry, value in zip(entries, values) if value != entry['value']]
+        mismatched += entries[len(values):]
+
+    mismatched_ids = {id(entry) for entry in mismatched}
+    filled = [entry['label'] for entry in entries if id(entry) not in mismatched_ids]
+    fallback = []
+    failed = []
+
+    for entry in mismatched:
+        try:
+            if _fill_by_keys(entry):
+                (fallback if FILL_MODE == 'batch' else filled).append(entry['label'])
+            else:
+                failed.append(entry['label'])
+        except Exception as e:
+            print(f"   ⚠️ Tastatur-Eingabe fehlgeschlagen für {entry['label']}: {e}")
+            failed.append(entry['label'])
+
+    return filled, fallback, failed
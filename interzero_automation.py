@@ -8,38 +8,88 @@ Korrekte Selenium-Button-Implementierung für alle 4 Seiten
 import os
 import sys
 import time
-import base64
-import pandas as pd
 from datetime import datetime
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import Select, WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from selenium.webdriver.common.action_chains import ActionChains
+
+# Schwere Module (pandas, Selenium, requests, tkinter) erst bei der ersten Verwendung laden
+from lazy_imports import LazyModule, lazy_attribute
+pd = LazyModule('pandas')
+webdriver = LazyModule('selenium.webdriver')
+EC = LazyModule('selenium.webdriver.support.expected_conditions')
+selenium_exceptions = LazyModule('selenium.common.exceptions')
+requests = LazyModule('requests')
+By = lazy_attribute('selenium.webdriver.common.by', 'By')
+WebDriverWait = lazy_attribute('selenium.webdriver.support.ui', 'WebDriverWait')
+Options = lazy_attribute('selenium.webdriver.chrome.options', 'Options')
+ActionChains = lazy_attribute('selenium.webdriver.common.action_chains', 'ActionChains')
 
 # Imports der eigenen Module
 from database import InterzeroDatabase
-from file_selector_gui import select_files_gui
-from excel_validator import validate_excel_file, get_detailed_excel_validation
+from excel_validator import get_detailed_excel_validation, load_excel
+from radio_rules import snapshot_radios, radio_candidates
+from page_plan import get_page_plan, resolve_row_values, FIELD_DESCRIPTIONS
+from selector_stats import SelectorRanker, page_fingerprint
+from form_fill import batch_fill
+from option_index import get_option_index, select_option, COUNTRY_ALIASES, SALUTATION_ALIASES
+from workflow_engine import WorkflowEngine, detect_page_from_url
+import deadline as budget
+from deadline import Deadline, DeadlineExceeded, wait_timeout, ROW_BUDGET_SECONDS
+from retry_policy import RetryPolicy
+from tracing import Tracer, activate, get_tracer, span, print_span_summary
+from driver_instrumentation import INSTRUMENT, instrument_driver, attribute_to, command_stats
+from browser_metrics import capture_page_metrics, print_page_metrics_report, reset_cdp_metrics
+from sampling_profiler import PROFILE, SamplingProfiler
+from event_log import log, DEBUG
+from run_monitor import start_monitor
+from batch_queue import Workbook, BrowserSession, batch_arguments, discover_workbooks, build_queue, print_workbook_summary
+from pdf_index import PdfIndex, index_folders, print_missing_documents
+from evidence_pipeline import ScreenshotPipeline
+from dom_evidence import DomEvidence
+from run_report import RunReporter
+from result_writer import ResultWriter
 
-# Globale Variablen
-db = InterzeroDatabase()
+# Globale Variablen (Datenbank & Co. werden erst beim ersten Zugriff angelegt)
+_db = None
+_selector_ranker = None
+_capsolver_api_key = None
 current_submission_id = None
+last_row_reexecuted_pages = []  # (Seite, Fehlerklasse) der zuletzt verarbeiteten Zeile
+last_row_failure_reason = None  # Fehlergrund der zuletzt verarbeiteten Zeile (für run_report)
 
-# CapSolver API Integration (optional)
-try:
-    from capsolver_config import CAPSOLVER_API_KEY
-    CAPSOLVER_AVAILABLE = bool(CAPSOLVER_API_KEY and CAPSOLVER_API_KEY != "YOUR_CAPSOLVER_API_KEY_HERE")
-    if CAPSOLVER_AVAILABLE:
-        import requests
-        print("✅ CapSolver API verfügbar")
-    else:
-        print("⚠️ CapSolver API nicht konfiguriert - verwende Fallback")
-except ImportError:
-    CAPSOLVER_AVAILABLE = False
-    print("⚠️ CapSolver-Konfiguration nicht gefunden")
+def get_db():
+    """Datenbank beim ersten Zugriff öffnen/anlegen"""
+    global _db
+    if _db is None:
+        _db = InterzeroDatabase()
+    return _db
+
+def get_selector_ranker():
+    global _selector_ranker
+    if _selector_ranker is None:
+        _selector_ranker = SelectorRanker(get_db())
+    return _selector_ranker
+
+def get_capsolver_api_key():
+    """CapSolver API Integration (optional) - Konfiguration beim ersten Captcha prüfen; '' wenn nicht verfügbar"""
+    global _capsolver_api_key
+    if _capsolver_api_key is None:
+        try:
+            from capsolver_config import CAPSOLVER_API_KEY
+            configured = bool(CAPSOLVER_API_KEY and CAPSOLVER_API_KEY != "YOUR_CAPSOLVER_API_KEY_HERE")
+            _capsolver_api_key = CAPSOLVER_API_KEY if configured else ''
+            if configured:
+                print("✅ CapSolver API verfügbar")
+            else:
+                print("⚠️ CapSolver API nicht konfiguriert - verwende Fallback")
+        except ImportError:
+            _capsolver_api_key = ''
+            print("⚠️ CapSolver-Konfiguration nicht gefunden")
+    return _capsolver_api_key
+
+# Screenshots werden im Hintergrund verkleinert und gespeichert (siehe evidence_pipeline.py)
+screenshots = ScreenshotPipeline(get_db)
+
+# DOM-Snapshots der ausgefüllten Seiten, komprimiert mit gemeinsamem Wörterbuch (siehe dom_evidence.py)
+dom_evidence = DomEvidence(get_db)
 
 def setup_browser():
     """Browser mit automatischem ChromeDriver-Management starten"""
@@ -91,7 +141,8 @@ def setup_browser():
 
 def solve_captcha_with_capsolver(driver):
     """CapSolver API für Captcha-Lösung"""
-    if not CAPSOLVER_AVAILABLE:
+    CAPSOLVER_API_KEY = get_capsolver_api_key()
+    if not CAPSOLVER_API_KEY:
         return False
         
     try:
@@ -108,7 +159,7 @@ def solve_captcha_with_capsolver(driver):
             }
         }
         
-        response = requests.post("https://api.capsolver.com/createTask", json=task_data, timeout=30)
+        response = requests.post("https://api.capsolver.com/createTask", json=task_data, timeout=wait_timeout(30))
         if response.status_code != 200:
             return False
             
@@ -119,12 +170,15 @@ def solve_captcha_with_capsolver(driver):
         task_id = task_result.get("taskId")
         
         for _ in range(30):
+            if budget.current() is not None and budget.current().expired():
+                print("⏱️ Zeitbudget erschöpft - Captcha-Polling abgebrochen")
+                break
             check_data = {
                 "clientKey": CAPSOLVER_API_KEY,
                 "taskId": task_id
             }
             
-            check_response = requests.post("https://api.capsolver.com/getTaskResult", json=check_data, timeout=15)
+            check_response = requests.post("https://api.capsolver.com/getTaskResult", json=check_data, timeout=wait_timeout(15))
             if check_response.status_code != 200:
                 continue
                 
@@ -207,7 +261,7 @@ def handle_login_process(driver, submission_id):
                 time.sleep(0.5)
                 print("✅ Login erfolgreich!")
                 
-                db.log_http_request(
+                get_db().log_http_request(
                     submission_id, 
                     driver.current_url, 
                     "POST",
@@ -226,38 +280,13 @@ def handle_login_process(driver, submission_id):
 def detect_current_page(driver):
     """🚀 ULTRA-SCHNELLE Seitenerkennung - OPTIMIERT für Performance"""
     try:
-        current_url = driver.current_url.lower()
-        page_title = driver.title.lower()
-        
         print(f"⚡ Schnelle Seitenerkennung - URL: {driver.current_url}")
         
-        # Login-Seite erkennen - SOFORT via URL/Titel
-        if 'login' in current_url or 'login' in page_title:
-            return "LOGIN"
-        
-        # Dashboard erkennen - SOFORT via URL/Titel (MUSS VOR MEMBERSHIP KOMMEN!)
-        if ('dashboard' in current_url or 
-            ('dashboard' in page_title and 'new' not in page_title)):
-            print("✅ DASHBOARD erkannt (URL/Titel)")
-            return "DASHBOARD"
-        
-        # MEMBERSHIP-FORM ERKENNUNG - ULTRA-SCHNELL via URL
-        if 'membership/form' in current_url:
-            if '/1' in current_url:
-                print("✅ MEMBERSHIP Seite 1 (URL)")
-                return "MEMBERSHIP_PAGE_1"
-            elif '/2' in current_url:
-                print("✅ MEMBERSHIP Seite 2 (URL)")
-                return "MEMBERSHIP_PAGE_2"
-            elif '/3' in current_url:
-                print("✅ MEMBERSHIP Seite 3 (URL)")
-                return "MEMBERSHIP_PAGE_3"
-            elif '/4' in current_url:
-                print("✅ MEMBERSHIP Seite 4 (URL)")
-                return "MEMBERSHIP_PAGE_4"
-            else:
-                print("✅ MEMBERSHIP FORM (URL)")
-                return "MEMBERSHIP_FORM"
+        # URL/Titel-Erkennung (gleiche Regeln wie die Übergangs-Vorhersage der Workflow-Engine)
+        page = detect_page_from_url(driver.current_url, driver.title)
+        if page:
+            print(f"✅ {page} erkannt (URL/Titel)")
+            return page
         
         # SCHNELLE Fallback-Erkennung nur bei Bedarf
         # Nur wenn URL-basierte Erkennung fehlschlägt, dann DOM-Checks
@@ -314,6 +343,42 @@ def detect_current_page(driver):
         print(f"❌ Seitenerkennung Fehler: {e}")
         return "ERROR"
 
+# In-Page-Suche nach Dropdown-/Pfeil-Elementen: ein Script-Aufruf statt
+# is_displayed/.text/get_attribute für jedes Element der Seite
+DROPDOWN_CANDIDATES_JS = """
+var limit = arguments[0] || 10;
+var candidates = [];
+var elements = document.body ? document.body.getElementsByTagName('*') : [];
+for (var i = 0; i < elements.length; i++) {
+    var element = elements[i];
+    var className = (element.getAttribute('class') || '').toLowerCase();
+    var text = element.textContent || '';
+    var hasArrow = text.indexOf('\u25BC') !== -1;
+    var hasDropdownClass = className.indexOf('dropdown') !== -1;
+    if (!hasArrow && !hasDropdownClass) { continue; }
+    if (element.getClientRects().length === 0) { continue; }
+    var style = window.getComputedStyle(element);
+    if (style.visibility === 'hidden' || style.display === 'none') { continue; }
+
+    var ownArrow = false;
+    for (var n = element.firstChild; n; n = n.nextSibling) {
+        if (n.nodeType === 3 && n.nodeValue.indexOf('\u25BC') !== -1) { ownArrow = true; break; }
+    }
+    if (hasArrow && !ownArrow && !hasDropdownClass) { continue; }
+
+    var tag = element.tagName.toLowerCase();
+    var score = 0;
+    if (ownArrow) { score += 4; }
+    if (className.indexOf('dropdown-arrow') !== -1 || className.indexOf('dropdown-toggle') !== -1) { score += 3; }
+    else if (hasDropdownClass) { score += 1; }
+    if (tag === 'button' || tag === 'a' || element.getAttribute('role') === 'button' ||
+        element.getAttribute('data-toggle') === 'dropdown') { score += 2; }
+    candidates.push({element: element, score: score, length: text.length});
+}
+candidates.sort(function (a, b) { return (b.score - a.score) || (a.length - b.length); });
+return candidates.slice(0, limit).map(function (candidate) { return candidate.element; });
+"""
+
 def navigate_to_correct_page(driver, target_page, submission_id):
     """Navigiert zur korrekten Zielseite falls auf falscher Seite"""
     current_page = detect_current_page(driver)
@@ -342,7 +407,8 @@ def navigate_to_correct_page(driver, target_page, submission_id):
             ]
             
             dropdown_clicked = False
-            for selector in dropdown_selectors:
+            fingerprint = page_fingerprint(driver)
+            for selector in get_selector_ranker().order("navigate.dropdown", dropdown_selectors, fingerprint):
                 try:
                     dropdown_elements = driver.find_elements(By.CSS_SELECTOR, selector)
                     for dropdown in dropdown_elements:
@@ -353,24 +419,26 @@ def navigate_to_correct_page(driver, target_page, submission_id):
                                 dropdown_clicked = True
                                 time.sleep(0.5)
                                 break
+                    get_selector_ranker().record("navigate.dropdown", selector, dropdown_clicked, fingerprint)
                     if dropdown_clicked:
                         break
                 except Exception as e:
                     print(f"   ⚠️ {selector} fehlgeschlagen: {e}")
+                    get_selector_ranker().record("navigate.dropdown", selector, False, fingerprint)
                     continue
             
-            # Falls kein Dropdown gefunden, versuche alle klickbaren Elemente mit Pfeil
+            # Falls kein Dropdown gefunden, versuche sichtbare Elemente mit Pfeil (in-page gerankt)
             if not dropdown_clicked:
-                print("🔍 Fallback: Suche alle Elemente mit Pfeil-Symbol...")
-                all_elements = driver.find_elements(By.CSS_SELECTOR, '*')
-                for element in all_elements:
+                print("🔍 Fallback: Suche sichtbare Elemente mit Pfeil-Symbol...")
+                arrow_elements = driver.execute_script(DROPDOWN_CANDIDATES_JS, 10) or []
+                print(f"   📋 {len(arrow_elements)} Kandidaten gefunden")
+                for element in arrow_elements:
                     try:
-                        if element.is_displayed() and ('▼' in element.text or 'dropdown' in element.get_attribute('class').lower()):
-                            if safe_click_button(element, element, "Pfeil-Element"):
-                                print("✅ Dropdown via Pfeil-Element geöffnet!")
-                                dropdown_clicked = True
-                                time.sleep(0.5)
-                                break
+                        if safe_click_button(driver, element, "Pfeil-Element"):
+                            print("✅ Dropdown via Pfeil-Element geöffnet!")
+                            dropdown_clicked = True
+                            time.sleep(0.5)
+                            break
                     except:
                         continue
             
@@ -441,7 +509,7 @@ def navigate_to_correct_page(driver, target_page, submission_id):
                     print("✅ Erfolgreich zu Packaging-Formular navigiert!")
                     
                     # Navigation in Datenbank loggen
-                    db.log_http_request(
+                    get_db().log_http_request(
                         submission_id, 
                         driver.current_url, 
                         "GET",
@@ -530,7 +598,7 @@ def page_1_select_packaging(driver, submission_id):
     print("📦 SEITE 1: Suche nach Packaging/Paper Option...")
     
     try:
-        wait = WebDriverWait(driver, 5)  # Optimiert von 15 auf 5
+        wait = WebDriverWait(driver, wait_timeout(5))  # Optimiert von 15 auf 5
         
         # Warte bis Seite vollständig geladen ist
         wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
@@ -552,16 +620,14 @@ def page_1_select_packaging(driver, submission_id):
                 class_attr = radio.get_attribute('class') or ''
                 is_displayed = radio.is_displayed()
                 is_enabled = radio.is_enabled()
-                is_selected = radio.is_selected()
                 
-                print(f"   Radio {i+1}:")
-                print(f"     - value: '{value}'")
-                print(f"     - name: '{name}'")
-                print(f"     - id: '{id_attr}'")
-                print(f"     - class: '{class_attr}'")
-                print(f"     - displayed: {is_displayed}")
-                print(f"     - enabled: {is_enabled}")
-                print(f"     - selected: {is_selected}")
+                # is_selected wird nur für den Debug-Dump gebraucht - kein Round-Trip im Quiet-Modus
+                if log.is_enabled(DEBUG):
+                    log.debug("page_1.radio",
+                              "   Radio {index}: value='{value}' name='{name}' id='{id}' class='{cls}' "
+                              "displayed={displayed} enabled={enabled} selected={selected}",
+                              index=i + 1, value=value, name=name, id=id_attr, cls=class_attr,
+                              displayed=is_displayed, enabled=is_enabled, selected=radio.is_selected())
                 
                 # Erweiterte Keyword-Suche
                 all_text = f"{value} {name} {id_attr} {class_attr}".lower()
@@ -569,17 +635,17 @@ def page_1_select_packaging(driver, submission_id):
                 
                 for keyword in packaging_keywords:
                     if keyword in all_text:
-                        print(f"     ✅ KEYWORD MATCH: '{keyword}' gefunden!")
+                        log.debug("page_1.keyword_match", "     ✅ KEYWORD MATCH: '{keyword}' gefunden!", keyword=keyword)
                         if is_displayed and is_enabled:
                             selected_radio = radio
-                            print(f"     🎯 AUSGEWÄHLT für Klick!")
+                            log.info("page_1.radio_selected", "     🎯 Radio {index} AUSGEWÄHLT für Klick!", index=i + 1)
                             break
                 
                 if selected_radio:
                     break
                     
             except Exception as e:
-                print(f"     ❌ Fehler bei Radio {i+1}: {e}")
+                log.warning("page_1.radio_error", "     ❌ Fehler bei Radio {index}: {error}", index=i + 1, error=e)
                 continue
         
         # 2. Packaging Radio-Button klicken
@@ -687,11 +753,13 @@ def page_1_select_packaging(driver, submission_id):
                     continue
                     
                 text_content = element.text.lower()
-                tag_name = element.tag_name.lower()
                 
                 if any(keyword in text_content for keyword in ['packaging', 'paper', 'waste', 'material']):
                     packaging_elements.append(element)
-                    print(f"📦 Packaging Element gefunden: {tag_name} - '{element.text[:50]}'")
+                    # tag_name/text sind weitere Round-Trips - nur für den Debug-Dump
+                    if log.is_enabled(DEBUG):
+                        log.debug("page_1.packaging_element", "📦 Packaging Element gefunden: {tag} - '{text}'",
+                                  tag=element.tag_name.lower(), text=element.text[:50])
             except:
                 continue
         
@@ -718,7 +786,7 @@ def page_1_submit(driver, submission_id):
     print("🚀 SEITE 1: Suche Submit-Button...")
     
     try:
-        wait = WebDriverWait(driver, 5)  # Optimiert von 10 auf 5
+        wait = WebDriverWait(driver, wait_timeout(5))  # Optimiert von 10 auf 5
         
         # Submit-Button Strategien
         submit_selectors = [
@@ -739,7 +807,7 @@ def page_1_submit(driver, submission_id):
                     print(f"✅ SEITE 1: Submit-Button geklickt: {selector}")
                     time.sleep(0.5)
                     
-                    db.log_http_request(
+                    get_db().log_http_request(
                         submission_id, 
                         driver.current_url, 
                         "POST",
@@ -747,7 +815,7 @@ def page_1_submit(driver, submission_id):
                         form_data={"step": "page_1_submitted"}
                     )
                     return True
-            except TimeoutException:
+            except selenium_exceptions.TimeoutException:
                 continue
             except Exception as e:
                 print(f"   ⚠️ {selector} fehlgeschlagen: {e}")
@@ -780,7 +848,6 @@ def handle_membership_page_1(driver, submission_id, row_data):
     print("🆕 MEMBERSHIP SEITE 1: Country & Company ausfüllen...")
     
     try:
-        wait = WebDriverWait(driver, 15)  # Erhöht von 10 auf 15 für Form1
         record = row_data.to_dict() if hasattr(row_data, 'to_dict') else row_data
         
         print(f"📍 URL: {driver.current_url}")
@@ -808,16 +875,12 @@ def handle_membership_page_1(driver, submission_id, row_data):
                 try:
                     country_select_element = driver.find_element(By.CSS_SELECTOR, selector)
                     if country_select_element.is_displayed():
-                        country_select = Select(country_select_element)
-                        
-                        # Deutschland-Erkennung
-                        for option in country_select.options:
-                            option_text = option.text.strip().lower()
-                            if any(pattern in option_text for pattern in ['germany', 'deutschland', 'de']):
-                                country_select.select_by_visible_text(option.text)
-                                print(f"✅ Country ausgewählt: {option.text}")
-                                fields_filled += 1
-                                break
+                        # Index-Lookup (Deutsch/Englisch/ISO) - Fallback Deutschland
+                        country_index = get_option_index(driver, country_select_element, COUNTRY_ALIASES)
+                        option = country_index.lookup(country) or country_index.lookup('germany')
+                        if option and select_option(driver, country_select_element, option):
+                            print(f"✅ Country ausgewählt: {option[0]}")
+                            fields_filled += 1
                         break
                 except Exception as e:
                     print(f"   ❌ {selector} fehlgeschlagen: {e}")
@@ -861,7 +924,6 @@ def handle_membership_page_2(driver, submission_id, row_data):
     print("🆕 MEMBERSHIP SEITE 2: Business Activity & Sub-Activity auswählen...")
     
     try:
-        wait = WebDriverWait(driver, 5)  # Reduziert von 10 auf 5
         record = row_data.to_dict() if hasattr(row_data, 'to_dict') else row_data
         
         print(f"📍 URL: {driver.current_url}")
@@ -889,18 +951,19 @@ def handle_membership_page_2(driver, submission_id, row_data):
             ''
         )
         
-        # ADDITIONAL DEBUG: Alle Excel-Spalten anzeigen
-        print(f"🔍 ALLE EXCEL-SPALTEN (DEBUG):")
-        for key, value in record.items():
-            value_str = str(value or '').strip()
-            if value_str:  # Nur nicht-leere Werte
-                print(f"   '{key}': '{value_str}'")
-        
-        print(f"🔍 SPEZIFISCH SUB-ACTIVITY SPALTEN:")
-        for key, value in record.items():
-            if 'sub' in key.lower() or ('activity' in key.lower() and 'business' not in key.lower()):
+        # ADDITIONAL DEBUG: Alle Excel-Spalten anzeigen (nur mit IZ_LOG_LEVEL=debug)
+        if log.is_enabled(DEBUG):
+            log.debug("page_2.excel_columns", "🔍 ALLE EXCEL-SPALTEN (DEBUG):")
+            for key, value in record.items():
                 value_str = str(value or '').strip()
-                print(f"   '{key}': '{value_str}'")
+                if value_str:  # Nur nicht-leere Werte
+                    log.debug("page_2.excel_column", "   '{key}': '{value}'", key=key, value=value_str)
+            
+            log.debug("page_2.sub_activity_columns", "🔍 SPEZIFISCH SUB-ACTIVITY SPALTEN:")
+            for key, value in record.items():
+                if 'sub' in key.lower() or ('activity' in key.lower() and 'business' not in key.lower()):
+                    log.debug("page_2.sub_activity_column", "   '{key}': '{value}'",
+                              key=key, value=str(value or '').strip())
         
         # Fallback für Business Activity
         if not business_activity and business_activity_alt:
@@ -938,41 +1001,26 @@ def handle_membership_page_2(driver, submission_id, row_data):
             try:
                 business_select_element = driver.find_element(By.CSS_SELECTOR, selector)
                 if business_select_element.is_displayed():
-                    business_select = Select(business_select_element)
+                    business_index = get_option_index(driver, business_select_element)
                     
                     # Versuche Excel-Wert zu finden
-                    selected = False
-                    if business_activity:
-                        for option in business_select.options:
-                            if business_activity.lower() in option.text.lower():
-                                business_select.select_by_visible_text(option.text)
-                                print(f"✅ Business Activity (Excel-Match): {option.text}")
-                                fields_filled += 1
-                                selected = True
-                                time.sleep(0.3)
-                                break
+                    option = business_index.lookup(business_activity) if business_activity else None
+                    reason = "Excel-Match"
                     
                     # Fallback: Manufacturing/Packaging Option
-                    if not selected:
-                        for option in business_select.options:
-                            option_text = option.text.lower()
-                            if 'manufacturing' in option_text or 'packaging' in option_text:
-                                business_select.select_by_visible_text(option.text)
-                                print(f"✅ Business Activity (Fallback): {option.text}")
-                                fields_filled += 1
-                                selected = True
-                                time.sleep(0.3)
-                                break
+                    if not option:
+                        option = business_index.find_containing(['manufacturing', 'packaging'])
+                        reason = "Fallback"
                     
                     # Letzter Fallback: Erste nicht-leere Option
-                    if not selected:
-                        for option in business_select.options[1:]:  # Skip erste leere Option
-                            if option.text.strip():
-                                business_select.select_by_visible_text(option.text)
-                                print(f"✅ Business Activity (Auto): {option.text}")
-                                fields_filled += 1
-                                time.sleep(0.3)
-                                break
+                    if not option:
+                        option = business_index.first()
+                        reason = "Auto"
+                    
+                    if option and select_option(driver, business_select_element, option):
+                        print(f"✅ Business Activity ({reason}): {option[0]}")
+                        fields_filled += 1
+                        time.sleep(0.3)  # Sub-Activity wird dynamisch nachgeladen
                     break
             except Exception as e:
                 print(f"   ❌ {selector} fehlgeschlagen: {e}")
@@ -1010,10 +1058,10 @@ def handle_membership_page_2(driver, submission_id, row_data):
                 
                 for sub_select_element in sub_select_elements:
                     if sub_select_element.is_displayed():
-                        sub_select = Select(sub_select_element)
-                        element_name = sub_select_element.get_attribute('name') or sub_select_element.get_attribute('id') or 'unknown'
-                        print(f"   📋 Gefundenes Sub-Activity Dropdown: {element_name}")
-                        print(f"   📝 Verfügbare Optionen: {[opt.text.strip() for opt in sub_select.options if opt.text.strip()]}")
+                        sub_index = get_option_index(driver, sub_select_element)
+                        print("   📋 Gefundenes Sub-Activity Dropdown")
+                        log.debug("page_2.sub_activity_options", "   📝 Verfügbare Optionen: {options}",
+                                  options=[text for text, value in sub_index.options])
                         
                         # Versuche Excel Sub-Activity zu finden
                         selected = False
@@ -1027,31 +1075,33 @@ def handle_membership_page_2(driver, submission_id, row_data):
                             best_score = 0
                             all_options = []
                             
-                            # Sammle alle verfügbaren Optionen
-                            for option in sub_select.options:
-                                option_text = option.text.strip()
-                                if option_text and option_text.lower() != 'please select' and 'select' not in option_text.lower():
+                            # Sammle alle verfügbaren Optionen (aus dem Index, kein WebDriver-Zugriff)
+                            for option_text, option in sub_index.options:
+                                if option_text.lower() != 'please select' and 'select' not in option_text.lower():
                                     all_options.append((option, option_text))
                             
-                            print(f"   📋 Verfügbare Dropdown-Optionen: {[opt[1] for opt in all_options]}")
+                            log.debug("page_2.sub_activity_candidates", "   📋 Verfügbare Dropdown-Optionen: {options}",
+                                      options=[opt[1] for opt in all_options])
                             
                             # 1. EXAKTER MATCH (höchste Priorität)
                             for option, option_text in all_options:
                                 if option_text.lower() == sub_activity.lower():
-                                    sub_select.select_by_visible_text(option_text)
-                                    print(f"✅ Sub-Activity (EXAKTER MATCH): '{option_text}' für Excel-Wert: '{sub_activity}'")
-                                    fields_filled += 1
-                                    selected = True
-                                    sub_activity_found = True
-                                    time.sleep(0.5)
+                                    if select_option(driver, sub_select_element, (option_text, option)):
+                                        print(f"✅ Sub-Activity (EXAKTER MATCH): '{option_text}' für Excel-Wert: '{sub_activity}'")
+                                        fields_filled += 1
+                                        selected = True
+                                        sub_activity_found = True
+                                        time.sleep(0.5)
+                                    else:
+                                        print(f"⚠️ Sub-Activity '{option_text}' wurde vom Dropdown nicht übernommen")
                                     break
                             
                             # 2. ERWEITERTE FUZZY MATCHING mit Substring und Wort-Analyse
                             if not selected:
                                 excel_text = sub_activity.lower().strip()
                                 excel_words = set(word.lower() for word in sub_activity.split() if len(word) > 2)
-                                print(f"   🔍 Excel-Text: '{excel_text}'")
-                                print(f"   🔍 Excel-Wörter: {excel_words}")
+                                log.debug("page_2.sub_activity_query", "   🔍 Excel-Text: '{text}'\n   🔍 Excel-Wörter: {words}",
+                                          text=excel_text, words=excel_words)
                                 
                                 for option, option_text in all_options:
                                     option_lower = option_text.lower().strip()
@@ -1126,7 +1176,8 @@ def handle_membership_page_2(driver, submission_id, row_data):
                                     score += unique_match_bonus
                                     
                                     if score > 0:
-                                        print(f"   📊 Option '{option_text}': Score {score:.3f} | {', '.join(details)}")
+                                        log.debug("page_2.sub_activity_score", "   📊 Option '{option}': Score {score:.3f} | {details}",
+                                                  option=option_text, score=score, details=', '.join(details))
                                         
                                         if score > best_score:
                                             best_score = score
@@ -1135,31 +1186,30 @@ def handle_membership_page_2(driver, submission_id, row_data):
                                 # Wähle beste Übereinstimmung (gesenkter Threshold auf 0.25)
                                 if best_match and best_score >= 0.25:
                                     option, option_text = best_match
-                                    sub_select.select_by_visible_text(option_text)
-                                    print(f"✅ Sub-Activity (ERWEITERTE FUZZY MATCH Score: {best_score:.3f}): '{option_text}' für Excel-Wert: '{sub_activity}'")
-                                    fields_filled += 1
-                                    selected = True
-                                    sub_activity_found = True
-                                    time.sleep(0.5)
+                                    if select_option(driver, sub_select_element, (option_text, option)):
+                                        print(f"✅ Sub-Activity (ERWEITERTE FUZZY MATCH Score: {best_score:.3f}): '{option_text}' für Excel-Wert: '{sub_activity}'")
+                                        fields_filled += 1
+                                        selected = True
+                                        sub_activity_found = True
+                                        time.sleep(0.5)
+                                    else:
+                                        print(f"⚠️ Sub-Activity '{option_text}' wurde vom Dropdown nicht übernommen")
                                 else:
                                     print(f"⚠️ ERWEITERTE FUZZY MATCHING: Keine ausreichende Übereinstimmung gefunden (bester Score: {best_score:.3f})")
                                     print(f"   💡 Benötigt mindestens Score 0.25 für Auswahl")
                         
                         # 4. FALLBACK nur wenn KEIN Excel-Wert vorhanden
                         if not selected and not sub_activity:
-                            for option in sub_select.options[1:]:  # Skip erste leere Option
-                                if option.text.strip():
-                                    sub_select.select_by_visible_text(option.text)
-                                    print(f"✅ Sub-Activity (FALLBACK - kein Excel-Wert): '{option.text}'")
-                                    fields_filled += 1
-                                    selected = True
-                                    time.sleep(0.5)
-                                    break
+                            option = sub_index.first()
+                            if option and select_option(driver, sub_select_element, option):
+                                print(f"✅ Sub-Activity (FALLBACK - kein Excel-Wert): '{option[0]}'")
+                                fields_filled += 1
+                                selected = True
                         
                         # 5. WARNUNG bei Excel-Wert aber keine Übereinstimmung
                         if not selected and sub_activity:
                             print(f"⚠️ WARNUNG: Sub-Activity Excel-Wert '{sub_activity}' konnte in Dropdown nicht gefunden werden!")
-                            print(f"   📋 Verfügbare Optionen waren: {[opt.text.strip() for opt in sub_select.options if opt.text.strip()]}")
+                            print(f"   📋 Verfügbare Optionen waren: {[text for text, value in sub_index.options]}")
                             
                         break  # Dropdown gefunden und verarbeitet
                         
@@ -1174,56 +1224,16 @@ def handle_membership_page_2(driver, submission_id, row_data):
             print(f"❌ FEHLER: Kein Sub-Activity Dropdown gefunden! Excel-Wert: '{sub_activity}'")
         
         # 3. RADIO BUTTONS basierend auf Excel-Daten - DYNAMISCHE VERARBEITUNG
-        radio_buttons = driver.find_elements(By.CSS_SELECTOR, 'input[type="radio"]')
-        print(f"📻 {len(radio_buttons)} Radio-Buttons gefunden (initial)")
+        # Ein Snapshot (1 Script-Aufruf) statt get_attribute/is_displayed pro Radio
+        radio_snapshot = snapshot_radios(driver)
+        print(f"📻 {len(radio_snapshot)} Radio-Buttons gefunden (initial)")
         
         # PHASE 1: Erste Radio-Button-Runde (statische Buttons)
-        radio_info = []
-        for i, radio in enumerate(radio_buttons):
-            try:
-                if radio.is_displayed() and radio.is_enabled():
-                    radio_value = (radio.get_attribute('value') or '').lower()
-                    radio_name = (radio.get_attribute('name') or '').lower()
-                    radio_id = (radio.get_attribute('id') or '').lower()
-                    
-                    # Finde das zugehörige Label
-                    label_text = ""
-                    try:
-                        # Versuche Label über 'for' Attribut zu finden
-                        if radio_id:
-                            label = driver.find_element(By.CSS_SELECTOR, f'label[for="{radio_id}"]')
-                            label_text = label.text.strip()
-                    except:
-                        try:
-                            # Versuche Parent-Element zu finden
-                            parent = radio.find_element(By.XPATH, "./..")
-                            label_text = parent.text.strip()
-                        except:
-                            try:
-                                # Versuche nächstes Sibling-Element
-                                next_element = radio.find_element(By.XPATH, "./following-sibling::*[1]")
-                                label_text = next_element.text.strip()
-                            except:
-                                label_text = "Unbekannt"
-                    
-                    radio_info.append({
-                        'index': i,
-                        'element': radio,
-                        'value': radio_value,
-                        'name': radio_name,
-                        'id': radio_id,
-                        'label': label_text.lower(),
-                        'selected': radio.is_selected()
-                    })
-                    
-                    print(f"📻 Radio {i+1}:")
-                    print(f"   - Value: '{radio_value}'")
-                    print(f"   - Name: '{radio_name}'")
-                    print(f"   - ID: '{radio_id}'")
-                    print(f"   - Label: '{label_text}'")
-                    print(f"   - Selected: {radio.is_selected()}")
-            except Exception as e:
-                print(f"   ⚠️ Radio {i+1} Analyse fehlgeschlagen: {e}")
+        radio_info = [radio for radio in radio_snapshot if radio['displayed'] and radio['enabled']]
+        for radio_data in radio_info:
+            log.debug("page_2.radio", "📻 Radio {index}: value='{value}', name='{name}', id='{id}', label='{label}', selected={selected}",
+                      index=radio_data['index'] + 1, value=radio_data['value'], name=radio_data['name'],
+                      id=radio_data['id'], label=radio_data['label'], selected=radio_data['selected'])
         
         # INTELLIGENTE RADIO-BUTTON-AUSWAHL basierend auf ECHTEN Excel-Daten
         radio_clicked = 0
@@ -1236,43 +1246,11 @@ def handle_membership_page_2(driver, submission_id, row_data):
         
         # PHASE 1: Erste Radio-Button-Auswahl (trigger für dynamische Inhalte)
         first_phase_clicked = False
-        for radio_data in radio_info:
+        # Kandidaten in DOM-Reihenfolge - scheitern alle Klick-Strategien, kommt der nächste dran
+        for radio_data, reason in radio_candidates(radio_info, online_store=online_store)['online_store']:
             try:
-                should_select = False
-                reason = ""
-                
-                # STRATEGIE 1: Online Store Ja/Nein - HÖCHSTE PRIORITÄT
-                if online_store and not first_phase_clicked:
-                    radio_text = f"{radio_data['value']} {radio_data['name']} {radio_data['id']} {radio_data['label']}"
-                    
-                    if online_store in ['yes', 'ja', 'true', '1', 'x', 'y']:
-                        # Prüfe ob es sich um Online Store YES handelt
-                        if any(keyword in radio_text for keyword in ['online', 'store', 'shop', 'ecommerce', 'e-commerce']):
-                            if any(yes_keyword in radio_text for yes_keyword in ['yes', 'ja', 'true']):
-                                if not any(no_keyword in radio_text for no_keyword in ['no', 'nein', 'false', 'not', 'kein']):
-                                    should_select = True
-                                    reason = f"JA-Option für Online Store (Excel: '{online_store}')"
-                        # Fallback: Allgemeine YES-Option wenn Online Store Keywords vorhanden
-                        elif not should_select and any(yes_keyword in radio_text for yes_keyword in ['yes', 'ja', 'true']):
-                            if not any(no_keyword in radio_text for no_keyword in ['no', 'nein', 'false', 'not', 'kein']):
-                                should_select = True
-                                reason = f"JA-Option (Online Store Excel: '{online_store}')"
-                                
-                    elif online_store in ['no', 'nein', 'false', '0', 'n']:
-                        # Prüfe ob es sich um Online Store NO handelt
-                        if any(keyword in radio_text for keyword in ['online', 'store', 'shop', 'ecommerce', 'e-commerce']):
-                            if any(no_keyword in radio_text for no_keyword in ['no', 'nein', 'false', 'not', 'kein']):
-                                if not any(yes_keyword in radio_text for yes_keyword in ['yes', 'ja', 'true']):
-                                    should_select = True
-                                    reason = f"NEIN-Option für Online Store (Excel: '{online_store}')"
-                        # Fallback: Allgemeine NO-Option wenn Online Store Keywords vorhanden
-                        elif not should_select and any(no_keyword in radio_text for no_keyword in ['no', 'nein', 'false', 'not', 'kein']):
-                            if not any(yes_keyword in radio_text for yes_keyword in ['yes', 'ja', 'true']):
-                                should_select = True
-                                reason = f"NEIN-Option (Online Store Excel: '{online_store}')"
-                
                 # KLICKEN nur wenn Excel-Daten es rechtfertigen
-                if should_select and not radio_data['selected']:
+                if not radio_data['selected']:
                     print(f"\n🎯 PHASE 1 AUSWAHL: Radio {radio_data['index']+1}")
                     print(f"   📋 Grund: {reason}")
                     print(f"   🏷️ Label: '{radio_data['label']}'")
@@ -1302,9 +1280,8 @@ def handle_membership_page_2(driver, submission_id, row_data):
                     # Versuch 3: Label-Klick
                     if not click_success:
                         try:
-                            radio_id_attr = radio.get_attribute('id')
-                            if radio_id_attr:
-                                label = driver.find_element(By.CSS_SELECTOR, f'label[for="{radio_id_attr}"]')
+                            if radio_data['raw_id']:
+                                label = driver.find_element(By.CSS_SELECTOR, f'label[for="{radio_data["raw_id"]}"]')
                                 label.click()
                                 click_success = True
                                 print(f"✅ Radio-Button {radio_data['index']+1} - Label Klick erfolgreich")
@@ -1327,7 +1304,7 @@ def handle_membership_page_2(driver, submission_id, row_data):
                         break  # Nur einen Button in Phase 1 klicken
                     else:
                         print(f"❌ Radio-Button {radio_data['index']+1} - Alle Klick-Strategien fehlgeschlagen")
-                elif should_select and radio_data['selected']:
+                else:
                     print(f"ℹ️ Radio {radio_data['index']+1} bereits ausgewählt: {reason}")
                     radio_clicked += 1
                     first_phase_clicked = True
@@ -1344,148 +1321,68 @@ def handle_membership_page_2(driver, submission_id, row_data):
             
             # Mehrere Versuche um alle Radio-Buttons zu finden
             for attempt in range(3):
-                new_radio_buttons = driver.find_elements(By.CSS_SELECTOR, 'input[type="radio"]')
-                if len(new_radio_buttons) > len(radio_info):
-                    print(f"📻 {len(new_radio_buttons)} Radio-Buttons gefunden (Versuch {attempt+1})")
+                new_radio_snapshot = snapshot_radios(driver)
+                if len(new_radio_snapshot) > len(radio_snapshot):
+                    print(f"📻 {len(new_radio_snapshot)} Radio-Buttons gefunden (Versuch {attempt+1})")
                     break
                 elif attempt < 2:
                     print(f"⏳ Warte auf weitere Radio-Buttons... (Versuch {attempt+1})")
                     time.sleep(1)
             
-            print(f"📻 {len(new_radio_buttons)} Radio-Buttons gefunden (nach dynamischem Update)")
+            print(f"📻 {len(new_radio_snapshot)} Radio-Buttons gefunden (nach dynamischem Update)")
             
             # Finde neue Radio-Buttons (die nicht in Phase 1 waren)
-            new_radio_info = []
-            for i, radio in enumerate(new_radio_buttons):
-                try:
-                    if radio.is_displayed() and radio.is_enabled() and not radio.is_selected():
-                        radio_value = (radio.get_attribute('value') or '').lower()
-                        radio_name = (radio.get_attribute('name') or '').lower()
-                        radio_id = (radio.get_attribute('id') or '').lower()
-                        
-                        # Prüfe ob dieser Button schon in Phase 1 verarbeitet wurde
-                        already_processed = False
-                        for old_radio in radio_info:
-                            if (old_radio['value'] == radio_value and 
-                                old_radio['name'] == radio_name and 
-                                old_radio['id'] == radio_id):
-                                already_processed = True
-                                break
-                        
-                        if not already_processed:
-                            # Finde das zugehörige Label
-                            label_text = ""
-                            try:
-                                if radio_id:
-                                    label = driver.find_element(By.CSS_SELECTOR, f'label[for="{radio_id}"]')
-                                    label_text = label.text.strip()
-                            except:
-                                try:
-                                    parent = radio.find_element(By.XPATH, "./..")
-                                    label_text = parent.text.strip()
-                                except:
-                                    try:
-                                        next_element = radio.find_element(By.XPATH, "./following-sibling::*[1]")
-                                        label_text = next_element.text.strip()
-                                    except:
-                                        label_text = "Unbekannt"
-                            
-                            new_radio_info.append({
-                                'index': len(new_radio_buttons) + i,
-                                'element': radio,
-                                'value': radio_value,
-                                'name': radio_name,
-                                'id': radio_id,
-                                'label': label_text.lower(),
-                                'selected': radio.is_selected()
-                            })
-                            
-                            print(f"📻 Neuer Radio {i+1}:")
-                            print(f"   - Value: '{radio_value}'")
-                            print(f"   - Name: '{radio_name}'")
-                            print(f"   - ID: '{radio_id}'")
-                            print(f"   - Label: '{label_text}'")
-                except Exception as e:
-                    print(f"   ⚠️ Neuer Radio {i+1} Analyse fehlgeschlagen: {e}")
+            known_radios = {(radio['value'], radio['name'], radio['id']) for radio in radio_info}
+            new_radio_info = [
+                radio for radio in new_radio_snapshot
+                if radio['displayed'] and radio['enabled'] and not radio['selected']
+                and (radio['value'], radio['name'], radio['id']) not in known_radios
+            ]
+            for radio_data in new_radio_info:
+                log.debug("page_2.new_radio", "📻 Neuer Radio {index}: value='{value}', name='{name}', id='{id}', label='{label}'",
+                          index=radio_data['index'] + 1, value=radio_data['value'], name=radio_data['name'],
+                          id=radio_data['id'], label=radio_data['label'])
             
             # PHASE 2: Verarbeitung der neuen Radio-Buttons - SPEZIFISCHERES MATCHING
             print(f"\n🎯 PHASE 2 DATENVERARBEITUNG:")
             print(f"   🛍️ Online Store Sells: '{online_store_sells}'")
             
-            for radio_data in new_radio_info:
+            # KLICKEN der neuen Radio-Buttons (nächster Kandidat, falls ein Klick scheitert)
+            for radio_data, reason in radio_candidates(new_radio_info, online_store_sells=online_store_sells)['sells']:
                 try:
-                    should_select = False
-                    reason = ""
+                    print(f"\n🎯 PHASE 2 AUSWAHL: Radio {radio_data['index']+1}")
+                    print(f"   📋 Grund: {reason}")
+                    print(f"   🏷️ Label: '{radio_data['label']}'")
                     
-                    # SPEZIFISCHES MATCHING für "sells" Radio-Buttons
-                    if online_store_sells:
-                        radio_text = f"{radio_data['value']} {radio_data['name']} {radio_data['id']} {radio_data['label']}"
-                        
-                        # Spezifische Patterns für besseres Matching
-                        if 'products they own' in online_store_sells.lower():
-                            # Suche nach "own" oder "they own" aber nicht "other" oder "vendor"
-                            if (('own' in radio_text or 'they' in radio_text) and 
-                                not any(exclude in radio_text for exclude in ['other', 'vendor', 'both'])):
-                                should_select = True
-                                reason = f"'Products they own' Match (Excel: '{online_store_sells}')"
-                            
-                        elif 'other vendors' in online_store_sells.lower():
-                            # Suche nach "vendor" oder "other"
-                            if any(keyword in radio_text for keyword in ['vendor', 'other']):
-                                should_select = True
-                                reason = f"'Other vendors' Match (Excel: '{online_store_sells}')"
-                        
-                        elif 'both' in online_store_sells.lower():
-                            # Suche nach "both"
-                            if 'both' in radio_text:
-                                should_select = True
-                                reason = f"'Both' Match (Excel: '{online_store_sells}')"
-                        
-                        # Fallback: Keyword-basiertes Matching
-                        if not should_select:
-                            sells_keywords = online_store_sells.lower().split()
-                            for keyword in sells_keywords:
-                                if len(keyword) > 3:  # Ignoriere kurze Wörter wie "own", "they"
-                                    if keyword in radio_text:
-                                        should_select = True
-                                        reason = f"Keyword Match: '{keyword}' (Excel: '{online_store_sells}')"
-                                        break
+                    click_success = False
+                    radio = radio_data['element']
                     
-                    # KLICKEN der neuen Radio-Buttons
-                    if should_select and not radio_data['selected']:
-                        print(f"\n🎯 PHASE 2 AUSWAHL: Radio {radio_data['index']+1}")
-                        print(f"   📋 Grund: {reason}")
-                        print(f"   🏷️ Label: '{radio_data['label']}'")
-                        
-                        click_success = False
-                        radio = radio_data['element']
-                        
+                    try:
+                        driver.execute_script("arguments[0].scrollIntoView(true);", radio)
+                        time.sleep(0.2)
+                        radio.click()
+                        click_success = True
+                        print(f"✅ Radio-Button {radio_data['index']+1} - Normaler Klick erfolgreich")
+                    except Exception:
                         try:
-                            driver.execute_script("arguments[0].scrollIntoView(true);", radio)
-                            time.sleep(0.2)
-                            radio.click()
+                            driver.execute_script("arguments[0].click();", radio)
                             click_success = True
-                            print(f"✅ Radio-Button {radio_data['index']+1} - Normaler Klick erfolgreich")
-                        except Exception as e:
-                            try:
-                                driver.execute_script("arguments[0].click();", radio)
-                                click_success = True
-                                print(f"✅ Radio-Button {radio_data['index']+1} - JavaScript Klick erfolgreich")
-                            except Exception as e2:
-                                print(f"❌ Radio-Button {radio_data['index']+1} - Alle Klick-Strategien fehlgeschlagen")
+                            print(f"✅ Radio-Button {radio_data['index']+1} - JavaScript Klick erfolgreich")
+                        except Exception:
+                            print(f"❌ Radio-Button {radio_data['index']+1} - Alle Klick-Strategien fehlgeschlagen")
+                    
+                    if click_success:
+                        radio_clicked += 1
+                        time.sleep(0.3)
                         
-                        if click_success:
-                            radio_clicked += 1
-                            time.sleep(0.3)
-                            
-                            try:
-                                if radio.is_selected():
-                                    print(f"🎯 Radio-Button {radio_data['index']+1} bestätigt ausgewählt!")
-                                else:
-                                    print(f"⚠️ Radio-Button {radio_data['index']+1} nicht ausgewählt nach Klick")
-                            except:
-                                pass
-                            break  # Nur einen Button in Phase 2 auswählen
+                        try:
+                            if radio.is_selected():
+                                print(f"🎯 Radio-Button {radio_data['index']+1} bestätigt ausgewählt!")
+                            else:
+                                print(f"⚠️ Radio-Button {radio_data['index']+1} nicht ausgewählt nach Klick")
+                        except:
+                            pass
+                        break  # Nur einen Button in Phase 2 auswählen
                         
                 except Exception as e:
                     print(f"   ⚠️ Phase 2 Radio {radio_data['index']+1} fehlgeschlagen: {e}")
@@ -1516,7 +1413,6 @@ def handle_membership_page_3(driver, submission_id, row_data):
     print("🆕 MEMBERSHIP SEITE 3: Company & Contact Details ausfüllen...")
     
     try:
-        wait = WebDriverWait(driver, 10)
         record = row_data.to_dict() if hasattr(row_data, 'to_dict') else row_data
         
         print(f"📍 URL: {driver.current_url}")
@@ -1524,24 +1420,23 @@ def handle_membership_page_3(driver, submission_id, row_data):
         
         fields_filled = 0  # WICHTIG: Variable initialisieren
         
-        # ALLE VERFÜGBAREN INPUT-FELDER ANALYSIEREN
-        all_inputs = driver.find_elements(By.CSS_SELECTOR, 'input[type="text"], input[type="email"], input[type="tel"]')
-        all_selects = driver.find_elements(By.CSS_SELECTOR, 'select')
-        
-        print(f"📝 {len(all_inputs)} Input-Felder und {len(all_selects)} Dropdown-Felder gefunden")
+        # FORMULAR-PLAN: Analyse nur wenn sich die Seitenstruktur geändert hat
+        plan, form_fields, fingerprint, cache_hit = get_page_plan(driver, "MEMBERSHIP_PAGE_3", get_db())
+        print(f"🗺️ Page-Plan {'aus Cache' if cache_hit else 'neu berechnet'}: {len(plan)} Felder ({fingerprint[:12]})")
         
         # Datenfelder aus Excel extrahieren - KORREKTE ZUORDNUNG
-        company_name = str(record.get('Company Name', '') or '').strip()
+        row_values = resolve_row_values(record)
+        company_name = row_values['company_name']
         salutation = str(record.get('Salutation', '') or '').strip()
-        first_name = str(record.get('First Name', '') or '').strip()
-        last_name = str(record.get('Last Name', '') or '').strip()
-        email_address = str(record.get('Email Adress', '') or record.get('Email Address', '') or '').strip()
-        street_number = str(record.get('Number and Street', '') or '').strip()
-        postal_code = str(record.get('Postal Code', '') or '').strip()
-        city = str(record.get('City', '') or '').strip()
-        country = str(record.get('Country', '') or record.get('Country2', '') or '').strip()
-        phone = str(record.get('Phone', '') or record.get('Phone Number', '') or '').strip()
-        website = str(record.get('Website', '') or '').strip()
+        first_name = row_values['first_name']
+        last_name = row_values['last_name']
+        email_address = row_values['email']
+        street_number = row_values['street']
+        postal_code = row_values['postal_code']
+        city = row_values['city']
+        country = row_values['country']
+        phone = row_values['phone']
+        website = row_values['website']
         terms_accepted = str(record.get('I accept the Terms and Conditions ', '') or '').lower().strip()
         
         print(f"📊 MEMBERSHIP SEITE 3 Excel-Daten (KORREKT):")
@@ -1564,110 +1459,45 @@ def handle_membership_page_3(driver, submission_id, row_data):
         try:
             salutation_element = driver.find_element(By.CSS_SELECTOR, 'select[name*="salutation"], select[id*="salutation"]')
             if salutation_element.is_displayed():
-                salutation_select = Select(salutation_element)
-                element_name = salutation_element.get_attribute('name') or salutation_element.get_attribute('id') or 'unknown'
-                print(f"   📋 Gefundenes Salutation Dropdown: {element_name}")
+                print("   📋 Gefundenes Salutation Dropdown")
                 
-                # Versuche Excel-Wert zu finden
+                # Versuche Excel-Wert zu finden (Mr/Herr, Ms/Frau über Alias-Index)
                 if salutation:
-                    for option in salutation_select.options:
-                        option_text = option.text.strip()
-                        if option_text and (salutation.lower() in option_text.lower() or 
-                            option_text.lower() in salutation.lower()):
-                            salutation_select.select_by_visible_text(option_text)
-                            print(f"✅ Salutation (Excel-Match): {option_text}")
-                            fields_filled += 1
-                            time.sleep(0.3)
-                            break
+                    salutation_index = get_option_index(driver, salutation_element, SALUTATION_ALIASES)
+                    option = salutation_index.lookup(salutation)
+                    if option and select_option(driver, salutation_element, option):
+                        print(f"✅ Salutation (Excel-Match): {option[0]}")
+                        fields_filled += 1
         except Exception as e:
             print(f"   ❌ Salutation Dropdown fehlgeschlagen: {e}")
         
-        # 2. INPUT-FELDER MIT KORRIGIERTER PRIORITÄTS-LOGIK
-        print(f"🔍 Analysiere {len(all_inputs)} Input-Felder...")
+        # 2. INPUT-FELDER DIREKT AUS DEM PLAN AUSFÜLLEN
+        print(f"🔍 Fülle {len(plan)} geplante Input-Felder...")
         
-        for i, field in enumerate(all_inputs):
-            try:
-                if field.is_displayed() and field.is_enabled():
-                    field_name = (field.get_attribute('name') or '').lower()
-                    field_id = (field.get_attribute('id') or '').lower()
-                    field_placeholder = (field.get_attribute('placeholder') or '').lower()
-                    field_type = field.get_attribute('type') or 'text'
-                    
-                    all_attributes = f"{field_name} {field_id} {field_placeholder}".lower()
-                    print(f"🔍 Feld {i+1}: attributes='{all_attributes}', type='{field_type}'")
-                    
-                    # KORRIGIERTE FELD-ZUORDNUNG - SPEZIFISCHE KEYWORDS ZUERST!
-                    value_to_enter = None
-                    field_description = ""
-                    
-                    # EMAIL ADDRESS (höchste Priorität für Email-Felder)
-                    if (field_type == 'email' or 'email' in all_attributes):
-                        value_to_enter = email_address
-                        field_description = "Email Address"
-                    
-                    # PHONE (höchste Priorität für Tel-Felder)
-                    elif (field_type == 'tel' or 'phone' in all_attributes):
-                        value_to_enter = phone
-                        field_description = "Phone Number"
-                    
-                    # FIRST NAME (spezifische Erkennung)
-                    elif ('first' in all_attributes and 'name' in all_attributes):
-                        value_to_enter = first_name
-                        field_description = "First Name"
-                    
-                    # LAST NAME (spezifische Erkennung)  
-                    elif ('last' in all_attributes and 'name' in all_attributes):
-                        value_to_enter = last_name
-                        field_description = "Last Name"
-                    
-                    # STREET/ADDRESS (company_street oder street)
-                    elif ('street' in all_attributes or 'address' in all_attributes):
-                        value_to_enter = street_number
-                        field_description = "Street & Number"
-                    
-                    # POSTAL CODE (company_postal_code oder postal)
-                    elif ('postal' in all_attributes or 'zip' in all_attributes or 'plz' in all_attributes):
-                        value_to_enter = postal_code
-                        field_description = "Postal Code"
-                    
-                    # CITY (company_city oder city)
-                    elif ('city' in all_attributes or 'stadt' in all_attributes):
-                        value_to_enter = city
-                        field_description = "City"
-                    
-                    # COUNTRY (company_country oder country)
-                    elif ('country' in all_attributes or 'land' in all_attributes):
-                        value_to_enter = country
-                        field_description = "Country"
-                    
-                    # WEBSITE
-                    elif ('website' in all_attributes or 'web' in all_attributes or 'url' in all_attributes):
-                        value_to_enter = website
-                        field_description = "Website"
-                    
-                    # COMPANY NAME (nur als letzter Fallback)
-                    elif ('company' in all_attributes and 
-                          not any(specific in all_attributes for specific in ['street', 'postal', 'city', 'country', 'phone'])):
-                        value_to_enter = company_name
-                        field_description = "Company Name"
-                    
-                    else:
-                        print(f"   ⚠️ Feld {i+1}: Keine Zuordnung gefunden für '{all_attributes}'")
-                        continue
-                    
-                    # Feld ausfüllen
-                    if value_to_enter and value_to_enter.strip():
-                        field.clear()
-                        field.send_keys(value_to_enter.strip())
-                        print(f"✅ Feld {i+1} ({field_description}): '{value_to_enter.strip()}'")
-                        fields_filled += 1
-                        time.sleep(0.2)  # Reduzierte Wartezeit
-                    else:
-                        print(f"   ⚠️ Feld {i+1} ({field_description}): Kein Excel-Wert - '{value_to_enter}'")
-                        
-            except Exception as e:
-                print(f"   ❌ Feld {i+1} fehlgeschlagen: {e}")
+        fill_entries = []
+        for entry in plan:
+            form_field = form_fields[entry['index']]
+            if not (form_field['displayed'] and form_field['enabled']):
                 continue
+            
+            field_label = f"Feld {entry['index'] + 1} ({FIELD_DESCRIPTIONS[entry['field']]})"
+            value_to_enter = row_values[entry['field']]
+            if value_to_enter:
+                fill_entries.append({'element': form_field['element'], 'value': value_to_enter, 'label': field_label})
+            else:
+                print(f"   ⚠️ {field_label}: Kein Excel-Wert - '{value_to_enter}'")
+        
+        try:
+            filled, fallback, failed = batch_fill(driver, fill_entries)
+            for label in filled:
+                print(f"✅ {label}")
+            for label in fallback:
+                print(f"✅ {label} (Tastatur-Fallback)")
+            for label in failed:
+                print(f"   ❌ {label} fehlgeschlagen: Wert nicht übernommen")
+            fields_filled += len(filled) + len(fallback)
+        except Exception as e:
+            print(f"   ❌ Batch-Ausfüllung fehlgeschlagen: {e}")
         
         print(f"📊 MEMBERSHIP SEITE 3: {fields_filled} Felder ausgefüllt")
         return fields_filled >= 1
@@ -1676,12 +1506,11 @@ def handle_membership_page_3(driver, submission_id, row_data):
         print(f"❌ MEMBERSHIP SEITE 3 Fehler: {e}")
         return False
 
-def handle_membership_page_4(driver, submission_id, row_data):
+def handle_membership_page_4(driver, submission_id, row_data, pdf_file=None):
     """🏆 MEMBERSHIP SEITE 4: PDF Upload, Terms & Conditions & Final Submit"""
     print("🆕 MEMBERSHIP SEITE 4: PDF Upload, Terms & Conditions & Summary...")
     
     try:
-        wait = WebDriverWait(driver, 10)
         record = row_data.to_dict() if hasattr(row_data, 'to_dict') else row_data
         
         print(f"📍 URL: {driver.current_url}")
@@ -1706,7 +1535,9 @@ def handle_membership_page_4(driver, submission_id, row_data):
         ]
         
         terms_checked = False
-        for selector in checkbox_selectors:
+        fingerprint = page_fingerprint(driver)
+        for selector in get_selector_ranker().order("page_4.terms_checkbox", checkbox_selectors, fingerprint):
+            terms_found = False
             try:
                 checkboxes = driver.find_elements(By.CSS_SELECTOR, selector)
                 for checkbox in checkboxes:
@@ -1717,6 +1548,7 @@ def handle_membership_page_4(driver, submission_id, row_data):
                         # Prüfe ob es sich um Terms & Conditions handelt
                         if any(keyword in f"{checkbox_name} {checkbox_id}" 
                                for keyword in ['terms', 'conditions', 'accept', 'agree']):
+                            terms_found = True
                             
                             # Nur anklicken wenn Excel "Yes" enthält
                             if terms_accepted in ['yes', 'ja', 'true', '1', 'x', 'y']:
@@ -1743,10 +1575,12 @@ def handle_membership_page_4(driver, submission_id, row_data):
                             else:
                                 print(f"⚠️ Terms & Conditions NICHT akzeptiert (Excel: '{terms_accepted}')")
                             break
+                get_selector_ranker().record("page_4.terms_checkbox", selector, terms_found, fingerprint)
                 if terms_checked:
                     break
             except Exception as e:
                 print(f"   ⚠️ Terms Checkbox {selector} fehlgeschlagen: {e}")
+                get_selector_ranker().record("page_4.terms_checkbox", selector, False, fingerprint)
                 continue
         
         # 2. PDF UPLOAD (falls PDF verfügbar)
@@ -1754,13 +1588,11 @@ def handle_membership_page_4(driver, submission_id, row_data):
         file_inputs = driver.find_elements(By.CSS_SELECTOR, 'input[type="file"]')
         
         if file_inputs:
-            # Prüfe ob PDF-Datei verfügbar ist
-            pdf_files = [f for f in os.listdir('.') if f.endswith('.pdf')]
-            if pdf_files:
-                pdf_file = pdf_files[0]  # Nimm erste PDF
+            # Dokument der Zeile (vor dem Lauf über den PDF-Index aufgelöst)
+            if pdf_file:
                 try:
                     file_inputs[0].send_keys(os.path.abspath(pdf_file))
-                    print(f"✅ PDF hochgeladen: {pdf_file}")
+                    print(f"✅ PDF hochgeladen: {os.path.basename(pdf_file)}")
                     pdf_uploaded = True
                     fields_filled += 1
                     time.sleep(1)
@@ -1777,14 +1609,12 @@ def handle_membership_page_4(driver, submission_id, row_data):
             for i, radio in enumerate(radio_buttons):
                 try:
                     if radio.is_displayed() and radio.is_enabled() and not radio.is_selected():
-                        radio_value = (radio.get_attribute('value') or '').lower()
-                        radio_name = (radio.get_attribute('name') or '').lower()
-                        radio_id = (radio.get_attribute('id') or '').lower()
-                        
-                        print(f"📻 Seite 4 Radio {i+1}:")
-                        print(f"   - Value: '{radio_value}'")
-                        print(f"   - Name: '{radio_name}'")
-                        print(f"   - ID: '{radio_id}'")
+                        # Attribute nur für den Debug-Dump lesen - keine Round-Trips im Normalbetrieb
+                        if log.is_enabled(DEBUG):
+                            log.debug("page_4.radio", "📻 Seite 4 Radio {index}:\n   - Value: '{value}'\n   - Name: '{name}'\n   - ID: '{id}'",
+                                      index=i + 1, value=(radio.get_attribute('value') or '').lower(),
+                                      name=(radio.get_attribute('name') or '').lower(),
+                                      id=(radio.get_attribute('id') or '').lower())
                         
                         # Einfache Strategie: Ersten verfügbaren Button klicken
                         try:
@@ -1823,7 +1653,6 @@ def handle_new_membership_form(driver, submission_id, row_data):
     print("🆕 NEW MEMBERSHIP FORM: Company Name + Country ausfüllen...")
     
     try:
-        wait = WebDriverWait(driver, 10)
         record = row_data.to_dict() if hasattr(row_data, 'to_dict') else row_data
         
         print(f"📍 URL: {driver.current_url}")
@@ -1897,59 +1726,25 @@ def handle_new_membership_form(driver, submission_id, row_data):
                         driver.execute_script("arguments[0].scrollIntoView(true);", country_select_element)
                         time.sleep(0.3)
                         
-                        country_select = Select(country_select_element)
-                        
-                        # Deutschland-Optionen prüfen
-                        print("   📋 Verfügbare Country-Optionen:")
+                        # Country-Index: Excel-Wert (Deutsch/Englisch/ISO), Fallback Deutschland
+                        country_index = get_option_index(driver, country_select_element, COUNTRY_ALIASES)
+                        print(f"   📋 {len(country_index.options)} Country-Optionen indexiert")
                         option_selected = False
                         
-                        for option in country_select.options:
-                            option_text = option.text.strip()
-                            option_value = option.get_attribute('value').strip()
-                            print(f"      - '{option_text}' (value: '{option_value}')")
-                            
-                            # Erweiterte Deutschland-Erkennung
-                            germany_patterns = [
-                                'germany', 'deutschland', 'de', 'ger', 'deu',
-                                '🇩🇪', 'german'
-                            ]
-                            
-                            option_text_lower = option_text.lower()
-                            option_value_lower = option_value.lower()
-                            
-                            # Prüfe ob die Option zu Deutschland passt
-                            is_germany = (
-                                any(pattern in option_text_lower for pattern in germany_patterns) or
-                                any(pattern in option_value_lower for pattern in germany_patterns) or
-                                country in option_text_lower or
-                                country in option_value_lower
-                            )
-                            
-                            if is_germany:
-                                country_select.select_by_visible_text(option_text)
-                                print(f"✅ Germany/Deutschland ausgewählt: {option_text}")
-                                fields_filled += 1
-                                option_selected = True
-                                break
-                        
-                        # Fallback: Versuche exakte Übereinstimmung mit einggegebenen Country
-                        if not option_selected:
-                            for option in country_select.options:
-                                if country.lower() in option.text.lower():
-                                    country_select.select_by_visible_text(option.text)
-                                    print(f"✅ Country Fallback ausgewählt: {option.text}")
-                                    fields_filled += 1
-                                    option_selected = True
-                                    break
+                        option = country_index.lookup(country)
+                        if option and select_option(driver, country_select_element, option):
+                            print(f"✅ Country ausgewählt: {option[0]}")
+                            fields_filled += 1
+                            option_selected = True
                         
                         # Letzter Fallback: "Germany" direkt
                         if not option_selected:
-                            try:
-                                country_select.select_by_value("Germany")
-                                print("✅ Country Default 'Germany' ausgewählt")
+                            option = country_index.lookup('germany')
+                            if option and select_option(driver, country_select_element, option):
+                                print(f"✅ Country Default ausgewählt: {option[0]}")
                                 fields_filled += 1
                                 option_selected = True
-                            except:
+                            else:
                                 print("❌ Auch Default 'Germany' nicht verfügbar")
                         
                         if option_selected:
@@ -1997,7 +1792,7 @@ def handle_new_membership_form(driver, submission_id, row_data):
                     continue
         
         # Datenbank-Logging
-        db.log_form_fields(
+        get_db().log_form_fields(
             submission_id,
             page_number=2,
             form_data={
@@ -2021,16 +1816,16 @@ def handle_new_membership_form(driver, submission_id, row_data):
         print(f"❌ NEW MEMBERSHIP FORM Kritischer Fehler: {e}")
         return False
 
-def page_2_fill_company_data(driver, submission_id, row_data):
+def page_2_fill_company_data(driver, submission_id, row_data, page_verified=False):
     """SEITE 2: Firmendaten ausfüllen"""
     print("🏢 SEITE 2: Firmendaten ausfüllen...")
     
-    # Sicherstellen, dass wir auf der richtigen Seite sind
-    if not navigate_to_correct_page(driver, "PAGE_2_COMPANY", submission_id):
+    # Sicherstellen, dass wir auf der richtigen Seite sind (entfällt wenn die Workflow-Engine die Seite bestätigt hat)
+    if not page_verified and not navigate_to_correct_page(driver, "PAGE_2_COMPANY", submission_id):
         print("⚠️ Konnte nicht zu Company-Seite navigieren - versuche trotzdem fortzufahren")
     
     try:
-        wait = WebDriverWait(driver, 10)
+        wait = WebDriverWait(driver, wait_timeout(10))
         record = row_data.to_dict() if hasattr(row_data, 'to_dict') else row_data
         
         # Warte bis Seite geladen ist
@@ -2038,7 +1833,7 @@ def page_2_fill_company_data(driver, submission_id, row_data):
         time.sleep(1)
         
         # Erneute Seitenerkennung
-        current_page = detect_current_page(driver)
+        current_page = "PAGE_2_COMPANY" if page_verified else detect_current_page(driver)
         print(f"📍 Aktuelle Seite: {current_page}")
         
         # Falls wir nicht auf der erwarteten Seite sind, prüfe alle verfügbaren Felder
@@ -2117,7 +1912,7 @@ def page_2_fill_company_data(driver, submission_id, row_data):
         
         print(f"📊 SEITE 2: {fields_filled} Felder ausgefüllt")
         
-        db.log_form_fields(
+        get_db().log_form_fields(
             submission_id,
             page_number=2,
             form_data={
@@ -2138,23 +1933,23 @@ def page_2_submit(driver, submission_id):
     """SEITE 2: Submit für nächste Seite"""
     return page_1_submit(driver, submission_id)  # Gleiche Submit-Logik
 
-def page_3_additional_data(driver, submission_id, row_data):
+def page_3_additional_data(driver, submission_id, row_data, page_verified=False):
     """SEITE 3: Zusätzliche Daten"""
     print("📋 SEITE 3: Zusätzliche Daten...")
     
-    # Sicherstellen, dass wir auf der richtigen Seite sind
-    if not navigate_to_correct_page(driver, "PAGE_3_DETAILS", submission_id):
+    # Sicherstellen, dass wir auf der richtigen Seite sind (entfällt wenn die Workflow-Engine die Seite bestätigt hat)
+    if not page_verified and not navigate_to_correct_page(driver, "PAGE_3_DETAILS", submission_id):
         print("⚠️ Konnte nicht zu Details-Seite navigieren - versuche trotzdem fortzufahren")
     
     try:
-        wait = WebDriverWait(driver, 10)
+        wait = WebDriverWait(driver, wait_timeout(10))
         record = row_data.to_dict() if hasattr(row_data, 'to_dict') else row_data
         
         wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
         time.sleep(1)
         
         # Erneute Seitenerkennung
-        current_page = detect_current_page(driver)
+        current_page = "PAGE_3_DETAILS" if page_verified else detect_current_page(driver)
         print(f"📍 Aktuelle Seite: {current_page}")
         
         fields_filled = 0
@@ -2164,13 +1959,11 @@ def page_3_additional_data(driver, submission_id, row_data):
         if country:
             # Dropdown-Select versuchen
             try:
-                country_select = Select(driver.find_element(By.CSS_SELECTOR, 'select[name*="country"], select[id*="country"]'))
-                for option in country_select.options:
-                    if country.lower() in option.text.lower():
-                        country_select.select_by_visible_text(option.text)
-                        print(f"✅ SEITE 3: Land ausgewählt: {option.text}")
-                        fields_filled += 1
-                        break
+                country_select_element = driver.find_element(By.CSS_SELECTOR, 'select[name*="country"], select[id*="country"]')
+                option = get_option_index(driver, country_select_element, COUNTRY_ALIASES).lookup(country)
+                if option and select_option(driver, country_select_element, option):
+                    print(f"✅ SEITE 3: Land ausgewählt: {option[0]}")
+                    fields_filled += 1
             except:
                 # Input-Feld versuchen
                 country_selectors = [
@@ -2214,7 +2007,7 @@ def page_3_additional_data(driver, submission_id, row_data):
         
         print(f"📊 SEITE 3: {fields_filled} Felder ausgefüllt")
         
-        db.log_form_fields(
+        get_db().log_form_fields(
             submission_id,
             page_number=3,
             form_data={
@@ -2234,22 +2027,22 @@ def page_3_submit(driver, submission_id):
     """SEITE 3: Submit für letzte Seite"""
     return page_1_submit(driver, submission_id)  # Gleiche Submit-Logik
 
-def page_4_pdf_upload_and_finish(driver, submission_id, pdf_file):
+def page_4_pdf_upload_and_finish(driver, submission_id, pdf_file, page_verified=False):
     """SEITE 4: PDF-Upload und Fertigstellung"""
     print("📎 SEITE 4: PDF-Upload und Fertigstellung...")
     
-    # Sicherstellen, dass wir auf der richtigen Seite sind
-    if not navigate_to_correct_page(driver, "PAGE_4_UPLOAD", submission_id):
+    # Sicherstellen, dass wir auf der richtigen Seite sind (entfällt wenn die Workflow-Engine die Seite bestätigt hat)
+    if not page_verified and not navigate_to_correct_page(driver, "PAGE_4_UPLOAD", submission_id):
         print("⚠️ Konnte nicht zu Upload-Seite navigieren - versuche trotzdem fortzufahren")
     
     try:
-        wait = WebDriverWait(driver, 10)
+        wait = WebDriverWait(driver, wait_timeout(10))
         
         wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
         time.sleep(0.5)
         
         # Erneute Seitenerkennung
-        current_page = detect_current_page(driver)
+        current_page = "PAGE_4_UPLOAD" if page_verified else detect_current_page(driver)
         print(f"📍 Aktuelle Seite: {current_page}")
         
         uploaded = False
@@ -2264,16 +2057,19 @@ def page_4_pdf_upload_and_finish(driver, submission_id, pdf_file):
                 'input[id*="upload"]'
             ]
             
-            for selector in file_selectors:
+            fingerprint = page_fingerprint(driver)
+            for selector in get_selector_ranker().order("page_4.file_input", file_selectors, fingerprint):
                 try:
                     file_input = driver.find_element(By.CSS_SELECTOR, selector)
                     file_input.send_keys(pdf_file)
                     print(f"✅ SEITE 4: PDF-Datei hochgeladen: {os.path.basename(pdf_file)}")
+                    get_selector_ranker().record("page_4.file_input", selector, True, fingerprint)
                     uploaded = True
                     time.sleep(0.5)
                     break
                 except Exception as e:
                     print(f"   ⚠️ {selector} Upload fehlgeschlagen: {e}")
+                    get_selector_ranker().record("page_4.file_input", selector, False, fingerprint)
                     continue
         
         # FINALE SUBMIT BUTTON - Complete Registration
@@ -2291,7 +2087,9 @@ def page_4_pdf_upload_and_finish(driver, submission_id, pdf_file):
         final_submitted = False
         
         # Versuche Complete Registration Button zu finden und zu klicken
-        for selector in complete_registration_selectors:
+        # (historischer Gewinner zuerst - jeder Fehlversuch kostet einen vollen Wait)
+        fingerprint = page_fingerprint(driver)
+        for selector in get_selector_ranker().order("page_4.complete_registration", complete_registration_selectors, fingerprint):
             try:
                 if ':contains(' in selector:
                     # XPath für :contains() verwenden
@@ -2307,10 +2105,11 @@ def page_4_pdf_upload_and_finish(driver, submission_id, pdf_file):
                 if "Complete Registration" in button_text or "✓ Complete Registration" in button_text:
                     if safe_click_button(driver, final_btn, f"Complete Registration Button ({selector})"):
                         print(f"✅ SEITE 4: FINALE ABSENDUNG ERFOLGREICH: Complete Registration Button geklickt!")
+                        get_selector_ranker().record("page_4.complete_registration", selector, True, fingerprint)
                         final_submitted = True
                         time.sleep(2)  # Warten auf Verarbeitung
                         
-                        db.log_http_request(
+                        get_db().log_http_request(
                             submission_id, 
                             driver.current_url, 
                             "POST",
@@ -2320,9 +2119,11 @@ def page_4_pdf_upload_and_finish(driver, submission_id, pdf_file):
                         return True
                 else:
                     print(f"   ⚠️ Button-Text passt nicht: '{button_text}'")
+                    get_selector_ranker().record("page_4.complete_registration", selector, False, fingerprint)
                     
             except Exception as e:
                 print(f"   ⚠️ {selector} fehlgeschlagen: {e}")
+                get_selector_ranker().record("page_4.complete_registration", selector, False, fingerprint)
                 continue
         
         # Fallback: Alle Submit-Buttons durchsuchen
@@ -2349,13 +2150,9 @@ def page_4_pdf_upload_and_finish(driver, submission_id, pdf_file):
         if final_submitted:
             return True
         
-        # Screenshot für Beweiszwecke
-        try:
-            screenshot = driver.get_screenshot_as_base64()
-            db.log_evidence(submission_id, "final_page_screenshot", screenshot, "base64")
-            print("📸 SEITE 4: Screenshot gespeichert")
-        except:
-            pass
+        # Screenshot für Beweiszwecke (wird im Hintergrund verkleinert und gespeichert)
+        if screenshots.capture(driver, submission_id, "final_page_screenshot"):
+            print("📸 SEITE 4: Screenshot aufgenommen")
         
         print("⚠️ SEITE 4: Kein finaler Submit-Button gefunden - möglicherweise bereits abgeschlossen")
         return True
@@ -2364,264 +2161,160 @@ def page_4_pdf_upload_and_finish(driver, submission_id, pdf_file):
         print(f"❌ SEITE 4 Fehler: {e}")
         return False
 
-def execute_adaptive_workflow(driver, excel_file, pdf_file, row_data):
-    """ADAPTIVER WORKFLOW - Erkennt automatisch die aktuelle Seite und handelt entsprechend"""
-    global current_submission_id
-    
-    try:
-        print("🎯 Starte adaptiven Workflow...")
-        max_iterations = 10  # Verhindere Endlosschleifen
-        iteration = 0
-        completed_pages = set()
-        
-        while iteration < max_iterations:
-            iteration += 1
-            current_page = detect_current_page(driver)
-            
-            print(f"\n🔄 Iteration {iteration}: Aktuelle Seite = {current_page}")
-            
-            # Prüfe ob wir bereits fertig sind
-            if current_page == "SUCCESS_PAGE":
-                print("🎉 Erfolgsseite erreicht - Workflow abgeschlossen!")
-                return True
-            
-            # Handle verschiedene Seiten
-            if current_page == "LOGIN":
-                if not handle_login_process(driver, current_submission_id):
-                    print("❌ Login fehlgeschlagen")
-                    return False
-                completed_pages.add("LOGIN")
-                
-            elif current_page == "DASHBOARD":
-                print("🏠 DASHBOARD erkannt - navigiere zu Packaging-Formular...")
-                # Spezielle Dashboard-Navigation mit Dropdown
-                if not navigate_to_correct_page(driver, "PAGE_1_PACKAGING", current_submission_id):
-                    print("⚠️ Dashboard→Packaging Navigation fehlgeschlagen - versuche alternative Methoden")
-                    
-                    # Fallback: Suche nach allen Dropdown-Elementen
+def handle_dashboard(driver, submission_id):
+    """DASHBOARD: Navigation zum Packaging-Formular inkl. Fallbacks"""
+    print("🏠 DASHBOARD erkannt - navigiere zu Packaging-Formular...")
+    # Spezielle Dashboard-Navigation mit Dropdown
+    if not navigate_to_correct_page(driver, "PAGE_1_PACKAGING", submission_id):
+        print("⚠️ Dashboard→Packaging Navigation fehlgeschlagen - versuche alternative Methoden")
+        
+        # Fallback: Suche nach allen Dropdown-Elementen
+        try:
+            print("🔍 Fallback: Durchsuche alle Dropdown-Elemente...")
+
+            # 1. Alle Elemente mit Dropdown-Klassen finden
+            dropdown_elements = driver.find_elements(By.CSS_SELECTOR, 
+                '[class*="dropdown"], [data-toggle="dropdown"], .nav-item')
+
+            for dropdown in dropdown_elements:
+                if dropdown.is_displayed():
                     try:
-                        print("🔍 Fallback: Durchsuche alle Dropdown-Elemente...")
-                        
-                        # 1. Alle Elemente mit Dropdown-Klassen finden
-                        dropdown_elements = driver.find_elements(By.CSS_SELECTOR, 
-                            '[class*="dropdown"], [data-toggle="dropdown"], .nav-item')
-                        
-                        for dropdown in dropdown_elements:
-                            if dropdown.is_displayed():
-                                try:
-                                    # Dropdown öffnen
-                                    dropdown.click()
-                                    time.sleep(1)
-                                    
-                                    # Nach Packaging-Link suchen
-                                    packaging_links = driver.find_elements(By.CSS_SELECTOR, 
-                                        'a[href*="packaging"], a:contains("Packaging"), a:contains("📦")')
-                                    
-                                    for link in packaging_links:
-                                        if link.is_displayed():
-                                            link.click()
-                                            print("✅ Fallback Dropdown-Navigation erfolgreich!")
-                                            time.sleep(0.5)
-                                            break
-                                    else:
-                                        continue
-                                    break
-                                        
-                                except:
-                                    continue
-                        
-                        # 2. Direkte URL als letzter Ausweg
-                        if detect_current_page(driver) == "DASHBOARD":
-                            print("🌐 Letzte Option: Direkte URL-Navigation...")
-                            driver.get("https://friendly-captcha-demo.onrender.com/membership/new?type=packaging-paper")
-                            time.sleep(0.5)
-                            
-                    except Exception as e:
-                        print(f"⚠️ Fallback-Navigation fehlgeschlagen: {e}")
-                
-            elif current_page == "PAGE_1_PACKAGING":
-                if "PAGE_1_PACKAGING" not in completed_pages:
-                    print("📦 Führe Packaging-Auswahl aus...")
-                    if page_1_select_packaging(driver, current_submission_id):
-                        completed_pages.add("PAGE_1_PACKAGING")
-                        if page_1_submit(driver, current_submission_id):
-                            time.sleep(0.5)
-                        else:
-                            print("⚠️ Submit fehlgeschlagen - versuche trotzdem fortzufahren")
-                            time.sleep(0.5)
-                    else:
-                        print("⚠️ Packaging-Auswahl fehlgeschlagen")
-                else:
-                    # Seite bereits bearbeitet, weiter navigieren
-                    page_1_submit(driver, current_submission_id)
-                    time.sleep(0.5)
-                
-            elif current_page == "MEMBERSHIP_PAGE_1":
-                if "MEMBERSHIP_PAGE_1" not in completed_pages:
-                    print("� MEMBERSHIP SEITE 1: Country & Company...")
-                    if handle_membership_page_1(driver, current_submission_id, row_data):
-                        completed_pages.add("MEMBERSHIP_PAGE_1")
-                        # Submit für nächste Seite
-                        page_1_submit(driver, current_submission_id)
-                        time.sleep(1)
-                    else:
-                        print("⚠️ Membership Seite 1 fehlgeschlagen")
-                else:
-                    page_1_submit(driver, current_submission_id)
-                    time.sleep(1)
-                    
-            elif current_page == "MEMBERSHIP_PAGE_2":
-                if "MEMBERSHIP_PAGE_2" not in completed_pages:
-                    print("🆕 MEMBERSHIP SEITE 2: Business Activity...")
-                    if handle_membership_page_2(driver, current_submission_id, row_data):
-                        completed_pages.add("MEMBERSHIP_PAGE_2")
-                        # Submit für nächste Seite
-                        page_1_submit(driver, current_submission_id)
-                        time.sleep(1)
-                    else:
-                        print("⚠️ Membership Seite 2 fehlgeschlagen")
-                else:
-                    page_1_submit(driver, current_submission_id)
-                    time.sleep(1)
-                    
-            elif current_page == "MEMBERSHIP_PAGE_3":
-                if "MEMBERSHIP_PAGE_3" not in completed_pages:
-                    print("🆕 MEMBERSHIP SEITE 3: Contact Information...")
-                    if handle_membership_page_3(driver, current_submission_id, row_data):
-                        completed_pages.add("MEMBERSHIP_PAGE_3")
-                        # Submit für nächste Seite
-                        page_1_submit(driver, current_submission_id)
+                        # Dropdown öffnen
+                        dropdown.click()
                         time.sleep(1)
-                    else:
-                        print("⚠️ Membership Seite 3 fehlgeschlagen")
-                else:
-                    page_1_submit(driver, current_submission_id)
-                    time.sleep(1)
-                    
-            elif current_page == "MEMBERSHIP_PAGE_4":
-                if "MEMBERSHIP_PAGE_4" not in completed_pages:
-                    print("🆕 MEMBERSHIP SEITE 4: PDF Upload & Summary...")
-                    if handle_membership_page_4(driver, current_submission_id, row_data):
-                        completed_pages.add("MEMBERSHIP_PAGE_4")
-                        # Finaler Submit
-                        page_1_submit(driver, current_submission_id)
-                        print("🎉 MEMBERSHIP WORKFLOW ABGESCHLOSSEN!")
-                        return True
-                    else:
-                        print("⚠️ Membership Seite 4 fehlgeschlagen")
-                else:
-                    page_1_submit(driver, current_submission_id)
-                    return True
-                    
-            elif current_page == "MEMBERSHIP_FORM":
-                # Fallback für nicht-kategorisierte Membership-Forms
-                print("🆕 MEMBERSHIP FORM (Fallback)...")
-                if handle_new_membership_form(driver, current_submission_id, row_data):
-                    completed_pages.add("MEMBERSHIP_FORM")
-                    page_1_submit(driver, current_submission_id)
-                    time.sleep(1)
-                
-            elif current_page == "PAGE_2_COMPANY":
-                if "PAGE_2_COMPANY" not in completed_pages:
-                    print("🏢 Führe Standard Company-Daten Ausfüllung aus...")
-                    if page_2_fill_company_data(driver, current_submission_id, row_data):
-                        completed_pages.add("PAGE_2_COMPANY")
-                        if page_2_submit(driver, current_submission_id):
-                            time.sleep(1)
-                        else:
-                            print("⚠️ Submit fehlgeschlagen - versuche trotzdem fortzufahren")
-                            time.sleep(1)
-                    else:
-                        print("⚠️ Company-Daten Ausfüllung fehlgeschlagen")
-                else:
-                    page_2_submit(driver, current_submission_id)
-                    time.sleep(1)
-                
-            elif current_page == "PAGE_3_DETAILS":
-                if "PAGE_3_DETAILS" not in completed_pages:
-                    print("📋 Führe Details-Ausfüllung aus...")
-                    if page_3_additional_data(driver, current_submission_id, row_data):
-                        completed_pages.add("PAGE_3_DETAILS")
-                        if page_3_submit(driver, current_submission_id):
-                            time.sleep(0.5)
-                        else:
-                            print("⚠️ Submit fehlgeschlagen - versuche trotzdem fortzufahren")
-                            time.sleep(0.5)
-                    else:
-                        print("⚠️ Details-Ausfüllung fehlgeschlagen")
-                else:
-                    # Seite bereits bearbeitet, weiter navigieren
-                    page_3_submit(driver, current_submission_id)
-                    time.sleep(0.5)
-                
-            elif current_page == "PAGE_4_UPLOAD":
-                if "PAGE_4_UPLOAD" not in completed_pages:
-                    print("📎 Führe Upload und Finalisierung aus...")
-                    if page_4_pdf_upload_and_finish(driver, current_submission_id, pdf_file):
-                        completed_pages.add("PAGE_4_UPLOAD")
-                        print("✅ Upload-Seite abgeschlossen")
-                        time.sleep(0.5)
-                    else:
-                        print("⚠️ Upload/Finalisierung fehlgeschlagen")
-                else:
-                    print("✅ Upload bereits abgeschlossen")
-                    return True
-                
-            elif current_page == "UNKNOWN_FORM":
-                print("❓ Unbekannte Formular-Seite - versuche generische Behandlung")
-                # Versuche verfügbare Felder auszufüllen
-                try:
-                    record = row_data.to_dict() if hasattr(row_data, 'to_dict') else row_data
-                    
-                    # Firmenname
-                    company_name = record.get('Company Name', '')
-                    if company_name:
-                        inputs = driver.find_elements(By.TAG_NAME, "input")
-                        for inp in inputs:
-                            if inp.get_attribute('type') == 'text' and inp.is_displayed():
-                                try:
-                                    inp.clear()
-                                    inp.send_keys(company_name)
-                                    print(f"✅ Generisch ausgefüllt: {company_name}")
-                                    break
-                                except:
-                                    continue
-                    
-                    # Submit versuchen
-                    time.sleep(0.5)
-                    submit_buttons = driver.find_elements(By.CSS_SELECTOR, 'button[type="submit"], input[type="submit"]')
-                    for btn in submit_buttons:
-                        if btn.is_displayed():
-                            if safe_click_button(driver, btn, "Generischer Submit"):
+
+                        # Nach Packaging-Link suchen
+                        packaging_links = driver.find_elements(By.CSS_SELECTOR, 
+                            'a[href*="packaging"], a:contains("Packaging"), a:contains("📦")')
+
+                        for link in packaging_links:
+                            if link.is_displayed():
+                                link.click()
+                                print("✅ Fallback Dropdown-Navigation erfolgreich!")
                                 time.sleep(0.5)
                                 break
-                    
-                except Exception as e:
-                    print(f"⚠️ Generische Behandlung fehlgeschlagen: {e}")
-                
-            elif current_page == "ERROR":
-                print("❌ Seitenerkennung fehlgeschlagen - versuche manuellen Fortschritt")
-                # Versuche beliebigen Submit-Button
-                submit_buttons = driver.find_elements(By.TAG_NAME, "button")
-                for btn in submit_buttons:
-                    if btn.is_displayed():
-                        if safe_click_button(driver, btn, "Fallback-Button"):
-                            time.sleep(0.5)
-                            break
-                
-            else:
-                print(f"❓ Unbekannte Seite: {current_page}")
+                        else:
+                            continue
+                        break
+
+                    except:
+                        continue
+
+            # 2. Direkte URL als letzter Ausweg
+            if detect_current_page(driver) == "DASHBOARD":
+                print("🌐 Letzte Option: Direkte URL-Navigation...")
+                driver.get("https://friendly-captcha-demo.onrender.com/membership/new?type=packaging-paper")
                 time.sleep(0.5)
-            
-            # Verhindere Endlosschleifen auf derselben Seite
-            time.sleep(1)
+
+        except Exception as e:
+            print(f"⚠️ Fallback-Navigation fehlgeschlagen: {e}")
+    return True
+
+def handle_generic_form(driver, row_data):
+    """Unbekannte Formular-Seite: Firmenname eintragen und absenden"""
+    print("❓ Unbekannte Formular-Seite - versuche generische Behandlung")
+    try:
+        record = row_data.to_dict() if hasattr(row_data, 'to_dict') else row_data
+        
+        # Firmenname
+        company_name = record.get('Company Name', '')
+        if company_name:
+            inputs = driver.find_elements(By.TAG_NAME, "input")
+            for inp in inputs:
+                if inp.get_attribute('type') == 'text' and inp.is_displayed():
+                    try:
+                        inp.clear()
+                        inp.send_keys(company_name)
+                        print(f"✅ Generisch ausgefüllt: {company_name}")
+                        break
+                    except:
+                        continue
         
-        print(f"✅ Adaptiver Workflow beendet nach {iteration} Iterationen")
-        print(f"📊 Abgeschlossene Seiten: {completed_pages}")
+        # Submit versuchen
+        submit_buttons = driver.find_elements(By.CSS_SELECTOR, 'button[type="submit"], input[type="submit"]')
+        for btn in submit_buttons:
+            if btn.is_displayed() and safe_click_button(driver, btn, "Generischer Submit"):
+                return True
         
-        # Erfolg wenn mindestens 3 Seiten abgeschlossen wurden
-        return len(completed_pages) >= 3
+    except Exception as e:
+        print(f"⚠️ Generische Behandlung fehlgeschlagen: {e}")
+    return False
+
+def click_any_visible_button(driver):
+    """Letzter Ausweg bei unbekannten Seiten: ersten sichtbaren Button klicken"""
+    print("❌ Seitenerkennung fehlgeschlagen - versuche manuellen Fortschritt")
+    for btn in driver.find_elements(By.TAG_NAME, "button"):
+        if btn.is_displayed() and safe_click_button(driver, btn, "Fallback-Button"):
+            return True
+    return False
+
+def execute_adaptive_workflow(driver, excel_file, pdf_file, row_data, deadline=None):
+    """ADAPTIVER WORKFLOW - Zustandsmaschine mit vorhergesagter Folgeseite (siehe workflow_engine.py)"""
+    global last_row_reexecuted_pages
+    
+    def submit_after(page, fill, submit, description):
+        def handler(driver):
+            print(description)
+            if not fill(driver):
+                return False
+            dom_evidence.capture(driver, current_submission_id, page)
+            if not submit(driver, current_submission_id):
+                print("⚠️ Submit fehlgeschlagen - versuche trotzdem fortzufahren")
+            return True
+        return handler
+    
+    handlers = {
+        "LOGIN": lambda driver: handle_login_process(driver, current_submission_id),
+        "DASHBOARD": lambda driver: handle_dashboard(driver, current_submission_id),
+        "PAGE_1_PACKAGING": submit_after("PAGE_1_PACKAGING",
+            lambda driver: page_1_select_packaging(driver, current_submission_id),
+            page_1_submit, "📦 Führe Packaging-Auswahl aus..."),
+        "MEMBERSHIP_PAGE_1": submit_after("MEMBERSHIP_PAGE_1",
+            lambda driver: handle_membership_page_1(driver, current_submission_id, row_data),
+            page_1_submit, "🆕 MEMBERSHIP SEITE 1: Country & Company..."),
+        "MEMBERSHIP_PAGE_2": submit_after("MEMBERSHIP_PAGE_2",
+            lambda driver: handle_membership_page_2(driver, current_submission_id, row_data),
+            page_1_submit, "🆕 MEMBERSHIP SEITE 2: Business Activity..."),
+        "MEMBERSHIP_PAGE_3": submit_after("MEMBERSHIP_PAGE_3",
+            lambda driver: handle_membership_page_3(driver, current_submission_id, row_data),
+            page_1_submit, "🆕 MEMBERSHIP SEITE 3: Contact Information..."),
+        "MEMBERSHIP_PAGE_4": submit_after("MEMBERSHIP_PAGE_4",
+            lambda driver: handle_membership_page_4(driver, current_submission_id, row_data, pdf_file),
+            page_1_submit, "🆕 MEMBERSHIP SEITE 4: PDF Upload & Summary..."),
+        # Fallback-Formular sendet selbst ab
+        "MEMBERSHIP_FORM": lambda driver: handle_new_membership_form(driver, current_submission_id, row_data),
+        "PAGE_2_COMPANY": submit_after("PAGE_2_COMPANY",
+            lambda driver: page_2_fill_company_data(driver, current_submission_id, row_data, page_verified=True),
+            page_2_submit, "🏢 Führe Standard Company-Daten Ausfüllung aus..."),
+        "PAGE_3_DETAILS": submit_after("PAGE_3_DETAILS",
+            lambda driver: page_3_additional_data(driver, current_submission_id, row_data, page_verified=True),
+            page_3_submit, "📋 Führe Details-Ausfüllung aus..."),
+        "PAGE_4_UPLOAD": lambda driver: page_4_pdf_upload_and_finish(driver, current_submission_id, pdf_file, page_verified=True),
+        "UNKNOWN_FORM": lambda driver: handle_generic_form(driver, row_data),
+    }
+    
+    retry_policy = RetryPolicy()
+    last_row_reexecuted_pages = retry_policy.reexecuted
+    
+    try:
+        print("🎯 Starte adaptiven Workflow...")
+        engine = WorkflowEngine(handlers, detect_current_page, max_steps=10,
+                                fallback_handler=click_any_visible_button, deadline=deadline,
+                                retry_policy=retry_policy,
+                                page_probe=capture_page_metrics if get_tracer() else None)
+        success = engine.run(driver)
+        
+        print(f"✅ Adaptiver Workflow beendet nach {len(engine.completed_pages)} Seiten")
+        print(f"📊 Abgeschlossene Seiten: {engine.completed_pages}")
+        print(f"⚡ Vorhersagen: {engine.predictions['hit']} Treffer, {engine.predictions['miss']} volle Erkennungen")
+        if retry_policy.reexecuted:
+            print(f"🔁 Wiederholte Seiten: {', '.join(f'{page} ({failure})' for page, failure in retry_policy.reexecuted)}")
+        
+        # Erfolg nur wenn eine Endseite abgeschlossen wurde - Navigations-/Fallback-Seiten zählen nicht
+        return success
         
+    except DeadlineExceeded:
+        raise
     except Exception as e:
         print(f"❌ Adaptiver Workflow-Fehler: {e}")
         return False
@@ -2678,19 +2371,28 @@ def execute_full_4_page_workflow(driver, excel_file, pdf_file, row_data):
         print(f"❌ Workflow-Fehler: {e}")
         return False
 
-def run_single_automation(row_data, excel_file, pdf_file, row_index):
-    """Einzelnen Automation-Durchlauf ausführen"""
+def run_single_automation(row_data, excel_file, pdf_file, row_index, session=None):
+    """Einzelnen Automation-Durchlauf ausführen (mit session: Browser wird weiterverwendet)"""
     driver = None
-    global current_submission_id
+    global current_submission_id, last_row_failure_reason
+    current_submission_id = None
+    last_row_failure_reason = None
+    row_deadline = Deadline(ROW_BUDGET_SECONDS)
+    succeeded = False
     
     try:
-        print("🤖 Starte Browser...")
-        driver = setup_browser()
+        command_stats.start_row(row_index + 1)
+        screenshots.begin_row(row_index + 1)
+        if session is not None:
+            driver = session.acquire()
+        else:
+            print("🤖 Starte Browser...")
+            driver = instrument_driver(setup_browser())
         
         record = row_data.to_dict() if hasattr(row_data, 'to_dict') else row_data
         print(f"📋 Verarbeite: {record.get('Company Name', 'Unbekannt')} aus {record.get('Country', 'Unbekannt')}")
         
-        current_submission_id = db.create_submission(record, excel_file, row_index, pdf_file)
+        current_submission_id = get_db().create_submission(record, excel_file, row_index, pdf_file)
         print(f"📊 Submission ID: {current_submission_id}")
         
         url = "https://friendly-captcha-demo.onrender.com/"
@@ -2698,7 +2400,7 @@ def run_single_automation(row_data, excel_file, pdf_file, row_index):
         driver.get(url)
         time.sleep(0.5)
         
-        db.log_http_request(
+        get_db().log_http_request(
             current_submission_id, 
             driver.current_url, 
             "GET",
@@ -2706,28 +2408,53 @@ def run_single_automation(row_data, excel_file, pdf_file, row_index):
             form_data={"step": "initial_page_load", "row_index": row_index}
         )
         
-        # Login-Prozess
-        success = handle_login_process(driver, current_submission_id)
-        if not success:
-            print("❌ Login fehlgeschlagen")
-            return False
-        
-        # Vollständiger adaptiver Workflow
-        success = execute_adaptive_workflow(driver, excel_file, pdf_file, row_data)
-        if not success:
-            print("❌ Adaptiver Workflow fehlgeschlagen")
-            return False
+        with budget.scope(row_deadline), span('row', row=row_index + 1, submission_id=current_submission_id):
+            # Login-Prozess
+            with span('login'), attribute_to('LOGIN'):
+                success = handle_login_process(driver, current_submission_id)
+            if not success:
+                print("❌ Login fehlgeschlagen")
+                last_row_failure_reason = "login_failed"
+                return False
+            
+            # Vollständiger adaptiver Workflow
+            success = execute_adaptive_workflow(driver, excel_file, pdf_file, row_data, deadline=row_deadline)
+            if not success:
+                print("❌ Adaptiver Workflow fehlgeschlagen")
+                last_row_failure_reason = "workflow_failed"
+                return False
         
         print("✅ Automation erfolgreich abgeschlossen")
+        succeeded = True
         return True
         
+    except DeadlineExceeded as e:
+        print(f"⏱️ Zeile {row_index + 1} abgebrochen ({e.reason}): {e.detail}")
+        last_row_failure_reason = e.reason
+        if current_submission_id:
+            get_db().log_evidence(current_submission_id, "abort_reason", f"{e.reason}: {e.detail}")
+        return False
+        
     except Exception as e:
         print(f"💥 Durchlauf-Fehler {row_index + 1}: {e}")
+        last_row_failure_reason = f"error:{type(e).__name__}"
         return False
         
     finally:
-        if driver:
+        if driver and not succeeded:
+            screenshots.capture(driver, current_submission_id, "failure_screenshot", failure=True)
+            dom_evidence.capture(driver, current_submission_id, "FAILURE")
+        if session is not None:
+            session.release()
+        elif driver:
+            reset_cdp_metrics(driver)
             driver.quit()
+        if _selector_ranker is not None:
+            _selector_ranker.flush()
+        if get_tracer():
+            get_tracer().flush()
+        if INSTRUMENT:
+            command_stats.print_row_report()
 
 def validate_excel_gui_feedback(excel_file):
     """Excel-Validierung mit GUI-Feedback"""
@@ -2737,6 +2464,10 @@ def validate_excel_gui_feedback(excel_file):
         if validation_result['is_valid']:
             print(f"✅ Excel-Validierung erfolgreich")
             print(f"📊 {validation_result['row_count']} Zeilen, {len(validation_result['found_columns'])} Spalten")
+            if validation_result['row_errors']:
+                print(f"🚨 {len(validation_result['row_errors'])} Zeilen mit Fehlern (leere Pflichtfelder, E-Mail, PDF-Spalte)")
+            if validation_result['row_warnings']:
+                print(f"⚠️ {len(validation_result['row_warnings'])} Zeilen mit unbekannten Country-/Salutation-Werten (Hinweis)")
             return True
         else:
             print(f"❌ Excel-Validierung fehlgeschlagen")
@@ -2747,62 +2478,111 @@ def validate_excel_gui_feedback(excel_file):
         print(f"❌ Validierungsfehler: {e}")
         return False
 
+def load_workbook_rows(excel_file):
+    """Validierte, bereinigte Zeilen einer Arbeitsmappe (wirft bei ungültiger Datei)"""
+    if not validate_excel_gui_feedback(excel_file):
+        raise ValueError("Excel-Validierung fehlgeschlagen")
+    df = load_excel(excel_file)  # bereits bei der Validierung eingelesen
+    if df.empty:
+        raise ValueError("Keine Excel-Daten")
+    return df.dropna(how='all')
+
 def main():
     """HAUPTFUNKTION - KORREKTE BUTTON-KLICK VERSION"""
     print("🚀 INTERZERO AUTOMATION - KORREKTE BUTTON-KLICK VERSION")
     print("="*50)
     
-    excel_file, pdf_file = select_files_gui()
-    if not excel_file:
-        print("❌ Keine Excel-Datei gewählt - Automation beendet")
-        return
-
-    if not validate_excel_gui_feedback(excel_file):
-        print("❌ Excel-Validierung fehlgeschlagen - Automation beendet")
-        return
-
-    try:
-        df = pd.read_excel(excel_file)
-        if df.empty:
-            print("❌ Keine Excel-Daten - Automation beendet")
+    batch_paths = batch_arguments()
+    if batch_paths is not None:
+        workbooks = discover_workbooks(batch_paths)
+        if not workbooks:
+            print("❌ Keine Excel-Dateien für den Batch gefunden - Automation beendet")
             return
+    else:
+        from file_selector_gui import select_files_gui
         
-        df_clean = df.dropna(how='all')
-        row_count = len(df_clean)
-        
-        print(f"\n🎯 AUTOMATION SETUP:")
-        print(f"   📊 Excel: {os.path.basename(excel_file)}")
-        print(f"   📄 PDF: {os.path.basename(pdf_file) if pdf_file else 'Keine PDF'}")
-        print(f"   📋 Zeilen: {row_count}")
-        print(f"   🔄 Durchläufe: {row_count}")
-        print("="*50)
-        
-    except Exception as e:
-        print(f"❌ Fehler beim Excel-Laden: {e}")
+        excel_file, pdf_file = select_files_gui()
+        if not excel_file:
+            print("❌ Keine Excel-Datei gewählt - Automation beendet")
+            return
+        workbooks = [Workbook(excel_file, pdf_file)]
+    
+    pdf_index = PdfIndex(index_folders([workbook.excel_file for workbook in workbooks]))
+    print(f"📄 PDF-Index: {len(pdf_index)} Dokumente in {len(pdf_index.folders)} Ordner(n)")
+    row_queue = build_queue(workbooks, load_workbook_rows,
+                            resolve_pdf=lambda workbook, row_data: pdf_index.resolve(row_data, workbook.pdf_file))
+    if not row_queue:
+        print("❌ Keine gültigen Excel-Daten - Automation beendet")
         return
+    row_count = len(row_queue)
+    print_missing_documents([(workbook.name, row, company, problem)
+                             for workbook in workbooks for row, company, problem in workbook.missing_documents])
+    
+    print("\n🎯 AUTOMATION SETUP:")
+    for workbook in workbooks:
+        if workbook.error:
+            continue
+        print(f"   📊 Excel: {workbook.name} ({workbook.rows} Zeilen)")
+        print(f"   📄 PDF: {os.path.basename(workbook.pdf_file) if workbook.pdf_file else 'Keine PDF'}")
+    print(f"   📋 Zeilen: {row_count}")
+    print(f"   🔄 Durchläufe: {row_count}")
+    print("="*50)
 
+    db = get_db()
+    tracer = activate(Tracer(db))
+    print(f"⏱️ Tracing aktiv - Lauf-ID: {tracer.run_id}")
+    reporter = RunReporter(db, tracer.run_id).start()
+    results = ResultWriter(tracer.run_id, os.path.dirname(os.path.abspath(row_queue[0][0].excel_file))).start()
+    monitor = start_monitor(row_count, queue_depth=lambda: tracer.pending() + screenshots.pending() + dom_evidence.pending())
+    log.info('run.started', total=row_count, run_id=tracer.run_id)
+    session = BrowserSession(lambda: instrument_driver(setup_browser()))
+    
     successful_runs = 0
     failed_runs = 0
+    reexecuted_pages = 0  # Seiten-Wiederholungen in erfolgreichen Zeilen
     
-    for row_index, row_data in df_clean.iterrows():
-        print(f"\n" + "="*60)
-        print(f"🚀 DURCHLAUF {row_index + 1} von {row_count}")
-        print(f"📋 Unternehmen: {row_data.get('Company Name', 'Unbekannt')}")
-        print(f"🌍 Land: {row_data.get('Country', 'Unbekannt')}")
-        print("="*60)
-        
-        success = run_single_automation(row_data, excel_file, pdf_file, row_index)
-        
-        if success:
-            successful_runs += 1
-            print(f"✅ Durchlauf {row_index + 1} erfolgreich!")
-        else:
-            failed_runs += 1
-            print(f"❌ Durchlauf {row_index + 1} fehlgeschlagen!")
-        
-        if row_index < len(df_clean) - 1:
-            print(f"⏳ Pause vor nächstem Durchlauf...")
-            time.sleep(0.5)
+    try:
+        position = 0
+        while row_queue:
+            workbook, row_index, row_data, pdf_file = row_queue.popleft()
+            position += 1
+            print("\n" + "="*60)
+            print(f"🚀 DURCHLAUF {position} von {row_count} ({workbook.name}, Zeile {row_index + 1})")
+            print(f"📋 Unternehmen: {row_data.get('Company Name', 'Unbekannt')}")
+            print(f"🌍 Land: {row_data.get('Country', 'Unbekannt')}")
+            print("="*60)
+            
+            log.info('run.row_started', row=row_index + 1, workbook=workbook.name,
+                     company=row_data.get('Company Name', 'Unbekannt'))
+            row_started = time.monotonic()
+            success = run_single_automation(row_data, workbook.excel_file, pdf_file, row_index, session=session)
+            row_seconds = time.monotonic() - row_started
+            log.info('run.row_finished', row=row_index + 1, workbook=workbook.name, success=bool(success),
+                     seconds=round(row_seconds, 3), submission_id=current_submission_id,
+                     reason=None if success else last_row_failure_reason or "unknown")
+            workbook.record(success, row_seconds, len(last_row_reexecuted_pages))
+            
+            if success:
+                successful_runs += 1
+                reexecuted_pages += len(last_row_reexecuted_pages)
+                print(f"✅ Durchlauf {position} erfolgreich!")
+            else:
+                failed_runs += 1
+                print(f"❌ Durchlauf {position} fehlgeschlagen!")
+            
+            if row_queue:
+                print("⏳ Pause vor nächstem Durchlauf...")
+                time.sleep(0.5)
+    finally:
+        session.close()
+        screenshots.close()
+        dom_evidence.close()
+        results.close()  # auch bei Abbruch: Excel abschließen, CSV ist ohnehin aktuell
+        # Auch bei Ausnahme/Strg+C: Dashboard abschließen, Abonnements lösen
+        log.info('run.finished', done=successful_runs, failed=failed_runs)
+        reporter.stop()
+        if monitor:
+            monitor.stop()
     
     print(f"\n" + "="*60)
     print(f"📊 AUTOMATION ZUSAMMENFASSUNG")
@@ -2810,6 +2590,8 @@ def main():
     print(f"✅ Erfolgreich: {successful_runs}")
     print(f"❌ Fehlgeschlagen: {failed_runs}")
     print(f"📋 Gesamt: {successful_runs + failed_runs}/{row_count}")
+    if successful_runs:
+        print(f"🔁 Wiederholte Seiten: {reexecuted_pages} (Ø {reexecuted_pages / successful_runs:.2f} pro erfolgreicher Zeile)")
     
     if successful_runs == row_count:
         print(f"🎉 ALLE DURCHLÄUFE ERFOLGREICH!")
@@ -2818,8 +2600,28 @@ def main():
     else:
         print(f"💥 ALLE DURCHLÄUFE FEHLGESCHLAGEN!")
     
+    print_workbook_summary(workbooks, session)
+    screenshots.print_summary()
+    dom_evidence.print_summary()
+    
+    tracer.flush()
+    print_span_summary(db, tracer.run_id)
+    print("📊 Historische Berichte: python run_report.py --html bericht.html --excel bericht.xlsx")
+    print_page_metrics_report(db, tracer.run_id)
+    if INSTRUMENT:
+        command_stats.print_summary()
+    
     print("="*60)
     input("⏸️ ENTER zum Beenden...")
 
 if __name__ == "__main__":
-    main()
+    if PROFILE:
+        profiler = SamplingProfiler().start()
+        try:
+            main()
+        finally:
+            profiler.stop()
+            profiler.write_collapsed()
+            profiler.print_top()
+    else:
+        main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+💤 LAZY IMPORTS - Schwere Module erst bei der ersten Verwendung laden
+pandas, Selenium, tkinter und requests kosten beim Start spürbar Zeit.
+LazyModule / lazy_attribute sind Platzhalter, die das echte Modul beim
+ersten Attributzugriff bzw. Aufruf importieren und danach nur noch
+weiterreichen.
+"""
+import importlib
+
+
+class LazyModule:
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def _load(self):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attribute):
+        return getattr(self._load(), attribute)
+
+    def __repr__(self):
+        state = 'geladen' if self._module is not None else 'nicht geladen'
+        return f"<LazyModule {self._name} ({state})>"
+
+
+class _LazyAttribute:
+    def __init__(self, module, attribute):
+        self._module = module
+        self._attribute = attribute
+        self._target = None
+
+    def _load(self):
+        if self._target is None:
+            self._target = getattr(importlib.import_module(self._module), self._attribute)
+        return self._target
+
+    def __getattr__(self, attribute):
+        return getattr(self._load(), attribute)
+
+    def __call__(self, *args, **kwargs):
+        return self._load()(*args, **kwargs)
+
+    def __repr__(self):
+        return f"<lazy {self._module}.{self._attribute}>"
+
+
+def lazy_attribute(module, attribute):
+    """Platzhalter für eine Klasse/Funktion aus einem schweren Modul (z.B. By, WebDriverWait)"""
+    return _LazyAttribute(module, attribute)
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+🔎 OPTION INDEX - Indexierte Suche in <select>-Optionen
+Alle Optionen eines Dropdowns werden mit einem Script-Aufruf gelesen und
+als Index (normalisierter Text, Value, Aliase) pro Options-Hash gecacht.
+Auswahl = Lookup im Index + eine Value-Zuweisung im Browser.
+"""
+import hashlib
+import re
+import unicodedata
+
+# Länder: Englisch, Deutsch, ISO-Codes (alpha-2 / alpha-3)
+COUNTRY_ALIASES = {
+    'germany': ['germany', 'deutschland', 'de', 'deu', 'ger', 'german', 'bundesrepublik deutschland'],
+    'austria': ['austria', 'österreich', 'oesterreich', 'at', 'aut'],
+    'switzerland': ['switzerland', 'schweiz', 'suisse', 'svizzera', 'ch', 'che'],
+    'france': ['france', 'frankreich', 'fr', 'fra'],
+    'italy': ['italy', 'italien', 'italia', 'it', 'ita'],
+    'spain': ['spain', 'spanien', 'españa', 'es', 'esp'],
+    'portugal': ['portugal', 'pt', 'prt'],
+    'netherlands': ['netherlands', 'niederlande', 'holland', 'the netherlands', 'nl', 'nld'],
+    'belgium': ['belgium', 'belgien', 'belgique', 'be', 'bel'],
+    'luxembourg': ['luxembourg', 'luxemburg', 'lu', 'lux'],
+    'denmark': ['denmark', 'dänemark', 'daenemark', 'dk', 'dnk'],
+    'sweden': ['sweden', 'schweden', 'se', 'swe'],
+    'norway': ['norway', 'norwegen', 'no', 'nor'],
+    'finland': ['finland', 'finnland', 'fi', 'fin'],
+    'poland': ['poland', 'polen', 'polska', 'pl', 'pol'],
+    'czech republic': ['czech republic', 'czechia', 'tschechien', 'tschechische republik', 'cz', 'cze'],
+    'slovakia': ['slovakia', 'slowakei', 'sk', 'svk'],
+    'hungary': ['hungary', 'ungarn', 'hu', 'hun'],
+    'slovenia': ['slovenia', 'slowenien', 'si', 'svn'],
+    'croatia': ['croatia', 'kroatien', 'hr', 'hrv'],
+    'romania': ['romania', 'rumänien', 'rumaenien', 'ro', 'rou'],
+    'bulgaria': ['bulgaria', 'bulgarien', 'bg', 'bgr'],
+    'greece': ['greece', 'griechenland', 'gr', 'grc'],
+    'ireland': ['ireland', 'irland', 'ie', 'irl'],
+    'united kingdom': ['united kingdom', 'great britain', 'großbritannien', 'grossbritannien',
+                       'vereinigtes königreich', 'england', 'uk', 'gb', 'gbr'],
+    'united states': ['united states', 'united states of america', 'usa', 'vereinigte staaten', 'us'],
+    'liechtenstein': ['liechtenstein', 'li', 'lie'],
+    'estonia': ['estonia', 'estland', 'eesti', 'ee', 'est'],
+    'latvia': ['latvia', 'lettland', 'latvija', 'lv', 'lva'],
+    'lithuania': ['lithuania', 'litauen', 'lietuva', 'lt', 'ltu'],
+    'malta': ['malta', 'mt', 'mlt'],
+    'cyprus': ['cyprus', 'zypern', 'kypros', 'cy', 'cyp'],
+    'iceland': ['iceland', 'island', 'ísland', 'is', 'isl'],
+    'monaco': ['monaco', 'mc', 'mco'],
+    'andorra': ['andorra', 'ad', 'and'],
+    'san marino': ['san marino', 'sm', 'smr'],
+    'serbia': ['serbia', 'serbien', 'srbija', 'rs', 'srb'],
+    'bosnia and herzegovina': ['bosnia and herzegovina', 'bosnien und herzegowina', 'bosnien-herzegowina',
+                               'bosnia', 'bosnien', 'ba', 'bih'],
+    'montenegro': ['montenegro', 'me', 'mne'],
+    'north macedonia': ['north macedonia', 'nordmazedonien', 'macedonia', 'mazedonien', 'mk', 'mkd'],
+    'albania': ['albania', 'albanien', 'al', 'alb'],
+    'kosovo': ['kosovo', 'xk', 'xkx'],
+    'moldova': ['moldova', 'moldau', 'republik moldau', 'md', 'mda'],
+    'ukraine': ['ukraine', 'ua', 'ukr'],
+    'belarus': ['belarus', 'weißrussland', 'weissrussland', 'by', 'blr'],
+    'turkey': ['turkey', 'türkei', 'tuerkei', 'türkiye', 'turkiye', 'tr', 'tur'],
+    'canada': ['canada', 'kanada', 'ca', 'can'],
+    'china': ['china', 'volksrepublik china', 'cn', 'chn'],
+    'japan': ['japan', 'jp', 'jpn'],
+    'australia': ['australia', 'australien', 'au', 'aus'],
+}
+
+SALUTATION_ALIASES = {
+    'mr': ['mr', 'mr.', 'herr', 'hr.', 'mister', 'sir', 'herr dr.', 'herr prof.', 'monsieur', 'signor'],
+    'ms': ['ms', 'ms.', 'mrs', 'mrs.', 'miss', 'frau', 'fr.', 'frau dr.', 'frau prof.', 'madame', 'signora'],
+    'diverse': ['diverse', 'divers', 'mx', 'mx.'],
+    'dr': ['dr', 'dr.', 'doktor', 'doctor', 'dr. med.', 'dr. ing.'],
+    'prof': ['prof', 'prof.', 'professor', 'prof. dr.'],
+}
+
+OPTIONS_SNAPSHOT_JS = """
+return Array.prototype.map.call(arguments[0].options, function (option) {
+    return [option.text || '', option.value || ''];
+});
+"""
+
+SELECT_VALUE_JS = """
+var select = arguments[0];
+select.value = arguments[1];
+select.dispatchEvent(new Event('input', {bubbles: true}));
+select.dispatchEvent(new Event('change', {bubbles: true}));
+return select.value;
+"""
+
+# Platzhalter-Optionen ("Please select", "-- Bitte wählen --", "---") - nie auswählen
+PLACEHOLDER_PATTERN = re.compile(r'^[-\s.]*((please\s+)?(select|choose)\b|bitte\s+(aus)?wählen|auswählen\b|[-.]*$)')
+
+# Typische Sentinel-Values einer vorangestellten Platzhalter-Option
+PLACEHOLDER_VALUES = ('0', '-1', 'none', 'null')
+
+# Index-Cache pro Options-Hash (gleiche Optionen → gleicher Index)
+_index_cache = {}
+_alias_cache = {}
+
+
+def normalize(text):
+    """Kleinschreibung, ohne Emoji/Satzzeichen-Rauschen, Whitespace zusammengefasst"""
+    text = unicodedata.normalize('NFKC', str(text or '')).lower()
+    text = re.sub(r'[^\w\s.&-]', ' ', text)
+    return ' '.join(text.split())
+
+
+def _alias_lookup(aliases):
+    """alias → kanonischer Schlüssel (einmal pro Alias-Tabelle berechnet)"""
+    if not aliases:
+        return {}
+    lookup = _alias_cache.get(id(aliases))
+    if lookup is None:
+        lookup = {normalize(alias): canonical for canonical, names in aliases.items() for alias in names}
+        _alias_cache[id(aliases)] = lookup
+    return lookup
+
+
+def is_placeholder(text, value, leading=False):
+    """Platzhalter-Option: leerer Value, Platzhalter-Text oder (als erste Option) ein Sentinel-Value"""
+    if value == '' or PLACEHOLDER_PATTERN.match(normalize(text)):
+        return True
+    return leading and str(value).strip().lower() in PLACEHOLDER_VALUES
+
+
+class OptionIndex:
+    def __init__(self, options, aliases=None):
+        # Platzhalter wie "Please select" (leerer Value, Value 0/-1) werden nicht indexiert
+        self.options = [(text.strip(), value) for position, (text, value) in enumerate(options)
+                        if text.strip() and not is_placeholder(text, value, leading=position == 0)]
+        self._alias_map = _alias_lookup(aliases)
+        self._by_key = {}
+        self._by_alias = {}
+
+        for text, value in self.options:
+            for key in (normalize(text), normalize(value)):
+                if key:
+                    self._by_key.setdefault(key, (text, value))
+                    canonical = self._alias_map.get(key)
+                    if canonical:
+                        self._by_alias.setdefault(canonical, (text, value))
+
+    def lookup(self, query):
+        """Option (text, value) für einen Excel-Wert oder None"""
+        key = normalize(query)
+        if not key:
+            return None
+
+        option = self._by_key.get(key)
+        if option:
+            return option
+
+        canonical = self._alias_map.get(key)
+        if canonical and canonical in self._by_alias:
+            return self._by_alias[canonical]
+
+        # Fallback: Teilstring in beide Richtungen (z.B. "Mr" ↔ "Mr.", "Paper" ↔ "Paper Production")
+        if len(key) > 2:
+            for text, value in self.options:
+                option_key = normalize(text)
+                if key in option_key or (len(option_key) > 2 and option_key in key):
+                    return (text, value)
+        return None
+
+    def find_containing(self, keywords):
+        """Erste Option deren Text eines der Keywords enthält"""
+        for text, value in self.options:
+            option_key = normalize(text)
+            if any(keyword in option_key for keyword in keywords):
+                return (text, value)
+        return None
+
+    def first(self):
+        """Erste echte Option (Platzhalter sind bereits herausgefiltert)"""
+        return self.options[0] if self.options else None
+
+
+def get_option_index(driver, select_element, aliases=None):
+    """Index für ein <select> - ein Script-Aufruf, gecacht pro Options-Hash"""
+    options = driver.execute_script(OPTIONS_SNAPSHOT_JS, select_element) or []
+    digest = hashlib.sha1(repr((options, sorted((aliases or {}).keys()))).encode('utf-8')).hexdigest()
+    index = _index_cache.get(digest)
+    if index is None:
+        index = OptionIndex(options, aliases)
+        _index_cache[digest] = index
+    return index
+
+
+def select_option(driver, select_element, option):
+    """Wählt eine Option (text, value) per Value-Zuweisung; True wenn übernommen"""
+    text, value = option
+    return driver.execute_script(SELECT_VALUE_JS, select_element, value) == value
+
+
+def is_known_alias(value, aliases):
+    """Prüft einen Excel-Wert gegen die Alias-Tabelle (für Zeilen-Validierung vor dem Lauf)"""
+    return normalize(value) in _alias_lookup(aliases)
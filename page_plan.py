@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+🗺️ PAGE PLAN CACHE - Feld-Zuordnung pro Formular-Struktur
+Die Formular-Struktur einer Seite wird per Fingerprint erkannt; die
+Zuordnung Feld → Excel-Spalte wird nur einmal berechnet und in der
+Datenbank gespeichert. Folgende Zeilen füllen direkt aus dem Plan.
+"""
+import hashlib
+
+# Ein Script-Aufruf liefert alle Formular-Elemente mit Struktur-Attributen
+FORM_SNAPSHOT_JS = """
+return Array.prototype.map.call(document.querySelectorAll('input, select, textarea'), function (field, index) {
+    var style = window.getComputedStyle(field);
+    return {
+        element: field,
+        index: index,
+        tag: field.tagName.toLowerCase(),
+        type: (field.getAttribute('type') || (field.tagName.toLowerCase() === 'input' ? 'text' : '')).toLowerCase(),
+        name: field.getAttribute('name') || '',
+        id: field.id || '',
+        placeholder: field.getAttribute('placeholder') || '',
+        displayed: field.getClientRects().length > 0 && style.visibility !== 'hidden' && style.display !== 'none',
+        enabled: !field.disabled
+    };
+});
+"""
+
+# Input-Typen die als Textfelder ausgefüllt werden
+TEXT_INPUT_TYPES = ('text', 'email', 'tel')
+
+# Excel-Spalten pro Feld (erste nicht-leere Spalte gewinnt)
+FIELD_COLUMNS = {
+    'email': ['Email Adress', 'Email Address'],
+    'phone': ['Phone', 'Phone Number'],
+    'first_name': ['First Name'],
+    'last_name': ['Last Name'],
+    'street': ['Number and Street'],
+    'postal_code': ['Postal Code'],
+    'city': ['City'],
+    'country': ['Country', 'Country2'],
+    'website': ['Website'],
+    'company_name': ['Company Name'],
+}
+
+FIELD_DESCRIPTIONS = {
+    'email': "Email Address",
+    'phone': "Phone Number",
+    'first_name': "First Name",
+    'last_name': "Last Name",
+    'street': "Street & Number",
+    'postal_code': "Postal Code",
+    'city': "City",
+    'country': "Country",
+    'website': "Website",
+    'company_name': "Company Name",
+}
+
+# In-Process Cache: (page_type, fingerprint) → Plan
+_plan_cache = {}
+
+
+def snapshot_form(driver):
+    """Liest alle Formular-Elemente der Seite mit einem einzigen execute_script"""
+    return driver.execute_script(FORM_SNAPSHOT_JS) or []
+
+
+def form_fingerprint(fields):
+    """Stabiler Fingerprint der Formular-Struktur (ohne Werte und Sichtbarkeit)"""
+    structure = "\n".join(
+        f"{field['tag']}|{field['type']}|{field['name']}|{field['id']}|{field['placeholder']}"
+        for field in fields
+    )
+    return hashlib.sha1(structure.encode('utf-8')).hexdigest()
+
+
+def classify_input_field(attributes, field_type):
+    """Feld-Zuordnung über Keywords - SPEZIFISCHE KEYWORDS ZUERST!"""
+    if field_type == 'email' or 'email' in attributes:
+        return 'email'
+    if field_type == 'tel' or 'phone' in attributes:
+        return 'phone'
+    if 'first' in attributes and 'name' in attributes:
+        return 'first_name'
+    if 'last' in attributes and 'name' in attributes:
+        return 'last_name'
+    if 'street' in attributes or 'address' in attributes:
+        return 'street'
+    if 'postal' in attributes or 'zip' in attributes or 'plz' in attributes:
+        return 'postal_code'
+    if 'city' in attributes or 'stadt' in attributes:
+        return 'city'
+    if 'country' in attributes or 'land' in attributes:
+        return 'country'
+    if 'website' in attributes or 'web' in attributes or 'url' in attributes:
+        return 'website'
+    # COMPANY NAME (nur als letzter Fallback)
+    if 'company' in attributes and not any(specific in attributes for specific in ['street', 'postal', 'city', 'country', 'phone']):
+        return 'company_name'
+    return None
+
+
+def build_plan(fields):
+    """Berechnet die Zuordnung Snapshot-Index → Feld für alle Textfelder"""
+    plan = []
+    for field in fields:
+        if field['tag'] != 'input' or field['type'] not in TEXT_INPUT_TYPES:
+            continue
+        attributes = f"{field['name']} {field['id']} {field['placeholder']}".lower()
+        field_key = classify_input_field(attributes, field['type'])
+        if field_key:
+            plan.append({'index': field['index'], 'field': field_key, 'attributes': attributes})
+    return plan
+
+
+def resolve_row_values(record):
+    """Excel-Werte für alle bekannten Felder (bereinigt)"""
+    values = {}
+    for field_key, columns in FIELD_COLUMNS.items():
+        value = ''
+        for column in columns:
+            value = str(record.get(column, '') or '').strip()
+            if value:
+                break
+        values[field_key] = value
+    return values
+
+
+def get_page_plan(driver, page_type, db):
+    """
+    Liefert (plan, fields, fingerprint, cache_hit) für die aktuelle Seite.
+
+    Analyse läuft nur, wenn der Fingerprint weder im Speicher noch in der
+    Datenbank bekannt ist.
+    """
+    fields = snapshot_form(driver)
+    fingerprint = form_fingerprint(fields)
+    cache_key = (page_type, fingerprint)
+
+    plan = _plan_cache.get(cache_key)
+    if plan is None:
+        plan = db.get_page_plan(page_type, fingerprint)
+        if plan is None:
+            plan = build_plan(fields)
+            db.save_page_plan(page_type, fingerprint, plan)
+            _plan_cache[cache_key] = plan
+            return plan, fields, fingerprint, False
+        _plan_cache[cache_key] = plan
+
+    return plan, fields, fingerprint, True
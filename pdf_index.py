@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+📄 PDF INDEX - Dokument pro Zeile aus einem einmal aufgebauten Ordner-Index
+Die PDF-Ordner werden beim Start genau einmal gelesen (Name, Pfad, Größe).
+Pro Zeile wird das Dokument so aufgelöst:
+
+    1. PDF-Spalte der Zeile (Dateiname oder Pfad, siehe PDF_COLUMNS)
+    2. Dateiname passend zum Firmennamen (z.B. "ACME GmbH" → acme_gmbh.pdf)
+    3. die für die Arbeitsmappe gewählte PDF
+
+Fehlende, leere oder zu große Dokumente werden vor dem Lauf gemeldet.
+Zusätzliche Ordner: IZ_PDF_DIR (mehrere mit os.pathsep getrennt).
+"""
+import os
+import re
+
+# Spalten mit explizitem Dokument pro Zeile
+PDF_COLUMNS = ['PDF', 'PDF File', 'PDF Datei', 'Document', 'Dokument']
+
+# Größere Dateien lehnt das Upload-Formular ab
+MAX_PDF_BYTES = int(float(os.environ.get('IZ_MAX_PDF_MB', '10')) * 1024 * 1024)
+
+
+def normalize_key(text):
+    """Vergleichsschlüssel: Kleinbuchstaben, nur Buchstaben/Ziffern"""
+    return re.sub(r'[^0-9a-z]+', '', str(text).lower())
+
+
+def check_document(path):
+    """None wenn die Datei hochgeladen werden kann, sonst der Grund"""
+    try:
+        size = os.path.getsize(path)
+    except OSError:
+        return "Datei nicht gefunden"
+    if size == 0:
+        return "Datei ist leer"
+    if size > MAX_PDF_BYTES:
+        return f"Datei zu groß ({size / 1024 / 1024:.1f} MB)"
+    return None
+
+
+def _cell(record, column):
+    value = record.get(column)
+    if value is None or value != value:  # NaN
+        return ''
+    return str(value).strip()
+
+
+class PdfIndex:
+    def __init__(self, folders):
+        self.by_name = {}  # Dateiname (klein) → Pfad
+        self.by_key = {}   # normalisierter Dateiname ohne Endung → Pfad
+        self.folders = []
+        for folder in folders:
+            folder = os.path.abspath(folder)
+            if folder in self.folders or not os.path.isdir(folder):
+                continue
+            self.folders.append(folder)
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    if entry.is_file() and entry.name.lower().endswith('.pdf'):
+                        # Erster Treffer gewinnt (Reihenfolge der Ordner)
+                        self.by_name.setdefault(entry.name.lower(), entry.path)
+                        self.by_key.setdefault(normalize_key(os.path.splitext(entry.name)[0]), entry.path)
+
+    def __len__(self):
+        return len(self.by_name)
+
+    def lookup(self, name):
+        """Pfad zu einem Dateinamen/Pfad aus der Excel (mit oder ohne .pdf)"""
+        if os.path.isabs(name) and os.path.isfile(name):
+            return name
+        base = os.path.basename(name).lower()
+        return (self.by_name.get(base) or self.by_name.get(base + '.pdf')
+                or self.by_key.get(normalize_key(os.path.splitext(base)[0])))
+
+    def resolve(self, record, default=None):
+        """
+        Dokument einer Zeile; liefert (Pfad oder None, Problem oder None).
+
+        Eine PDF-Spalte ist verbindlich - ist die dort genannte Datei nicht
+        im Index, wird nicht stillschweigend auf die Standard-PDF ausgewichen.
+        """
+        for column in PDF_COLUMNS:
+            name = _cell(record, column)
+            if name:
+                path = self.lookup(name)
+                if path is None:
+                    return None, f"'{name}' nicht gefunden"
+                return path, check_document(path)
+
+        company = normalize_key(_cell(record, 'Company Name'))
+        if company and company in self.by_key:
+            path = self.by_key[company]
+            return path, check_document(path)
+
+        if default:
+            return default, check_document(default)
+        return None, "kein Dokument zugeordnet"
+
+
+def index_folders(excel_files=(), extra=None):
+    """Ordner der Arbeitsmappen, Arbeitsverzeichnis und IZ_PDF_DIR"""
+    folders = [os.path.dirname(os.path.abspath(excel_file)) for excel_file in excel_files]
+    folders.append(os.getcwd())
+    extra = extra if extra is not None else os.environ.get('IZ_PDF_DIR', '')
+    folders += [folder for folder in extra.split(os.pathsep) if folder]
+    return folders
+
+
+def print_missing_documents(problems, limit=20):
+    """problems: Liste (Arbeitsmappe, Zeile, Firma, Problem)"""
+    if not problems:
+        print("📄 Dokumente: allen Zeilen ist eine PDF zugeordnet")
+        return
+    print(f"\n⚠️ {len(problems)} Zeile(n) ohne gültiges Dokument (Upload wird übersprungen):")
+    for workbook, row, company, problem in problems[:limit]:
+        print(f"   • {workbook} Zeile {row} ({company}): {problem}")
+    if len(problems) > limit:
+        print(f"   … {len(problems) - limit} weitere")
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+📻 RADIO RULES - Deklarative Regeln für Radio-Button-Klassifizierung
+Regeltabelle wird einmal beim Import kompiliert; alle Radios einer Seite
+werden in einem Durchlauf über einen DOM-Snapshot klassifiziert.
+"""
+import re
+
+# Excel-Werte die als Ja/Nein interpretiert werden
+YES_VALUES = ('yes', 'ja', 'true', '1', 'x', 'y')
+NO_VALUES = ('no', 'nein', 'false', '0', 'n')
+
+# Fragen: woran erkennt man zu welcher Frage ein Radio-Button gehört
+RADIO_QUESTIONS = {
+    'online_store': ['online', 'store', 'shop', 'ecommerce', 'e-commerce'],
+}
+
+# Antworten: Ja/Nein-Keywords im Radio-Text (value, name, id, label)
+RADIO_ANSWERS = {
+    'yes': ['yes', 'ja', 'true'],
+    'no': ['no', 'nein', 'false', 'not', 'kein'],
+}
+
+# "In their online store, my client sells…" - erste passende Regel gewinnt
+SELLS_RULES = [
+    {
+        'phrase': 'products they own',
+        'any': ['own', 'they'],
+        'exclude': ['other', 'vendor', 'both'],
+        'reason': "'Products they own' Match",
+    },
+    {
+        'phrase': 'other vendors',
+        'any': ['vendor', 'other'],
+        'exclude': [],
+        'reason': "'Other vendors' Match",
+    },
+    {
+        'phrase': 'both',
+        'any': ['both'],
+        'exclude': [],
+        'reason': "'Both' Match",
+    },
+]
+
+# Fallback-Matching: nur Excel-Wörter länger als 3 Zeichen ("own", "they" ignorieren)
+SELLS_MIN_KEYWORD_LENGTH = 3
+
+# Ein einziger Script-Aufruf liefert alle Radios inkl. Label und Status
+RADIO_SNAPSHOT_JS = """
+return Array.prototype.map.call(document.querySelectorAll('input[type="radio"]'), function (radio, index) {
+    var label = '';
+    if (radio.id) {
+        var labelElement = document.querySelector('label[for="' + CSS.escape(radio.id) + '"]');
+        if (labelElement) { label = labelElement.innerText || ''; }
+    }
+    if (!label && radio.parentElement) { label = radio.parentElement.innerText || ''; }
+    if (!label && radio.nextElementSibling) { label = radio.nextElementSibling.innerText || ''; }
+    var style = window.getComputedStyle(radio);
+    var displayed = radio.getClientRects().length > 0 &&
+        style.visibility !== 'hidden' && style.display !== 'none';
+    return {
+        element: radio,
+        index: index,
+        value: radio.value || '',
+        name: radio.name || '',
+        id: radio.id || '',
+        label: label.trim(),
+        displayed: displayed,
+        enabled: !radio.disabled,
+        selected: radio.checked
+    };
+});
+"""
+
+
+def _compile_keywords(keywords):
+    """Kompiliert eine Keyword-Liste zu einer Regex (Substring-Semantik wie 'keyword in text')"""
+    ordered = sorted(set(keywords), key=len, reverse=True)
+    return re.compile('|'.join(re.escape(keyword) for keyword in ordered))
+
+
+_QUESTION_PATTERNS = {question: _compile_keywords(keywords) for question, keywords in RADIO_QUESTIONS.items()}
+_ANSWER_PATTERNS = {answer: _compile_keywords(keywords) for answer, keywords in RADIO_ANSWERS.items()}
+_SELLS_PATTERNS = [
+    {
+        'phrase': rule['phrase'],
+        'any': _compile_keywords(rule['any']),
+        'exclude': _compile_keywords(rule['exclude']) if rule['exclude'] else None,
+        'reason': rule['reason'],
+    }
+    for rule in SELLS_RULES
+]
+
+
+def snapshot_radios(driver):
+    """Liest alle Radio-Buttons der Seite mit einem einzigen execute_script"""
+    radios = driver.execute_script(RADIO_SNAPSHOT_JS) or []
+    for radio in radios:
+        # Original-ID für CSS-Selektoren (case-sensitiv), 'id' ist der Vergleichsschlüssel
+        radio['raw_id'] = radio.get('id') or ''
+        radio['value'] = (radio.get('value') or '').lower()
+        radio['name'] = (radio.get('name') or '').lower()
+        radio['id'] = (radio.get('id') or '').lower()
+        radio['label'] = (radio.get('label') or 'Unbekannt').lower()
+    return radios
+
+
+def radio_text(radio):
+    """Kombinierter, kleingeschriebener Suchtext eines Radio-Buttons"""
+    return f"{radio.get('value', '')} {radio.get('name', '')} {radio.get('id', '')} {radio.get('label', '')}".lower()
+
+
+def _classify_online_store(text, online_store):
+    """Ja/Nein-Entscheidung für die Online-Store-Frage"""
+    is_question = bool(_QUESTION_PATTERNS['online_store'].search(text))
+    has_yes = bool(_ANSWER_PATTERNS['yes'].search(text))
+    has_no = bool(_ANSWER_PATTERNS['no'].search(text))
+
+    if online_store in YES_VALUES and has_yes and not has_no:
+        if is_question:
+            return f"JA-Option für Online Store (Excel: '{online_store}')"
+        return f"JA-Option (Online Store Excel: '{online_store}')"
+
+    if online_store in NO_VALUES and has_no and not has_yes:
+        if is_question:
+            return f"NEIN-Option für Online Store (Excel: '{online_store}')"
+        return f"NEIN-Option (Online Store Excel: '{online_store}')"
+
+    return None
+
+
+def _compile_sells(online_store_sells):
+    """Bereitet die Excel-Antwort für das 'sells'-Matching einmal vor"""
+    sells_lower = online_store_sells.lower()
+    rule = next((rule for rule in _SELLS_PATTERNS if rule['phrase'] in sells_lower), None)
+    keywords = [keyword for keyword in sells_lower.split() if len(keyword) > SELLS_MIN_KEYWORD_LENGTH]
+    return rule, _compile_keywords(keywords) if keywords else None
+
+
+def _classify_sells(text, online_store_sells, rule, keyword_pattern):
+    """Entscheidung für die 'my client sells…'-Frage"""
+    if rule and rule['any'].search(text) and not (rule['exclude'] and rule['exclude'].search(text)):
+        return f"{rule['reason']} (Excel: '{online_store_sells}')"
+
+    if keyword_pattern:
+        match = keyword_pattern.search(text)
+        if match:
+            return f"Keyword Match: '{match.group(0)}' (Excel: '{online_store_sells}')"
+
+    return None
+
+
+def radio_candidates(radios, online_store='', online_store_sells=''):
+    """
+    Alle passenden Radios pro Frage in DOM-Reihenfolge (ein Durchlauf über den Snapshot).
+
+    Gibt {'online_store': [(radio, grund), ...], 'sells': [(radio, grund), ...]} zurück -
+    lässt sich ein Kandidat nicht klicken, probiert der Aufrufer den nächsten.
+    """
+    online_store = (online_store or '').lower().strip()
+    online_store_sells = ' '.join((online_store_sells or '').split())
+    sells_rule, sells_keywords = _compile_sells(online_store_sells) if online_store_sells else (None, None)
+
+    candidates = {'online_store': [], 'sells': []}
+
+    for radio in radios:
+        text = radio_text(radio)
+
+        if online_store:
+            reason = _classify_online_store(text, online_store)
+            if reason:
+                candidates['online_store'].append((radio, reason))
+
+        if online_store_sells:
+            reason = _classify_sells(text, online_store_sells, sells_rule, sells_keywords)
+            if reason:
+                candidates['sells'].append((radio, reason))
+
+    return candidates
+
+
+def classify_radios(radios, online_store='', online_store_sells=''):
+    """
+    Erster passender Radio-Button pro Frage in DOM-Reihenfolge.
+
+    Gibt ein Dict {'online_store': (radio, grund), 'sells': (radio, grund)} zurück.
+    """
+    candidates = radio_candidates(radios, online_store, online_store_sells)
+    return {question: matches[0] if matches else (None, '') for question, matches in candidates.items()}
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+📝 RESULT WRITER - Ergebnis pro Eingabezeile als CSV und Excel
+Abonniert den Ereignisstrom (event_log) und hängt jede abgeschlossene Zeile
+sofort an:
+
+    ergebnisse_<lauf-id>.csv   nach jeder Zeile geschrieben und geflusht -
+                               bleibt auch nach einem Absturz lesbar
+    ergebnisse_<lauf-id>.xlsx  xlsxwriter im constant_memory-Modus, Zeile für
+                               Zeile gestreamt, beim Laufende abgeschlossen
+
+Zielordner: IZ_RESULT_DIR, sonst der Ordner der (ersten) Arbeitsmappe.
+"""
+import csv
+import os
+import time
+
+from event_log import log, INFO
+
+RESULT_COLUMNS = ['Arbeitsmappe', 'Zeile', 'Unternehmen', 'Status', 'Submission ID',
+                  'Fehlergrund', 'Dauer s', 'Zeitpunkt']
+
+
+def result_paths(run_id, folder):
+    base = os.path.join(folder, f"ergebnisse_{run_id}")
+    return base + '.csv', base + '.xlsx'
+
+
+class ResultWriter:
+    def __init__(self, run_id, folder=None):
+        folder = os.environ.get('IZ_RESULT_DIR') or folder or os.getcwd()
+        self.csv_path, self.xlsx_path = result_paths(run_id, folder)
+        self.rows = 0
+        self._company = ''
+        self._csv_file = open(self.csv_path, 'w', encoding='utf-8-sig', newline='')
+        self._csv = csv.writer(self._csv_file, delimiter=';')
+        self._csv.writerow(RESULT_COLUMNS)
+        self._csv_file.flush()
+        self._workbook = None
+        self._sheet = None
+        self._open_workbook()
+
+    def _open_workbook(self):
+        try:
+            import xlsxwriter
+        except ImportError:
+            print("⚠️ xlsxwriter nicht installiert - Ergebnisse nur als CSV")
+            self.xlsx_path = None
+            return
+        # constant_memory: jede Zeile wird beim Schreiben der nächsten auf die Platte ausgelagert
+        self._workbook = xlsxwriter.Workbook(self.xlsx_path, {'constant_memory': True})
+        self._sheet = self._workbook.add_worksheet('Ergebnisse')
+        header = self._workbook.add_format({'bold': True, 'bg_color': '#DDDDDD'})
+        self._failed_format = self._workbook.add_format({'font_color': '#C00000'})
+        self._sheet.write_row(0, 0, RESULT_COLUMNS, header)
+        for column, width in enumerate([28, 7, 32, 14, 13, 20, 9, 20]):
+            self._sheet.set_column(column, column, width)
+        self._sheet.freeze_panes(1, 0)
+
+    def start(self):
+        log.subscribe(self.handle, INFO)
+        print(f"📝 Ergebnisdatei: {self.csv_path}")
+        return self
+
+    def handle(self, record):
+        event = record['event']
+        if event == 'run.row_started':
+            self._company = str(record.get('company', ''))
+        elif event == 'run.row_finished':
+            self.write_row([
+                record.get('workbook') or '',
+                record.get('row'),
+                self._company,
+                'erfolgreich' if record.get('success') else 'fehlgeschlagen',
+                record.get('submission_id') or '',
+                record.get('reason') or '',
+                round(record.get('seconds', 0.0), 1),
+                time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(record['ts'])),
+            ], failed=not record.get('success'))
+
+    def write_row(self, values, failed=False):
+        self._csv.writerow(values)
+        self._csv_file.flush()
+        self.rows += 1
+        if self._sheet is not None:
+            self._sheet.write_row(self.rows, 0, values, self._failed_format if failed else None)
+
+    def close(self):
+        """Abonnement beenden, CSV schließen und die Excel-Datei abschließen"""
+        log.unsubscribe(self.handle)
+        if self._csv_file is not None:
+            self._csv_file.close()
+            self._csv_file = None
+        if self._workbook is not None:
+            try:
+                self._workbook.close()
+                print(f"📗 Ergebnisse ({self.rows} Zeilen): {self.xlsx_path}")
+            except Exception as e:
+                print(f"⚠️ Excel-Ergebnisdatei konnte nicht geschrieben werden: {e} - CSV: {self.csv_path}")
+            self._workbook = None
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+🔁 RETRY POLICY - Seitengenaue Wiederholung statt Neustart der ganzen Zeile
+Fehler einer Seite werden klassifiziert (veraltetes Element, Timeout,
+Validierungsmeldung, Navigationsfehler). Wiederholbare Fehler führen nur
+die betroffene Seite in derselben Browser-Session erneut aus - begrenzt
+auf wenige Versuche pro Seite.
+"""
+from lazy_imports import LazyModule
+
+selenium_exceptions = LazyModule('selenium.common.exceptions')
+
+# Fehlerklassen
+FAILURE_STALE = 'stale'
+FAILURE_TIMEOUT = 'timeout'
+FAILURE_VALIDATION = 'validation'
+FAILURE_NAVIGATION = 'navigation'
+FAILURE_UNKNOWN = 'unknown'
+
+RETRYABLE_FAILURES = {FAILURE_STALE, FAILURE_TIMEOUT, FAILURE_VALIDATION, FAILURE_NAVIGATION}
+
+# Versuche pro Seite inkl. Erstversuch
+MAX_PAGE_ATTEMPTS = 3
+
+# Sichtbare Validierungsmeldungen / als ungültig markierte Felder (ein Script-Aufruf)
+VALIDATION_MESSAGES_JS = """
+var selectors = '.error, .errors, .invalid-feedback, .field-error, .alert-danger, .text-danger, ' +
+                '[role="alert"], [aria-invalid="true"], input:invalid, select:invalid, textarea:invalid';
+var messages = [];
+var elements = document.querySelectorAll(selectors);
+for (var i = 0; i < elements.length && messages.length < 5; i++) {
+    var element = elements[i];
+    if (element.getClientRects().length === 0) { continue; }
+    var text = (element.innerText || element.validationMessage || element.name || element.id || '').trim();
+    messages.push(text.substring(0, 120) || element.tagName.toLowerCase());
+}
+return messages;
+"""
+
+# Chrome-Fehlerseiten bzw. Netzwerkfehler in WebDriver-Meldungen
+NAVIGATION_ERROR_MARKERS = ('net::err_', 'err_connection', 'err_name_not_resolved', 'chrome-error://')
+
+
+def validation_messages(driver):
+    """Sichtbare Validierungsmeldungen der aktuellen Seite (leer wenn keine)"""
+    try:
+        return driver.execute_script(VALIDATION_MESSAGES_JS) or []
+    except Exception:
+        return []
+
+
+def classify_failure(driver, error=None):
+    """Ordnet einen Seitenfehler einer Fehlerklasse zu; liefert (Klasse, Detail)"""
+    if isinstance(error, selenium_exceptions.StaleElementReferenceException):
+        return FAILURE_STALE, 'Element nicht mehr im DOM'
+    if isinstance(error, selenium_exceptions.TimeoutException):
+        return FAILURE_TIMEOUT, 'Wartezeit überschritten'
+    if isinstance(error, selenium_exceptions.WebDriverException) and any(marker in str(error).lower() for marker in NAVIGATION_ERROR_MARKERS):
+        return FAILURE_NAVIGATION, str(error).splitlines()[0]
+
+    try:
+        current_url = driver.current_url.lower()
+    except Exception:
+        current_url = ''
+    if current_url.startswith('chrome-error://'):
+        return FAILURE_NAVIGATION, 'Browser-Fehlerseite'
+
+    messages = validation_messages(driver)
+    if messages:
+        return FAILURE_VALIDATION, '; '.join(messages)
+
+    if error is not None:
+        return FAILURE_UNKNOWN, str(error).splitlines()[0] if str(error) else type(error).__name__
+    return FAILURE_UNKNOWN, 'Handler meldet Fehlschlag'
+
+
+class RetryPolicy:
+    def __init__(self, max_attempts=MAX_PAGE_ATTEMPTS):
+        self.max_attempts = max_attempts
+        self.attempts = {}      # Seite → bisherige Versuche
+        self.reexecuted = []    # (Seite, Fehlerklasse) je Wiederholung
+
+    def record_attempt(self, page):
+        self.attempts[page] = self.attempts.get(page, 0) + 1
+
+    def should_retry(self, driver, page, error=None):
+        """Klassifiziert den Fehler; True wenn die Seite erneut ausgeführt werden soll"""
+        failure, detail = classify_failure(driver, error)
+        attempts = self.attempts.get(page, 0)
+        if failure not in RETRYABLE_FAILURES:
+            print(f"   ❌ {page}: nicht wiederholbarer Fehler ({failure}: {detail})")
+            return False
+        if attempts >= self.max_attempts:
+            print(f"   ❌ {page}: {failure} - Versuche erschöpft ({attempts}/{self.max_attempts})")
+            return False
+
+        print(f"   🔁 {page}: {failure} ({detail}) - Wiederholung {attempts}/{self.max_attempts - 1}")
+        if failure == FAILURE_NAVIGATION:
+            try:
+                driver.refresh()
+            except Exception as e:
+                print(f"   ⚠️ Neuladen fehlgeschlagen: {e}")
+        self.reexecuted.append((page, failure))
+        return True
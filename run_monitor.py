@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+📺 RUN MONITOR - Live-Anzeige eines laufenden Batches
+Abonniert den Ereignisstrom (event_log) und zeigt Zeilen fertig/fehlgeschlagen,
+Zeilen pro Minute, ETA, aktuelle Seite pro Worker, einen rollierenden
+Latenzverlauf pro Seite und die Tiefe der DB-Schreibwarteschlange.
+
+Aktivierung:
+    --monitor oder IZ_MONITOR=tui        Terminal-Dashboard (stderr)
+    --monitor-gui oder IZ_MONITOR=gui    eigenes Tk-Fenster
+
+Ereignisse:
+    run.started (total, run_id)             run.finished
+    run.row_started (row, company[, workbook])
+    run.row_finished (row, success, seconds[, workbook])
+    run.page_started (page, attempt)        run.page_finished (page, seconds, handled)
+"""
+import os
+import sys
+import threading
+import time
+from collections import deque
+
+from event_log import log, INFO
+
+if '--monitor-gui' in sys.argv:
+    MONITOR_MODE = 'gui'
+elif '--monitor' in sys.argv:
+    MONITOR_MODE = 'tui'
+else:
+    MONITOR_MODE = os.environ.get('IZ_MONITOR', '').lower()
+
+# Aktualisierungsintervall der Anzeige in Sekunden
+REFRESH_SECONDS = float(os.environ.get('IZ_MONITOR_INTERVAL', '1.0'))
+
+# Letzte Seitenlatenzen pro Seite im Verlauf
+LATENCY_WINDOW = 30
+
+# Durchsatz "aktuell" = über die letzten N abgeschlossenen Zeilen
+RECENT_ROWS = 10
+
+SPARK_BLOCKS = '▁▂▃▄▅▆▇█'
+
+
+def format_duration(seconds):
+    if seconds is None:
+        return '--:--'
+    seconds = int(seconds)
+    hours, rest = divmod(seconds, 3600)
+    return f"{hours}:{rest // 60:02d}:{rest % 60:02d}" if hours else f"{rest // 60:02d}:{rest % 60:02d}"
+
+
+def sparkline(values, ceiling):
+    if not values or not ceiling:
+        return ''
+    top = len(SPARK_BLOCKS) - 1
+    return ''.join(SPARK_BLOCKS[min(top, int(value / ceiling * top))] for value in values)
+
+
+class RunMonitor:
+    """Zustand des Laufs - wird aus den Ereignissen fortgeschrieben (thread-sicher)"""
+
+    def __init__(self, total_rows=0, queue_depth=None):
+        self.total_rows = total_rows
+        self.queue_depth = queue_depth  # Callable → Anzahl wartender DB-Schreibvorgänge
+        self.run_id = None
+        self.started_at = time.monotonic()
+        self.finished_at = None
+        self.done = 0
+        self.failed = 0
+        self.finish_times = deque(maxlen=RECENT_ROWS + 1)
+        self.workers = {}    # Thread-Name → {'row', 'company', 'page', 'since'}
+        self.latencies = {}  # Seite → deque der letzten Dauern (s)
+        self._lock = threading.Lock()
+
+    def handle(self, record):
+        """Event-Sink für log.subscribe()"""
+        event = record['event']
+        if not event.startswith('run.'):
+            return
+        worker = threading.current_thread().name
+        now = time.monotonic()
+        with self._lock:
+            if event == 'run.started':
+                self.total_rows = record.get('total', self.total_rows)
+                self.run_id = record.get('run_id')
+                self.started_at = now
+            elif event == 'run.row_started':
+                row = f"{record['workbook']}:{record.get('row')}" if record.get('workbook') else record.get('row')
+                self.workers[worker] = {'row': row, 'company': record.get('company', ''), 'page': '-', 'since': now}
+            elif event == 'run.row_finished':
+                if record.get('success'):
+                    self.done += 1
+                else:
+                    self.failed += 1
+                self.finish_times.append(now)
+                state = self.workers.get(worker)
+                if state is not None:
+                    state.update(page='(fertig)', since=now)
+            elif event == 'run.page_started':
+                state = self.workers.setdefault(worker, {'row': None, 'company': '', 'page': '-', 'since': now})
+                state.update(page=record.get('page', '?'), since=now)
+            elif event == 'run.page_finished':
+                self.latencies.setdefault(record.get('page', '?'), deque(maxlen=LATENCY_WINDOW)).append(record.get('seconds', 0.0))
+            elif event == 'run.finished':
+                self.finished_at = now
+
+    def snapshot(self):
+        """Aktueller Stand inkl. Durchsatz und ETA"""
+        now = time.monotonic()
+        with self._lock:
+            finished = self.done + self.failed
+            elapsed = (self.finished_at or now) - self.started_at
+            rate = finished / elapsed * 60 if elapsed > 0 and finished else 0.0
+            times = list(self.finish_times)
+            recent_rate = (len(times) - 1) / (times[-1] - times[0]) * 60 if len(times) > 1 and times[-1] > times[0] else rate
+            remaining = max(self.total_rows - finished, 0)
+            eta = remaining / recent_rate * 60 if recent_rate else None
+            workers = {name: dict(state, for_seconds=now - state['since']) for name, state in self.workers.items()}
+            latencies = {page: list(values) for page, values in self.latencies.items()}
+        try:
+            queue_depth = self.queue_depth() if self.queue_depth else None
+        except Exception:
+            queue_depth = None
+        return {
+            'run_id': self.run_id, 'total': self.total_rows, 'done': self.done, 'failed': self.failed,
+            'elapsed': elapsed, 'rate': rate, 'recent_rate': recent_rate,
+            'eta': 0 if not remaining else eta, 'workers': workers, 'latencies': latencies,
+            'queue_depth': queue_depth, 'finished': self.finished_at is not None,
+        }
+
+
+def render_text(snapshot):
+    """Dashboard als Textzeilen (Terminal)"""
+    finished = snapshot['done'] + snapshot['failed']
+    lines = [
+        f"📺 LIVE-MONITOR {snapshot['run_id'] or ''}".rstrip(),
+        f"   Zeilen {finished}/{snapshot['total']}  ✅ {snapshot['done']}  ❌ {snapshot['failed']}  "
+        f"⏱️ {format_duration(snapshot['elapsed'])}  🚀 {snapshot['rate']:.1f}/min (aktuell {snapshot['recent_rate']:.1f})  "
+        f"ETA {format_duration(snapshot['eta'])}  💾 DB-Queue {snapshot['queue_depth'] if snapshot['queue_depth'] is not None else '-'}",
+    ]
+    for name, state in snapshot['workers'].items():
+        lines.append(f"   👷 {name}: Zeile {state['row']} {str(state['company'])[:30]} → {state['page']} ({state['for_seconds']:.0f}s)")
+    ceiling = max((max(values) for values in snapshot['latencies'].values() if values), default=0)
+    for page, values in sorted(snapshot['latencies'].items()):
+        lines.append(f"   {page:<24} {sparkline(values, ceiling):<{LATENCY_WINDOW}} letzte {values[-1]:.1f}s")
+    return lines
+
+
+class TerminalDashboard:
+    """Zeichnet das Dashboard periodisch auf stderr (im Quiet-Modus an derselben Stelle)"""
+
+    def __init__(self, monitor, interval=REFRESH_SECONDS, stream=None):
+        self.monitor = monitor
+        self.interval = interval
+        self.stream = stream or sys.stderr
+        # Überschreiben nur sinnvoll, wenn keine anderen Ausgaben dazwischen kommen
+        self.redraw = self.stream.isatty() and not log.is_enabled(INFO)
+        self._drawn_lines = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def draw(self):
+        lines = render_text(self.monitor.snapshot())
+        if self.redraw and self._drawn_lines:
+            self.stream.write(f"\x1b[{self._drawn_lines}F\x1b[J")
+        self.stream.write('\n'.join(lines) + '\n')
+        self.stream.flush()
+        self._drawn_lines = len(lines)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.draw()
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name='run-monitor', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.draw()
+
+
+class MonitorWindow:
+    """Tk-Fenster in eigenem Thread - die Automation im Hauptthread bleibt unberührt"""
+
+    COLORS = ('#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd', '#8c564b', '#e377c2', '#17becf')
+
+    def __init__(self, monitor, interval=REFRESH_SECONDS):
+        self.monitor = monitor
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name='run-monitor', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def _run(self):
+        import tkinter as tk
+        from tkinter import ttk
+
+        root = tk.Tk()
+        root.title("📺 Interzero Automation - Live-Monitor")
+        root.geometry("760x520")
+        frame = ttk.Frame(root, padding="10")
+        frame.pack(fill=tk.BOTH, expand=True)
+
+        summary_label = ttk.Label(frame, font=("Courier New", 11), justify="left")
+        summary_label.pack(anchor="w")
+        progress = ttk.Progressbar(frame, mode="determinate", length=700)
+        progress.pack(fill=tk.X, pady=(5, 10))
+
+        workers_tree = ttk.Treeview(frame, columns=("row", "company", "page", "since"), show="headings", height=4)
+        for column, title, width in (("row", "Zeile", 60), ("company", "Unternehmen", 260),
+                                     ("page", "Seite", 220), ("since", "seit", 80)):
+            workers_tree.heading(column, text=title)
+            workers_tree.column(column, width=width)
+        workers_tree.pack(fill=tk.X)
+
+        ttk.Label(frame, text="Seitenlatenz (letzte Durchläufe, s)").pack(anchor="w", pady=(10, 0))
+        chart = tk.Canvas(frame, height=220, background="white")
+        chart.pack(fill=tk.BOTH, expand=True)
+
+        def draw_chart(latencies):
+            chart.delete("all")
+            width, height = chart.winfo_width(), chart.winfo_height()
+            ceiling = max((max(values) for values in latencies.values() if values), default=0)
+            if not ceiling or width < 50:
+                return
+            left, bottom, top = 40, height - 20, 10
+            chart.create_text(5, top, text=f"{ceiling:.0f}s", anchor="nw", fill="gray")
+            chart.create_line(left, bottom, width - 10, bottom, fill="gray")
+            step = (width - left - 10) / max(LATENCY_WINDOW - 1, 1)
+            for index, (page, values) in enumerate(sorted(latencies.items())):
+                color = self.COLORS[index % len(self.COLORS)]
+                points = []
+                for position, value in enumerate(values):
+                    points += [left + position * step, bottom - value / ceiling * (bottom - top)]
+                if len(points) >= 4:
+                    chart.create_line(*points, fill=color, width=2)
+                chart.create_text(width - 10, top + index * 14, text=page, anchor="ne", fill=color)
+
+        def refresh():
+            if self._stop.is_set():
+                root.destroy()
+                return
+            snapshot = self.monitor.snapshot()
+            finished = snapshot['done'] + snapshot['failed']
+            queue_depth = snapshot['queue_depth'] if snapshot['queue_depth'] is not None else '-'
+            summary_label.config(text=(
+                f"Zeilen {finished}/{snapshot['total']}   ✅ {snapshot['done']}   ❌ {snapshot['failed']}\n"
+                f"🚀 {snapshot['rate']:.1f} Zeilen/min (aktuell {snapshot['recent_rate']:.1f})   "
+                f"⏱️ {format_duration(snapshot['elapsed'])}   ETA {format_duration(snapshot['eta'])}   💾 DB-Queue {queue_depth}"))
+            progress.config(value=finished / snapshot['total'] * 100 if snapshot['total'] else 0)
+            workers_tree.delete(*workers_tree.get_children())
+            for state in snapshot['workers'].values():
+                workers_tree.insert('', 'end', values=(state['row'], state['company'], state['page'],
+                                                       f"{state['for_seconds']:.0f}s"))
+            draw_chart(snapshot['latencies'])
+            root.after(int(self.interval * 1000), refresh)
+
+        # Schließen blendet nur die Anzeige aus - der Lauf geht weiter
+        root.protocol("WM_DELETE_WINDOW", lambda: (self._stop.set(), root.destroy()))
+        refresh()
+        root.mainloop()
+
+
+class _ActiveMonitor:
+    def __init__(self, monitor, view):
+        self.monitor = monitor
+        self.view = view
+
+    def stop(self):
+        log.unsubscribe(self.monitor.handle)
+        self.view.stop()
+
+
+def start_monitor(total_rows, queue_depth=None, mode=None):
+    """Startet den Live-Monitor gemäß MONITOR_MODE; None wenn deaktiviert"""
+    mode = mode if mode is not None else MONITOR_MODE
+    if mode not in ('tui', 'gui'):
+        return None
+    monitor = RunMonitor(total_rows, queue_depth)
+    log.subscribe(monitor.handle, INFO)
+    view = MonitorWindow(monitor) if mode == 'gui' else TerminalDashboard(monitor)
+    print(f"📺 Live-Monitor aktiv ({'Fenster' if mode == 'gui' else 'Terminal'})")
+    return _ActiveMonitor(monitor, view.start())
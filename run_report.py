@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+📊 RUN REPORT - Inkrementelle Lauf-Statistik und Berichte
+Der RunReporter abonniert den Ereignisstrom (event_log) und schreibt nach
+jeder abgeschlossenen Zeile das Ergebnis in `row_results` und die Aggregate
+(run_stats, run_page_stats, run_failure_stats) fort. Berichte lesen nur die
+Aggregate - auch über Monate an Historie sofort verfügbar.
+
+Aufruf: python run_report.py [--days N] [--html bericht.html] [--excel bericht.xlsx]
+"""
+import html
+import sys
+import time
+from datetime import datetime, timedelta
+
+from event_log import log, INFO
+from lazy_imports import LazyModule
+
+pd = LazyModule('pandas')
+
+
+class RunReporter:
+    """Event-Sink: sammelt Seitendauern der laufenden Zeile und speichert das Zeilenergebnis"""
+
+    def __init__(self, db, run_id):
+        self.db = db
+        self.run_id = run_id
+        self._row = None
+        self._pages = []
+
+    def start(self):
+        log.subscribe(self.handle, INFO)
+        return self
+
+    def stop(self):
+        log.unsubscribe(self.handle)
+
+    def handle(self, record):
+        event = record['event']
+        if event == 'run.started':
+            self.db.start_run_stats(self.run_id, record.get('total', 0))
+        elif event == 'run.row_started':
+            self._row = record
+            self._pages = []
+        elif event == 'run.page_finished':
+            self._pages.append((record.get('page', '?'), record.get('seconds', 0.0)))
+        elif event == 'run.row_finished':
+            started = self._row or {}
+            self.db.record_row_result(self.run_id, {
+                'submission_id': record.get('submission_id'),
+                'workbook': record.get('workbook'),
+                'row_number': record.get('row'),
+                'company_name': str(started.get('company', '')),
+                'success': record.get('success'),
+                'failure_reason': record.get('reason'),
+                'duration_s': record.get('seconds', 0.0),
+                'page_durations': self._pages,
+            })
+            self._row = None
+            self._pages = []
+
+
+def collect_report(db, days=None):
+    """Aggregate für den Bericht (optional nur die letzten N Tage)"""
+    since = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d') if days else None
+    runs = db.get_run_stats(since)
+    run_ids = [run[0] for run in runs] if since else None
+    return {
+        'since': since,
+        'runs': runs,
+        'pages': db.get_page_stats(run_ids),
+        'failures': db.get_failure_stats(run_ids),
+    }
+
+
+def _run_rows(report):
+    for run_id, started_at, updated_at, total, done, success, failed, seconds in report['runs']:
+        rate = success / done * 100 if done else 0.0
+        average = seconds / done if done else 0.0
+        yield [run_id, started_at, total, done, success, failed, round(rate, 1), round(average, 1)]
+
+
+def _page_rows(report):
+    for page, count, total_seconds, max_seconds in report['pages']:
+        yield [page, count, round(total_seconds / count, 2) if count else 0.0, round(max_seconds, 2), round(total_seconds, 1)]
+
+
+RUN_COLUMNS = ['Lauf', 'Start', 'Zeilen', 'Verarbeitet', 'Erfolgreich', 'Fehlgeschlagen', 'Erfolgsquote %', 'Ø s/Zeile']
+PAGE_COLUMNS = ['Seite', 'Anzahl', 'Ø s', 'max s', 'Summe s']
+FAILURE_COLUMNS = ['Fehlergrund', 'Anzahl']
+
+
+def print_report(report):
+    scope = f"seit {report['since']}" if report['since'] else "gesamte Historie"
+    print(f"\n📊 LAUF-STATISTIK ({scope})")
+    if not report['runs']:
+        print("   Keine Läufe vorhanden")
+        return
+    done = sum(run[4] for run in report['runs'])
+    success = sum(run[5] for run in report['runs'])
+    print(f"   {len(report['runs'])} Läufe, {done} Zeilen, Erfolgsquote {success / done * 100 if done else 0:.1f}%")
+    for row in list(_run_rows(report))[:10]:
+        print(f"   {row[0]:<24} {row[1]}  {row[4]:>5}/{row[3]:<5} ✅ {row[6]:5.1f}%  Ø {row[7]:.1f}s")
+    if report['pages']:
+        print(f"   {'Seite':<24}{'Anzahl':>8}{'Ø s':>8}{'max s':>8}")
+        for page, count, average, maximum, _ in _page_rows(report):
+            print(f"   {page:<24}{count:>8}{average:>8.1f}{maximum:>8.1f}")
+    for reason, count in report['failures']:
+        print(f"   ❌ {reason}: {count}")
+
+
+def _html_table(title, columns, rows):
+    header = ''.join(f"<th>{html.escape(column)}</th>" for column in columns)
+    body = ''.join('<tr>' + ''.join(f"<td>{html.escape(str(cell))}</td>" for cell in row) + '</tr>' for row in rows)
+    return f"<h2>{html.escape(title)}</h2><table><tr>{header}</tr>{body}</table>"
+
+
+def export_html(report, path):
+    scope = f"seit {report['since']}" if report['since'] else "gesamte Historie"
+    document = (
+        "<!DOCTYPE html><html><head><meta charset='utf-8'><title>Interzero Automation - Lauf-Statistik</title>"
+        "<style>body{font-family:Arial,sans-serif;margin:20px}table{border-collapse:collapse;margin-bottom:20px}"
+        "th,td{border:1px solid #ccc;padding:4px 8px;text-align:right}th{background:#eee}"
+        "td:first-child{text-align:left}</style></head><body>"
+        f"<h1>Lauf-Statistik ({html.escape(scope)})</h1><p>Erstellt: {time.strftime('%Y-%m-%d %H:%M')}</p>"
+        + _html_table("Läufe", RUN_COLUMNS, _run_rows(report))
+        + _html_table("Seitendauern", PAGE_COLUMNS, _page_rows(report))
+        + _html_table("Fehlergründe", FAILURE_COLUMNS, report['failures'])
+        + "</body></html>"
+    )
+    with open(path, 'w', encoding='utf-8') as handle:
+        handle.write(document)
+    print(f"📄 HTML-Bericht geschrieben: {path}")
+    return path
+
+
+def export_excel(report, path):
+    with pd.ExcelWriter(path) as writer:
+        pd.DataFrame(list(_run_rows(report)), columns=RUN_COLUMNS).to_excel(writer, sheet_name='Läufe', index=False)
+        pd.DataFrame(list(_page_rows(report)), columns=PAGE_COLUMNS).to_excel(writer, sheet_name='Seitendauern', index=False)
+        pd.DataFrame(report['failures'], columns=FAILURE_COLUMNS).to_excel(writer, sheet_name='Fehlergründe', index=False)
+    print(f"📗 Excel-Bericht geschrieben: {path}")
+    return path
+
+
+def _option(name):
+    if name in sys.argv:
+        position = sys.argv.index(name)
+        return sys.argv[position + 1] if position + 1 < len(sys.argv) else None
+    return None
+
+
+if __name__ == "__main__":
+    from database import InterzeroDatabase
+
+    days = _option('--days')
+    report = collect_report(InterzeroDatabase(), int(days) if days else None)
+    print_report(report)
+    if _option('--html'):
+        export_html(report, _option('--html'))
+    if _option('--excel'):
+        export_excel(report, _option('--excel'))
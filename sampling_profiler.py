@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+🔥 SAMPLING PROFILER - Stack-Sampling des Hauptthreads (--profile)
+Ein Hintergrund-Thread liest in festem Intervall den Python-Stack des
+Hauptthreads (sys._current_frames) - ohne Instrumentierung im Code.
+Das Ergebnis wird als "collapsed stacks" geschrieben und kann direkt mit
+flamegraph.pl, speedscope oder inferno dargestellt werden:
+
+    flamegraph.pl profile_20250101-120000.folded > profile.svg
+"""
+import os
+import sys
+import threading
+import time
+from collections import Counter
+
+PROFILE = '--profile' in sys.argv
+
+# Abtastintervall in Sekunden (per Umgebungsvariable überschreibbar)
+SAMPLE_INTERVAL = float(os.environ.get('IZ_PROFILE_INTERVAL', '0.01'))
+
+# Tiefere Stacks werden abgeschnitten (schützt vor Rekursion)
+MAX_STACK_DEPTH = 128
+
+
+def _frame_label(frame):
+    code = frame.f_code
+    return f"{os.path.basename(code.co_filename)}:{code.co_name}"
+
+
+class SamplingProfiler:
+    def __init__(self, interval=SAMPLE_INTERVAL, thread_id=None):
+        self.interval = interval
+        self.thread_id = thread_id or threading.main_thread().ident
+        self.stacks = Counter()
+        self.samples = 0
+        self.started_at = None
+        self.duration = 0.0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _sample(self):
+        frame = sys._current_frames().get(self.thread_id)
+        labels = []
+        while frame is not None and len(labels) < MAX_STACK_DEPTH:
+            labels.append(_frame_label(frame))
+            frame = frame.f_back
+        if labels:
+            self.stacks[';'.join(reversed(labels))] += 1
+            self.samples += 1
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def start(self):
+        self.started_at = time.monotonic()
+        self._thread = threading.Thread(target=self._run, name='sampling-profiler', daemon=True)
+        self._thread.start()
+        print(f"🔥 Sampling-Profiler aktiv (Intervall {self.interval * 1000:.0f} ms)")
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.duration = time.monotonic() - self.started_at if self.started_at else 0.0
+
+    def write_collapsed(self, path=None):
+        """Schreibt 'frame;frame;frame anzahl' je Zeile (Flamegraph-Format)"""
+        path = path or time.strftime('profile_%Y%m%d-%H%M%S.folded')
+        with open(path, 'w', encoding='utf-8') as handle:
+            for stack, count in self.stacks.most_common():
+                handle.write(f"{stack} {count}\n")
+        print(f"🔥 Profil geschrieben: {path} ({self.samples} Samples in {self.duration:.1f}s)")
+        return path
+
+    def print_top(self, limit=10):
+        """Funktionen mit den meisten Samples an der Stack-Spitze (Self-Time)"""
+        own = Counter()
+        for stack, count in self.stacks.items():
+            own[stack.rsplit(';', 1)[-1]] += count
+        if not self.samples:
+            return
+        print(f"\n🔥 TOP {limit} Funktionen (Self-Samples)")
+        for label, count in own.most_common(limit):
+            print(f"   {count / self.samples * 100:5.1f}%  {label}")
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+🎯 SELECTOR STATS - Adaptive Reihenfolge für Selektor-Ketten
+Merkt sich pro Aufrufstelle und Seite welcher Selektor gewonnen hat
+(SQLite) und probiert den historischen Gewinner zuerst. Selektoren die
+wiederholt nichts finden, rutschen automatisch ans Ende.
+Die Zähler leben im Speicher; flush() schreibt die geänderten Einträge
+am Zeilenende in einer Transaktion.
+"""
+import hashlib
+from urllib.parse import urlparse
+
+# Nach so vielen Fehlschlägen in Folge gilt ein Selektor als tot
+DEMOTE_AFTER_MISSES = 3
+
+
+def page_fingerprint(driver):
+    """Günstiger Seiten-Fingerprint über den URL-Pfad (kein DOM-Zugriff)"""
+    try:
+        path = urlparse(driver.current_url).path or '/'
+    except Exception:
+        path = ''
+    return hashlib.sha1(path.encode('utf-8')).hexdigest()[:16]
+
+
+class SelectorRanker:
+    def __init__(self, db):
+        self.db = db
+        self._stats = {}  # (call_site, fingerprint) → {selector: {'hits', 'misses', 'streak'}}
+        self._dirty = set()  # (call_site, fingerprint, selector) seit dem letzten flush() geändert
+
+    def _load(self, call_site, fingerprint):
+        """Statistik einer Aufrufstelle einmal aus der Datenbank laden"""
+        key = (call_site, fingerprint)
+        if key not in self._stats:
+            self._stats[key] = self.db.get_selector_stats(call_site, fingerprint)
+        return self._stats[key]
+
+    def order(self, call_site, selectors, fingerprint=''):
+        """Selektoren sortiert: Gewinner → unbekannt → tot (sonst Original-Reihenfolge)"""
+        stats = self._load(call_site, fingerprint)
+
+        def rank(item):
+            position, selector = item
+            entry = stats.get(selector)
+            if not entry:
+                return (1, 0, position)
+            if entry['streak'] >= DEMOTE_AFTER_MISSES:
+                return (2, -entry['hits'], position)
+            if entry['hits'] > 0:
+                return (0, -entry['hits'], position)
+            return (1, 0, position)
+
+        return [selector for _, selector in sorted(enumerate(selectors), key=rank)]
+
+    def record(self, call_site, selector, hit, fingerprint=''):
+        """Ergebnis eines Selektor-Versuchs merken (ohne Datenbankzugriff)"""
+        stats = self._load(call_site, fingerprint)
+        entry = stats.setdefault(selector, {'hits': 0, 'misses': 0, 'streak': 0})
+        if hit:
+            entry['hits'] += 1
+            entry['streak'] = 0
+        else:
+            entry['misses'] += 1
+            entry['streak'] += 1
+        self._dirty.add((call_site, fingerprint, selector))
+
+    def flush(self):
+        """Geänderte Einträge in einer Transaktion speichern (bei Fehler beim nächsten Mal erneut)"""
+        if not self._dirty:
+            return
+        rows = []
+        for call_site, fingerprint, selector in self._dirty:
+            entry = self._stats[(call_site, fingerprint)][selector]
+            rows.append((call_site, fingerprint, selector, entry['hits'], entry['misses'], entry['streak']))
+        if self.db.save_selector_stats(rows):
+            self._dirty.clear()
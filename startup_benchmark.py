@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+🚦 STARTUP BENCHMARK - Importzeit von CLI- und GUI-Pfad messen
+Jeder Durchlauf startet einen frischen Interpreter in einem leeren
+Temp-Verzeichnis. Gemessen wird die Wall-Clock-Zeit des Imports; zusätzlich
+wird geprüft, dass der Import keine Nebenwirkungen hat (keine Ausgabe,
+keine angelegten Dateien, keine schweren Module geladen).
+
+Aufruf: python startup_benchmark.py [anzahl_durchläufe] [--importtime]
+"""
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Pfad → zu importierendes Modul
+STARTUP_PATHS = {
+    'CLI': 'interzero_automation',
+    'GUI': 'file_selector_gui',
+}
+
+HEAVY_MODULES = ('pandas', 'selenium', 'requests', 'tkinter')
+
+PROBE_SCRIPT = """
+import sys
+import {module}
+heavy = [name for name in {heavy!r} if name in sys.modules]
+sys.stderr.write('HEAVY:' + ','.join(heavy) + '\\n')
+"""
+
+
+def run_once(module, importtime=False):
+    """Ein Import in frischem Interpreter; liefert (Sekunden, stdout, stderr, angelegte Dateien)"""
+    with tempfile.TemporaryDirectory() as workdir:
+        env = dict(os.environ, PYTHONPATH=PACKAGE_DIR, PYTHONDONTWRITEBYTECODE='1')
+        command = [sys.executable]
+        if importtime:
+            command += ['-X', 'importtime']
+        command += ['-c', PROBE_SCRIPT.format(module=module, heavy=HEAVY_MODULES)]
+        start = time.perf_counter()
+        result = subprocess.run(command, cwd=workdir, env=env, capture_output=True, text=True)
+        elapsed = time.perf_counter() - start
+        return elapsed, result.stdout, result.stderr, os.listdir(workdir)
+
+
+def top_imports(stderr, limit=10):
+    """Die teuersten Importe (kumulativ, µs) aus -X importtime"""
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_us, cumulative_us, name = line.split(':', 1)[1].split('|')
+        entries.append((int(cumulative_us), name.strip()))
+    return sorted(entries, reverse=True)[:limit]
+
+
+def benchmark(runs=5, importtime=False):
+    results = {}
+    for label, module in STARTUP_PATHS.items():
+        times = []
+        stdout = stderr = ''
+        created = []
+        for _ in range(runs):
+            elapsed, stdout, stderr, created = run_once(module)
+            times.append(elapsed)
+
+        heavy = ''
+        for line in stderr.splitlines():
+            if line.startswith('HEAVY:'):
+                heavy = line[len('HEAVY:'):]
+        failed = 'Traceback' in stderr
+
+        print(f"\n🚦 {label}: import {module}")
+        if failed:
+            print(f"   ❌ Import fehlgeschlagen:\n{stderr}")
+            results[label] = None
+            continue
+        print(f"   ⏱️ Median {statistics.median(times) * 1000:.0f} ms | Min {min(times) * 1000:.0f} ms ({runs} Läufe)")
+        print(f"   {'✅' if not stdout.strip() else '⚠️'} Ausgabe beim Import: {stdout.strip()[:80] or 'keine'}")
+        print(f"   {'✅' if not created else '⚠️'} Angelegte Dateien: {', '.join(created) or 'keine'}")
+        print(f"   {'✅' if not heavy or label == 'GUI' and heavy == 'tkinter' else '⚠️'} Schwere Module geladen: {heavy or 'keine'}")
+
+        if importtime:
+            _, _, stderr, _ = run_once(module, importtime=True)
+            print("   Teuerste Importe (kumulativ):")
+            for cumulative_us, name in top_imports(stderr):
+                print(f"      {cumulative_us / 1000:8.1f} ms  {name}")
+
+        results[label] = statistics.median(times)
+    return results
+
+
+if __name__ == "__main__":
+    arguments = [argument for argument in sys.argv[1:] if not argument.startswith('--')]
+    benchmark(int(arguments[0]) if arguments else 5, importtime='--importtime' in sys.argv)
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+⏱️ TRACING - Span-basierte Zeitmessung aller Workflow-Schritte
+Spans (Zeile, Login, Seite, Feld-Ausfüllung, Wartezeit, DB-Schreibzugriff)
+werden mit monotonen Zeitstempeln, Parent-ID und Attributen gepuffert und
+gebündelt in die Tabelle `spans` geschrieben. Der Summarizer zeigt pro
+Schritt p50/p95/max - für einen Lauf oder über alle Läufe.
+
+Aufruf: python tracing.py [run_id | --all]
+"""
+import json
+import math
+import sys
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from functools import wraps
+
+# Gepufferte Spans werden ab dieser Anzahl in die Datenbank geschrieben
+FLUSH_BATCH_SIZE = 50
+
+
+class Span:
+    def __init__(self, span_id, parent_id, name, attributes):
+        self.span_id = span_id
+        self.parent_id = parent_id
+        self.name = name
+        self.attributes = dict(attributes)
+        self.start = time.monotonic()
+        self.duration = None
+
+    def set(self, **attributes):
+        """Attribute nachträglich ergänzen (z.B. Ergebnis)"""
+        self.attributes.update(attributes)
+
+
+class Tracer:
+    def __init__(self, db, run_id=None, batch_size=FLUSH_BATCH_SIZE):
+        self.db = db
+        self.run_id = run_id or time.strftime('%Y%m%d-%H%M%S-') + uuid.uuid4().hex[:6]
+        self.batch_size = batch_size
+        self.origin = time.monotonic()
+        self._next_id = 0
+        self._buffer = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _stack(self):
+        if not hasattr(self._local, 'stack'):
+            self._local.stack = []
+        return self._local.stack
+
+    @contextmanager
+    def span(self, name, **attributes):
+        stack = self._stack()
+        with self._lock:
+            self._next_id += 1
+            span_id = self._next_id
+        span = Span(span_id, stack[-1].span_id if stack else None, name, attributes)
+        stack.append(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.set(error=type(e).__name__)
+            raise
+        finally:
+            span.duration = time.monotonic() - span.start
+            stack.pop()
+            self._record(span)
+
+    def _record(self, span):
+        row = (
+            self.run_id, span.span_id, span.parent_id, span.name,
+            round((span.start - self.origin) * 1000, 3), round(span.duration * 1000, 3),
+            json.dumps(span.attributes, default=str),
+        )
+        with self._lock:
+            self._buffer.append(row)
+            flush = len(self._buffer) >= self.batch_size
+        if flush:
+            self.flush()
+
+    def pending(self):
+        """Anzahl gepufferter, noch nicht geschriebener Spans"""
+        with self._lock:
+            return len(self._buffer)
+
+    def flush(self):
+        """Gepufferte Spans gebündelt schreiben"""
+        with self._lock:
+            rows, self._buffer = self._buffer, []
+        if rows:
+            self.db.save_spans(rows)
+
+
+# Aktiver Tracer für span() - ohne aktiven Tracer sind Spans wirkungslos
+_active_tracer = None
+
+
+def activate(tracer):
+    global _active_tracer
+    _active_tracer = tracer
+    return tracer
+
+
+def get_tracer():
+    return _active_tracer
+
+
+@contextmanager
+def span(name, **attributes):
+    """Span im aktiven Tracer; ohne Tracer ein No-Op (liefert None)"""
+    if _active_tracer is None:
+        yield None
+        return
+    with _active_tracer.span(name, **attributes) as current:
+        yield current
+
+
+def traced(name):
+    """Decorator: jeder Aufruf der Funktion wird als Span aufgezeichnet"""
+    def decorator(function):
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-Rank-Perzentil einer sortierten Liste"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize_spans(db, run_id=None):
+    """Pro Schritt-Name: Anzahl, Summe, p50, p95, max (Millisekunden)"""
+    durations = {}
+    for name, duration_ms in db.get_span_durations(run_id):
+        durations.setdefault(name, []).append(duration_ms)
+
+    summary = {}
+    for name, values in durations.items():
+        values.sort()
+        summary[name] = {
+            'count': len(values),
+            'total': sum(values),
+            'p50': percentile(values, 0.50),
+            'p95': percentile(values, 0.95),
+            'max': values[-1],
+        }
+    return summary
+
+
+def print_span_summary(db, run_id=None):
+    summary = summarize_spans(db, run_id)
+    scope = f"Lauf {run_id}" if run_id else "alle Läufe"
+    print(f"\n⏱️ SPAN-ZUSAMMENFASSUNG ({scope})")
+    if not summary:
+        print("   Keine Spans vorhanden")
+        return summary
+    print(f"   {'Schritt':<28}{'Anzahl':>8}{'Summe s':>10}{'p50 ms':>10}{'p95 ms':>10}{'max ms':>10}")
+    for name, stats in sorted(summary.items(), key=lambda item: -item[1]['total']):
+        print(f"   {name:<28}{stats['count']:>8}{stats['total'] / 1000:>10.1f}"
+              f"{stats['p50']:>10.0f}{stats['p95']:>10.0f}{stats['max']:>10.0f}")
+    return summary
+
+
+if __name__ == "__main__":
+    from database import InterzeroDatabase
+
+    database = InterzeroDatabase()
+    argument = sys.argv[1] if len(sys.argv) > 1 else None
+    if argument == '--all':
+        print_span_summary(database)
+    else:
+        print_span_summary(database, argument or database.get_latest_run_id())
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+🔀 WORKFLOW ENGINE - Deklarative Zustandsmaschine für den Seitenablauf
+Jede Seite hat erwartete Folgeseiten. Nach einem Handler wird die
+vorhergesagte Folgeseite per günstigem URL-Check bestätigt; die volle
+Seitenerkennung läuft nur, wenn die Vorhersage nicht eintrifft.
+Kein Fortschritt (gleicher Seiten-Fingerprint erneut gesehen oder bereits
+erledigte Seite) beendet die Zeile sofort; jede Seite läuft in einem
+Teilbudget des Zeilenbudgets (siehe deadline.py). Fehlgeschlagene Seiten
+werden gemäß retry_policy.py einzeln wiederholt.
+"""
+import time
+
+import deadline as budget
+from tracing import span
+from driver_instrumentation import attribute_to
+from event_log import log
+from deadline import DeadlineExceeded, PAGE_BUDGET_SECONDS, REASON_NO_PROGRESS
+
+# Erwartete Übergänge pro Seite (Reihenfolge = Wahrscheinlichkeit)
+PAGE_TRANSITIONS = {
+    'LOGIN': ['DASHBOARD'],
+    'DASHBOARD': ['MEMBERSHIP_PAGE_1', 'MEMBERSHIP_FORM', 'PAGE_1_PACKAGING'],
+    'MEMBERSHIP_FORM': ['MEMBERSHIP_PAGE_1', 'MEMBERSHIP_PAGE_2'],
+    'MEMBERSHIP_PAGE_1': ['MEMBERSHIP_PAGE_2'],
+    'MEMBERSHIP_PAGE_2': ['MEMBERSHIP_PAGE_3'],
+    'MEMBERSHIP_PAGE_3': ['MEMBERSHIP_PAGE_4'],
+    'MEMBERSHIP_PAGE_4': [],
+    'PAGE_1_PACKAGING': ['PAGE_2_COMPANY', 'MEMBERSHIP_PAGE_1'],
+    'PAGE_2_COMPANY': ['PAGE_3_DETAILS'],
+    'PAGE_3_DETAILS': ['PAGE_4_UPLOAD'],
+    'PAGE_4_UPLOAD': [],
+}
+
+# Nach erfolgreichem Handler auf diesen Seiten ist der Durchlauf abgeschlossen
+TERMINAL_PAGES = {'MEMBERSHIP_PAGE_4', 'PAGE_4_UPLOAD', 'SUCCESS_PAGE'}
+
+# Seiten die allein über die URL erkannt werden können (siehe detect_page_from_url)
+URL_DETECTABLE_PAGES = {
+    'LOGIN', 'DASHBOARD', 'MEMBERSHIP_FORM',
+    'MEMBERSHIP_PAGE_1', 'MEMBERSHIP_PAGE_2', 'MEMBERSHIP_PAGE_3', 'MEMBERSHIP_PAGE_4',
+}
+
+# Wie lange nach einem Handler auf die vorhergesagte Folgeseite gewartet wird
+TRANSITION_TIMEOUT = 5.0
+# Implicit Wait für Lookups (vor jedem Lookup auf das verbleibende Seitenbudget gekappt)
+IMPLICIT_WAIT_SECONDS = 10
+# Kappung in Schritten - ein implicitly_wait-Befehl höchstens pro Schritt Budgetverbrauch
+IMPLICIT_WAIT_STEP = 0.5
+TRANSITION_POLL_INTERVAL = 0.1
+
+
+def detect_page_from_url(url, title=''):
+    """Seitenerkennung nur über URL/Titel - ohne DOM-Zugriff; None wenn unklar"""
+    url = (url or '').lower()
+    title = (title or '').lower()
+
+    if 'login' in url or 'login' in title:
+        return 'LOGIN'
+    # Dashboard MUSS VOR MEMBERSHIP kommen
+    if 'dashboard' in url or ('dashboard' in title and 'new' not in title):
+        return 'DASHBOARD'
+    if 'membership/form' in url:
+        for number in ('1', '2', '3', '4'):
+            if f'/{number}' in url:
+                return f'MEMBERSHIP_PAGE_{number}'
+        return 'MEMBERSHIP_FORM'
+    return None
+
+
+class BudgetedDriver:
+    """
+    Driver-Proxy für Seiten-Handler: vor jedem find_element/find_elements wird
+    der Implicit Wait auf das *aktuell* verbleibende Budget gekappt - ein
+    Lookup blockiert also nie länger, als die Seite noch Zeit hat.
+    """
+
+    def __init__(self, driver):
+        object.__setattr__(self, '_driver', driver)
+        object.__setattr__(self, '_implicit_wait', None)
+
+    def _cap_implicit_wait(self):
+        timeout = budget.wait_timeout(IMPLICIT_WAIT_SECONDS)
+        timeout = max(budget.MIN_WAIT_SECONDS, timeout // IMPLICIT_WAIT_STEP * IMPLICIT_WAIT_STEP)
+        if timeout != self._implicit_wait:
+            self._driver.implicitly_wait(timeout)
+            object.__setattr__(self, '_implicit_wait', timeout)
+
+    def find_element(self, *args, **kwargs):
+        self._cap_implicit_wait()
+        return self._driver.find_element(*args, **kwargs)
+
+    def find_elements(self, *args, **kwargs):
+        self._cap_implicit_wait()
+        return self._driver.find_elements(*args, **kwargs)
+
+    def implicitly_wait(self, seconds):
+        self._driver.implicitly_wait(seconds)
+        object.__setattr__(self, '_implicit_wait', seconds)
+
+    def restore_implicit_wait(self):
+        """Standardwert für Code außerhalb der Seiten-Handler wiederherstellen"""
+        if self._implicit_wait not in (None, IMPLICIT_WAIT_SECONDS):
+            self.implicitly_wait(IMPLICIT_WAIT_SECONDS)
+
+    def __getattr__(self, name):
+        return getattr(self._driver, name)
+
+    def __setattr__(self, name, value):
+        setattr(self._driver, name, value)
+
+    def __eq__(self, other):
+        return self._driver == getattr(other, '_driver', other)
+
+    def __hash__(self):
+        return hash(self._driver)
+
+
+class WorkflowEngine:
+    def __init__(self, handlers, detect_page, max_steps=10, fallback_handler=None, deadline=None,
+                 page_budget=PAGE_BUDGET_SECONDS, retry_policy=None, page_probe=None):
+        self.handlers = handlers
+        self.detect_page = detect_page
+        self.max_steps = max_steps
+        self.fallback_handler = fallback_handler
+        self.deadline = deadline
+        self.page_budget = page_budget
+        self.retry_policy = retry_policy
+        self.page_probe = page_probe  # driver → Attribute für den Seiten-Span (z.B. Browser-Metriken)
+        self.completed_pages = []
+        self.seen_fingerprints = set()
+        self.stop_reason = None
+        self.predictions = {'hit': 0, 'miss': 0}
+
+    def _await_transition(self, driver, page, url_before):
+        """Wartet auf eine der erwarteten Folgeseiten (URL-Polling); None bei Fehlvorhersage"""
+        expected = [candidate for candidate in PAGE_TRANSITIONS.get(page, []) if candidate in URL_DETECTABLE_PAGES]
+        if not expected:
+            return None  # Folgeseite nur per DOM erkennbar
+
+        deadline = time.monotonic() + budget.wait_timeout(TRANSITION_TIMEOUT)
+        with span('wait:transition', page=page):
+            while True:
+                current_url = driver.current_url
+                if current_url != url_before:
+                    predicted = detect_page_from_url(current_url)
+                    if predicted in expected:
+                        return predicted
+                    return None  # Andere Seite - volle Erkennung entscheidet
+                if time.monotonic() >= deadline:
+                    return None
+                time.sleep(TRANSITION_POLL_INTERVAL)
+
+    def _no_progress(self, detail):
+        """Beendet die Zeile sofort mit klassifiziertem Grund"""
+        self.stop_reason = detail
+        print(f"🔁 {detail}")
+        raise DeadlineExceeded(REASON_NO_PROGRESS, detail)
+
+    def _run_page(self, driver, page, handler):
+        """Führt den Handler einer Seite aus - bei wiederholbarem Fehler erneut in derselben Session"""
+        probe = self.page_probe(driver) if self.page_probe is not None else None
+        while True:
+            if self.retry_policy is not None:
+                self.retry_policy.record_attempt(page)
+            error = None
+            attempt = self.retry_policy.attempts.get(page, 1) if self.retry_policy is not None else 1
+            log.info('run.page_started', page=page, attempt=attempt)
+            started = time.monotonic()
+            page_deadline = self.deadline.child(self.page_budget) if self.deadline is not None else None
+            with budget.scope(page_deadline), span(f'page:{page}') as page_span, attribute_to(page):
+                if page_span is not None and probe is not None:
+                    page_span.set(browser=probe)
+                    probe = None  # Ladezeiten nur dem ersten Versuch zuordnen
+                try:
+                    handled = handler(driver)
+                except DeadlineExceeded:
+                    raise
+                except Exception as e:
+                    handled = False
+                    error = e
+                if page_span is not None:
+                    page_span.set(handled=bool(handled))
+            log.info('run.page_finished', page=page, seconds=round(time.monotonic() - started, 3), handled=bool(handled))
+            if handled:
+                # Auch bei überschrittenem Seitenbudget: erledigt ist erledigt (ein
+                # abgesendetes Formular darf nicht als Abbruch gemeldet werden)
+                return True
+            if page_deadline is not None:
+                page_deadline.check(page)
+            if self.retry_policy is None or not self.retry_policy.should_retry(driver, page, error):
+                if error is not None:
+                    raise error
+                return False
+
+    def run(self, driver):
+        """
+        Führt den Ablauf aus; True wenn eine Endseite erfolgreich abgeschlossen wurde.
+
+        Wirft DeadlineExceeded bei abgelaufenem Budget oder fehlendem Fortschritt.
+        """
+        driver = BudgetedDriver(driver)
+        try:
+            return self._run(driver)
+        finally:
+            driver.restore_implicit_wait()
+
+    def _run(self, driver):
+        page = self.detect_page(driver)
+
+        for step in range(1, self.max_steps + 1):
+            print(f"\n🔄 Schritt {step}: Aktuelle Seite = {page}")
+            if self.deadline is not None:
+                self.deadline.check(f"Schritt {step} ({page})")
+
+            if page == 'SUCCESS_PAGE':
+                print("🎉 Erfolgsseite erreicht - Workflow abgeschlossen!")
+                return True
+
+            fingerprint = (page, driver.current_url)
+            if page in self.completed_pages or fingerprint in self.seen_fingerprints:
+                # Seite nach Submit unverändert (z.B. Validierungsfehler) - nur diese Seite wiederholen
+                if not (page in self.handlers and self.retry_policy is not None
+                        and self.retry_policy.should_retry(driver, page)):
+                    if page in self.completed_pages:
+                        self._no_progress(f"Kein Fortschritt: {page} bereits abgeschlossen")
+                    self._no_progress(f"Kein Fortschritt auf {page} (Seiten-Fingerprint erneut gesehen)")
+                if page in self.completed_pages:
+                    self.completed_pages.remove(page)
+            self.seen_fingerprints.add(fingerprint)
+
+            handler = self.handlers.get(page, self.fallback_handler)
+            if handler is None:
+                self.stop_reason = f"Kein Handler für Seite {page}"
+                print(f"❓ {self.stop_reason}")
+                return False
+
+            url_before = driver.current_url
+            if not self._run_page(driver, page, handler):
+                self.stop_reason = f"Handler für {page} fehlgeschlagen"
+                print(f"⚠️ {self.stop_reason}")
+                return False
+
+            if page in self.handlers:
+                self.completed_pages.append(page)
+
+            if page in TERMINAL_PAGES:
+                print(f"🎉 Endseite {page} abgeschlossen!")
+                return True
+
+            next_page = self._await_transition(driver, page, url_before)
+            if next_page is not None:
+                self.predictions['hit'] += 1
+                print(f"⚡ Vorhersage bestätigt: {page} → {next_page}")
+            else:
+                self.predictions['miss'] += 1
+                next_page = self.detect_page(driver)
+
+            page = next_page
+
+        self.stop_reason = f"Schrittbudget ({self.max_steps}) erschöpft"
+        print(f"⚠️ {self.stop_reason}")
+        return False